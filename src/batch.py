@@ -0,0 +1,348 @@
+"""
+Пакетная обработка множества входных файлов в одном запуске с пулом процессов.
+"""
+from __future__ import annotations
+
+import json
+import os
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Optional
+
+import click
+from pydantic import BaseModel
+
+from logger import get_logger
+from main import CitationEnum, generate
+from readers.reader import TEXT_READERS
+from renderer import RENDERERS
+
+
+logger = get_logger(__name__)
+
+# расширения входных файлов
+INPUT_SUFFIXES = (".xlsx", *TEXT_READERS)
+
+
+class FileReport(BaseModel):
+    """
+    Результат обработки входного файла:
+
+    .. code-block::
+
+        FileReport(
+            path="/media/input/group_101.xlsx",
+            success=True,
+            sources=120,
+            seconds=0.85,
+            error=None,
+        )
+    """
+
+    path: str
+    success: bool
+    sources: int = 0
+    seconds: float
+    error: Optional[str] = None
+
+
+def collect_inputs(path_input_dir: Optional[str] = None, path_list: Optional[str] = None) -> list[str]:
+    """
+    Получение списка входных файлов.
+
+    :param path_input_dir: Директория с входными файлами (Excel, JSON Lines или CSV).
+    :param path_list: Текстовый файл со списком путей к входным файлам (по одному в строке,
+        относительные пути отсчитываются от директории списка, строки с `#` пропускаются).
+    :return: Пути к входным файлам.
+    """
+
+    paths: list[str] = []
+    if path_input_dir:
+        # временные файлы Excel (`~$input.xlsx`) пропускаются
+        paths.extend(
+            str(path)
+            for path in sorted(Path(path_input_dir).iterdir())
+            if path.suffix.lower() in INPUT_SUFFIXES and not path.name.startswith("~$")
+        )
+
+    if path_list:
+        base = Path(path_list).parent
+        with open(path_list, encoding="utf-8") as file:
+            for line in file:
+                line = line.strip()
+                if line and not line.startswith("#"):
+                    paths.append(str(base / line))
+
+    return paths
+
+
+def output_paths(paths: list[str], path_output_dir: str, output_format: str = "docx") -> list[dict[str, str]]:
+    """
+    Получение путей к выходным файлам для входных файлов.
+
+    Выходные файлы сохраняются под путем входного файла относительно общей директории входных файлов:
+    `<путь>/<имя>.docx` (ГОСТ) и `<путь>/<имя>_apa.docx` (APA) (расширение зависит от формата).
+    Если имена входных файлов различаются только расширением, к имени добавляется расширение входного файла
+    (`<имя>_csv.docx`).
+
+    :param paths: Пути к входным файлам.
+    :param path_output_dir: Директория для выходных файлов.
+    :param output_format: Формат выходных файлов.
+    :return: Пути к выходным файлам по наименованиям стилей цитирования в порядке входных файлов.
+    :raises ValueError: Если пути к выходным файлам разных входных файлов совпадают.
+    """
+
+    suffix = RENDERERS[output_format].suffix
+    sources = [Path(path).resolve() for path in paths]
+    base = Path(os.path.commonpath([source.parent for source in sources])) if sources else Path()
+    stems = [source.relative_to(base).with_suffix("") for source in sources]
+    counts = Counter(stems)
+
+    outputs = []
+    owners: dict[Path, str] = {}
+    for path, source, stem in zip(paths, sources, stems):
+        if counts[stem] > 1:
+            stem = stem.with_name(f"{stem.name}_{source.suffix.lstrip('.').lower()}")
+
+        targets = {
+            CitationEnum.GOST.name: Path(path_output_dir) / f"{stem}{suffix}",
+            CitationEnum.APA.name: Path(path_output_dir) / f"{stem}_apa{suffix}",
+        }
+        for target in targets.values():
+            if target in owners:
+                raise ValueError(f"Выходной файл {target} совпадает для входных файлов {owners[target]} и {path}.")
+            owners[target] = path
+
+        outputs.append({style: str(target) for style, target in targets.items()})
+
+    return outputs
+
+
+def process_file(
+    path_input: str,
+    paths: dict[str, str],
+    trusted: bool = False,
+    chunk_size: Optional[int] = None,
+    output_format: str = "docx",
+) -> FileReport:
+    """
+    Обработка одного входного файла (выполняется в отдельном процессе).
+
+    :param path_input: Путь к входному файлу.
+    :param paths: Пути к выходным файлам по наименованиям стилей цитирования (см. `output_paths`).
+    :param trusted: Чтение входного файла без валидации.
+    :param chunk_size: Размер порции для внешней сортировки.
+    :param output_format: Формат выходных файлов.
+    :return: Результат обработки.
+    """
+
+    start = time.perf_counter()
+    try:
+        for path in paths.values():
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+        # выходные файлы генерируются последовательно, так как файлы уже обрабатываются параллельно
+        sources = generate(
+            path_input, paths, trusted=trusted, chunk_size=chunk_size, render_workers=1, output_format=output_format
+        )
+    except Exception as ex:
+        return FileReport(
+            path=path_input, success=False, seconds=time.perf_counter() - start, error=f"{type(ex).__name__}: {ex}"
+        )
+
+    return FileReport(path=path_input, success=True, sources=sources, seconds=time.perf_counter() - start)
+
+
+def process_files(  # pylint: disable=too-many-arguments
+    paths: list[str],
+    path_output_dir: str,
+    concurrency: Optional[int] = None,
+    trusted: bool = False,
+    chunk_size: Optional[int] = None,
+    output_format: str = "docx",
+) -> list[FileReport]:
+    """
+    Параллельная обработка входных файлов в пуле процессов.
+
+    :param paths: Пути к входным файлам.
+    :param path_output_dir: Директория для выходных файлов.
+    :param concurrency: Максимальное количество одновременно обрабатываемых файлов (по умолчанию – по числу ядер).
+    :param trusted: Чтение входных файлов без валидации.
+    :param chunk_size: Размер порции для внешней сортировки.
+    :param output_format: Формат выходных файлов.
+    :return: Результаты обработки в порядке входных файлов.
+    :raises ValueError: Если пути к выходным файлам разных входных файлов совпадают (до начала обработки).
+    """
+
+    outputs = output_paths(paths, path_output_dir, output_format)
+    Path(path_output_dir).mkdir(parents=True, exist_ok=True)
+
+    reports: dict[int, FileReport] = {}
+    with ProcessPoolExecutor(max_workers=concurrency) as executor:
+        futures = {
+            executor.submit(process_file, path, targets, trusted, chunk_size, output_format): index
+            for index, (path, targets) in enumerate(zip(paths, outputs))
+        }
+        for future in as_completed(futures):
+            report = future.result()
+            reports[futures[future]] = report
+
+            if report.success:
+                logger.info(
+                    "Файл %s обработан за %.2f с (источников: %s).", report.path, report.seconds, report.sources
+                )
+            else:
+                logger.error("Файл %s не обработан: %s", report.path, report.error)
+
+    return [reports[index] for index in range(len(paths))]
+
+
+def summarize(reports: list[FileReport], seconds: float) -> dict[str, float]:
+    """
+    Получение сводки пакетной обработки.
+
+    :param reports: Результаты обработки файлов.
+    :param seconds: Общее время обработки в секундах.
+    :return: Количество файлов (всего, успешно, с ошибками), источников, время и пропускная способность.
+    """
+
+    succeeded = [report for report in reports if report.success]
+    sources = sum(report.sources for report in succeeded)
+
+    return {
+        "files": len(reports),
+        "succeeded": len(succeeded),
+        "failed": len(reports) - len(succeeded),
+        "sources": sources,
+        "seconds": seconds,
+        "files_per_second": len(reports) / seconds if seconds else 0.0,
+        "sources_per_second": sources / seconds if seconds else 0.0,
+    }
+
+
+@click.command()
+@click.option(
+    "--path_input_dir",
+    "-pd",
+    "path_input_dir",
+    type=click.Path(exists=True, file_okay=False),
+    default=None,
+    help="Директория с входными файлами (*.xlsx, *.jsonl или *.csv)",
+)
+@click.option(
+    "--path_list",
+    "-pl",
+    "path_list",
+    type=click.Path(exists=True, dir_okay=False),
+    default=None,
+    help="Файл со списком путей к входным файлам (по одному в строке)",
+)
+@click.option(
+    "--path_output_dir",
+    "-po",
+    "path_output_dir",
+    type=str,
+    required=True,
+    help="Директория для выходных файлов",
+)
+@click.option(
+    "--concurrency",
+    "-c",
+    "concurrency",
+    type=click.IntRange(min=1),
+    default=os.cpu_count(),
+    show_default=True,
+    help="Максимальное количество одновременно обрабатываемых файлов",
+)
+@click.option(
+    "--trusted",
+    "trusted",
+    is_flag=True,
+    default=False,
+    help="Чтение входных файлов без валидации (для ранее проверенных файлов)",
+)
+@click.option(
+    "--chunk_size",
+    "chunk_size",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Размер порции для внешней сортировки списков источников, не помещающихся в память",
+)
+@click.option(
+    "--format",
+    "-f",
+    "output_format",
+    type=click.Choice(list(RENDERERS), case_sensitive=False),
+    default="docx",
+    show_default=True,
+    help="Формат выходных файлов",
+)
+@click.option(
+    "--report",
+    "path_report",
+    type=str,
+    default=None,
+    help="Путь к JSON-файлу с результатами обработки каждого файла и сводкой",
+)
+def process_batch(  # pylint: disable=too-many-arguments
+    path_output_dir: str,
+    path_input_dir: Optional[str] = None,
+    path_list: Optional[str] = None,
+    concurrency: Optional[int] = None,
+    trusted: bool = False,
+    chunk_size: Optional[int] = None,
+    output_format: str = "docx",
+    path_report: Optional[str] = None,
+) -> None:
+    """
+    Пакетная генерация файлов Word с оформленными библиографическими списками.
+
+    :param str path_output_dir: Директория для выходных файлов
+    :param Optional[str] path_input_dir: Директория с входными файлами
+    :param Optional[str] path_list: Файл со списком путей к входным файлам
+    :param Optional[int] concurrency: Максимальное количество одновременно обрабатываемых файлов
+    :param bool trusted: Чтение входных файлов без валидации
+    :param Optional[int] chunk_size: Размер порции для внешней сортировки
+    :param str output_format: Формат выходных файлов
+    :param Optional[str] path_report: Путь к JSON-файлу с результатами обработки
+    """
+
+    paths = collect_inputs(path_input_dir, path_list)
+    if not paths:
+        raise click.UsageError("Не заданы входные файлы: укажите --path_input_dir или --path_list.")
+
+    logger.info("Пакетная обработка %s файлов (одновременно – до %s) ...", len(paths), concurrency)
+
+    start = time.perf_counter()
+    try:
+        reports = process_files(paths, path_output_dir, concurrency, trusted, chunk_size, output_format.lower())
+    except ValueError as ex:
+        raise click.UsageError(str(ex)) from ex
+    summary = summarize(reports, time.perf_counter() - start)
+
+    logger.info(
+        "Обработано файлов: %s (успешно – %s, с ошибками – %s), источников: %s за %.2f с "
+        "(%.2f файлов/с, %.1f источников/с).",
+        summary["files"],
+        summary["succeeded"],
+        summary["failed"],
+        summary["sources"],
+        summary["seconds"],
+        summary["files_per_second"],
+        summary["sources_per_second"],
+    )
+
+    if path_report:
+        with open(path_report, "w", encoding="utf-8") as file:
+            json.dump(
+                {"files": [report.dict() for report in reports], "summary": summary}, file, ensure_ascii=False, indent=2
+            )
+
+    if summary["failed"]:
+        raise click.ClickException(f"Количество файлов, обработанных с ошибками: {summary['failed']}.")
+
+
+if __name__ == "__main__":
+    process_batch()  # pylint: disable=no-value-for-parameter
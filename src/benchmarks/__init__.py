@@ -0,0 +1,3 @@
+"""
+Замеры производительности этапов генерации библиографического списка.
+"""
@@ -0,0 +1,62 @@
+"""
+Сравнение скорости форматирования источников по одному объекту и пакетами по столбцам полей.
+
+Запуск:
+
+.. code-block:: console
+
+    python -m benchmarks.batch --size 100000
+"""
+import logging
+import time
+from typing import Optional
+
+import click
+
+from benchmarks.generator import generate_models, parse_mix
+from formatters.models import model_name
+from formatters.styles.apa import APACitationFormatter
+from formatters.styles.gost import GOSTCitationFormatter
+from readers.store import RecordStore
+
+
+@click.command()
+@click.option("--size", "-s", "size", type=int, default=100000, show_default=True, help="Количество источников")
+@click.option(
+    "--mix", "mix", type=str, default=None, help="Доли типов источников (например: book=0.5,dissertation=0.5)"
+)
+def run(size: int, mix: Optional[str] = None) -> None:
+    """
+    Вывод времени форматирования по одному объекту и пакетами для каждого стиля цитирования.
+
+    :param int size: Количество источников
+    :param Optional[str] mix: Доли типов источников
+    """
+
+    logging.disable()
+
+    models = list(generate_models(size, parse_mix(mix)))
+    start = time.perf_counter()
+    store = RecordStore(models)
+    click.echo(f"Колоночное хранилище: {time.perf_counter() - start:.3f} с")
+
+    click.echo(f"{'Стиль':<24}{'По одному, с':>14}{'Пакетами, с':>14}{'Ускорение':>12}")
+    for formatter in (GOSTCitationFormatter, APACitationFormatter):
+        formatters_map = formatter.formatters_map
+
+        start = time.perf_counter()
+        rows = [formatters_map[model_name(model)](model).formatted for model in models]
+        single = time.perf_counter() - start
+
+        start = time.perf_counter()
+        batches = formatter.format_batches(store.iter_tables())
+        batch = time.perf_counter() - start
+
+        if sorted(rows) != sorted(row for batch_rows in batches.values() for row in batch_rows):
+            raise click.ClickException(f"Результаты пакетного форматирования {formatter.__name__} не совпадают.")
+
+        click.echo(f"{formatter.__name__:<24}{single:>14.3f}{batch:>14.3f}{single / batch:>11.1f}x")
+
+
+if __name__ == "__main__":
+    run()  # pylint: disable=no-value-for-parameter
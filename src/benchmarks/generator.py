@@ -0,0 +1,123 @@
+"""
+Генерация синтетических списков источников заданного размера и состава для замеров.
+
+Источники создаются на основе моделей из :data:`benchmarks.templates.MODELS` (совпадают с фикстурами тестов)
+с различающимися авторами и названиями, чтобы сортировка выполнялась на реалистичных данных.
+"""
+from __future__ import annotations
+
+import random
+from pathlib import Path
+from typing import Iterator, Optional
+
+import openpyxl
+from pydantic import BaseModel
+
+from benchmarks.templates import MODELS
+from readers.reader import SourcesReader
+from readers.records import RECORD_TYPES
+
+
+# модели-образцы по типам источников
+SAMPLES: dict[str, BaseModel] = {
+    kind: next(model for model in MODELS if isinstance(model, model_type)) for kind, model_type in RECORD_TYPES.items()
+}
+# состав списка источников по умолчанию (доли типов источников)
+DEFAULT_MIX: dict[str, float] = {
+    "book": 4,
+    "internet_resource": 3,
+    "articles_collection": 2,
+    "newspaper_article": 1,
+    "dissertation": 1,
+}
+
+SURNAMES = tuple(
+    "Иванов Петров Сидоров Андреева Баранов Волков Голубева Дмитриев Ёлкин Жуков Зайцева Кузнецов Лебедев "
+    "Морозова Новиков Орлов Павлова Романов Соколов Тихонова Smith Johnson Brown Miller Wilson".split()
+)
+INITIALS = "АБВГДЕЖИКЛМНОПРСТ"
+WORDS = tuple(
+    "наука искусство история теория практика анализ методы экономика право язык культура общество "
+    "развитие система модели data learning research".split()
+)
+
+
+def parse_mix(value: Optional[str]) -> dict[str, float]:
+    """
+    Разбор состава списка источников из строки вида `book=4,internet_resource=1`.
+
+    :param value: Строка с долями типов источников (по умолчанию – :data:`DEFAULT_MIX`).
+    :return: Доли типов источников.
+    :raises ValueError: Если тип источника не поддерживается.
+    """
+
+    if not value:
+        return dict(DEFAULT_MIX)
+
+    mix = {}
+    for part in value.split(","):
+        kind, _, weight = part.partition("=")
+        kind = kind.strip()
+        if kind not in SAMPLES:
+            raise ValueError(f"Неизвестный тип источника: {kind!r}.")
+        mix[kind] = float(weight or 1)
+
+    return mix
+
+
+def generate_models(size: int, mix: Optional[dict[str, float]] = None, seed: int = 0) -> Iterator[BaseModel]:
+    """
+    Генерация моделей источников.
+
+    :param size: Количество источников.
+    :param mix: Доли типов источников (по умолчанию – :data:`DEFAULT_MIX`).
+    :param seed: Начальное значение генератора случайных чисел (для воспроизводимости замеров).
+    :return: Генератор моделей источников.
+    """
+
+    generator = random.Random(seed)
+    mix = mix or DEFAULT_MIX
+    kinds = generator.choices(list(mix), weights=list(mix.values()), k=size)
+
+    for index, kind in enumerate(kinds):
+        sample = SAMPLES[kind]
+        update = {}
+        if "authors" in sample.__fields__:
+            update["authors"] = ", ".join(
+                f"{generator.choice(SURNAMES)} {generator.choice(INITIALS)}.{generator.choice(INITIALS)}."
+                for _ in range(generator.randint(1, 3))
+            )
+        for field in ("title", "article", "article_title"):
+            if field in sample.__fields__:
+                words = " ".join(generator.choices(WORDS, k=generator.randint(2, 5)))
+                update[field] = f"{words.capitalize()}. Выпуск {index}"
+
+        yield sample.copy(update=update)
+
+
+def write_workbook(path: Path | str, models: Iterator[BaseModel]) -> None:
+    """
+    Сохранение моделей источников во входной файл Excel (в формате шаблона входного файла).
+
+    :param path: Путь к входному файлу.
+    :param models: Модели источников.
+    """
+
+    workbook = openpyxl.Workbook(write_only=True)
+    sheets = {}
+    for reader_class in SourcesReader.readers:
+        reader = reader_class(None)  # type: ignore
+        sheet = workbook.create_sheet(reader.sheet)
+        columns = reader.columns
+        # первая строка листа содержит заголовок
+        sheet.append([column.attr for column in columns])
+        sheets[reader.model] = (sheet, columns, max(column.position for column in columns) + 1)
+
+    for model in models:
+        sheet, columns, width = sheets[type(model)]
+        row = [None] * width
+        for column in columns:
+            row[column.position] = getattr(model, column.attr)
+        sheet.append(row)
+
+    workbook.save(path)
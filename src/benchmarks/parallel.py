@@ -0,0 +1,61 @@
+"""
+Сравнение скорости форматирования и сортировки списка источников в текущем процессе и порциями в пуле процессов.
+
+Запуск:
+
+.. code-block:: console
+
+    python -m benchmarks.parallel --size 200000 --workers 4
+"""
+import logging
+import os
+import time
+from typing import Optional
+
+import click
+
+from benchmarks.generator import generate_models, parse_mix
+from formatters.parallel import format_parallel
+from formatters.styles.apa import APACitationFormatter
+from formatters.styles.gost import GOSTCitationFormatter
+
+
+@click.command()
+@click.option("--size", "-s", "size", type=int, default=200000, show_default=True, help="Количество источников")
+@click.option(
+    "--mix", "mix", type=str, default=None, help="Доли типов источников (например: book=0.5,dissertation=0.5)"
+)
+@click.option(
+    "--workers", "-w", "workers", type=int, default=os.cpu_count(), show_default=True, help="Количество процессов"
+)
+def run(size: int, mix: Optional[str] = None, workers: Optional[int] = None) -> None:
+    """
+    Вывод времени форматирования в текущем процессе и в пуле процессов для каждого стиля цитирования.
+
+    :param int size: Количество источников
+    :param Optional[str] mix: Доли типов источников
+    :param Optional[int] workers: Количество процессов
+    """
+
+    logging.disable()
+
+    models = list(generate_models(size, parse_mix(mix)))
+
+    click.echo(f"{'Стиль':<24}{'Один процесс, с':>17}{'Пул процессов, с':>18}{'Ускорение':>12}")
+    for formatter in (GOSTCitationFormatter, APACitationFormatter):
+        start = time.perf_counter()
+        rows = [str(item) for item in formatter(models).format()]
+        single = time.perf_counter() - start
+
+        start = time.perf_counter()
+        parallel_rows = format_parallel(formatter, models, workers)
+        parallel = time.perf_counter() - start
+
+        if rows != parallel_rows:
+            raise click.ClickException(f"Результаты параллельного форматирования {formatter.__name__} не совпадают.")
+
+        click.echo(f"{formatter.__name__:<24}{single:>17.3f}{parallel:>18.3f}{single / parallel:>11.1f}x")
+
+
+if __name__ == "__main__":
+    run()  # pylint: disable=no-value-for-parameter
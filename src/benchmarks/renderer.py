@@ -0,0 +1,46 @@
+"""
+Сравнение скорости генерации Word-файла через python-docx и потоковой записи XML.
+
+Запуск:
+
+.. code-block:: console
+
+    python -m benchmarks.renderer --size 20000
+"""
+import tempfile
+import time
+from pathlib import Path
+
+import click
+
+from renderer import FastRenderer, Renderer
+
+
+@click.command()
+@click.option("--size", "-s", "size", type=int, default=20000, show_default=True, help="Количество источников")
+def run(size: int) -> None:
+    """
+    Вывод времени генерации Word-файла для каждого способа.
+
+    :param int size: Количество источников
+    """
+
+    rows = tuple(
+        f"Иванов И.М. Наука как искусство. Том {index}. – СПб.: Просвещение, 2020. – 999 с." for index in range(size)
+    )
+
+    with tempfile.TemporaryDirectory() as directory:
+        results = {}
+        for renderer in (Renderer, FastRenderer):
+            path = Path(directory) / f"{renderer.__name__}.docx"
+            start = time.perf_counter()
+            renderer(rows).render(path)
+            results[renderer.__name__] = time.perf_counter() - start
+
+            click.echo(f"{renderer.__name__:<16}{results[renderer.__name__]:>10.3f} с{path.stat().st_size:>14} байт")
+
+    click.echo(f"Ускорение: {results[Renderer.__name__] / results[FastRenderer.__name__]:.1f}x")
+
+
+if __name__ == "__main__":
+    run()  # pylint: disable=no-value-for-parameter
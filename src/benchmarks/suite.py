@@ -0,0 +1,231 @@
+"""
+Замеры производительности чтения, форматирования, сортировки и генерации выходных файлов
+на синтетических списках источников разного размера.
+
+Результаты сохраняются в JSON-файл для сравнения запусков между собой.
+
+Запуск:
+
+.. code-block:: console
+
+    python -m benchmarks.suite --sizes 1000,10000,100000,1000000
+    python -m benchmarks.suite --sizes 10000 --baseline ../media/benchmarks/20240101-120000.json
+"""
+from __future__ import annotations
+
+import json
+import logging
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+import click
+
+from benchmarks.generator import generate_models, parse_mix, write_workbook
+from pipeline import CitationPipeline, render_file
+from profiling import StageReport, profiler
+from readers.reader import SourcesReader
+from renderer import RENDERERS
+from settings import BENCHMARK_RESULTS_PATH
+
+
+# размеры списков источников по умолчанию
+DEFAULT_SIZES = "1000,10000,100000,1000000"
+# этапы, замеры которых суммируются по листам входного файла
+SHEET_STAGES = ("read", "validate")
+
+
+def summarize(stages: list[StageReport]) -> dict[str, dict]:
+    """
+    Получение замеров по этапам с суммированием этапов чтения и валидации листов.
+
+    :param stages: Замеры этапов обработки.
+    :return: Время, время CPU, пик памяти, количество строк и строк в секунду по наименованиям этапов.
+    """
+
+    results: dict[str, dict] = {}
+    for report in stages:
+        prefix = report.name.partition(":")[0]
+        name = prefix if prefix in SHEET_STAGES else report.name
+        result = results.setdefault(name, {"wall": 0.0, "cpu": 0.0, "peak_memory": None, "rows": 0})
+        result["wall"] += report.wall
+        result["cpu"] += report.cpu
+        result["rows"] += report.rows or 0
+        if report.peak_memory is not None:
+            result["peak_memory"] = max(result["peak_memory"] or 0, report.peak_memory)
+
+    for result in results.values():
+        result["rows_per_second"] = result["rows"] / result["wall"] if result["wall"] else None
+
+    return results
+
+
+def measure(size: int, mix: dict[str, float], styles: tuple[str, ...], output_format: str, memory: bool) -> dict:
+    """
+    Замеры этапов обработки для списка источников заданного размера.
+
+    :param size: Количество источников.
+    :param mix: Доли типов источников.
+    :param styles: Наименования стилей цитирования.
+    :param output_format: Формат выходных файлов.
+    :param memory: Замеры пикового расхода памяти.
+    :return: Замеры по этапам.
+    """
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "input.xlsx"
+        start = time.perf_counter()
+        write_workbook(path, generate_models(size, mix))
+        click.echo(f"Входной файл на {size} источников создан за {time.perf_counter() - start:.1f} с.", err=True)
+
+        profiler.start(memory=memory)
+        try:
+            with SourcesReader(str(path)) as reader:
+                models = reader.read()
+            pipeline = CitationPipeline(models, styles)
+            del models
+            renderer = RENDERERS[output_format]
+            for style in styles:
+                render_file(renderer, pipeline.rows(style), Path(directory) / f"{style.lower()}{renderer.suffix}")
+        finally:
+            profiler.stop()
+
+    return summarize(profiler.stages)
+
+
+def compare(results: dict, baseline: dict) -> None:
+    """
+    Вывод сравнения замеров с результатами предыдущего запуска.
+
+    :param results: Замеры текущего запуска по размерам списков источников.
+    :param baseline: Замеры предыдущего запуска по размерам списков источников.
+    """
+
+    click.echo(f"{'Размер':>10}  {'Этап':<24}{'Было, с':>12}{'Стало, с':>12}{'Изменение':>12}")
+    for size, stages in results.items():
+        for name, result in stages.items():
+            previous = baseline.get(size, {}).get(name)
+            if not previous or not previous["wall"]:
+                continue
+            ratio = result["wall"] / previous["wall"]
+            click.echo(f"{size:>10}  {name:<24}{previous['wall']:>12.3f}{result['wall']:>12.3f}{ratio:>11.2f}x")
+
+
+@click.command()
+@click.option(
+    "--sizes",
+    "-s",
+    "sizes",
+    type=str,
+    default=DEFAULT_SIZES,
+    show_default=True,
+    help="Размеры списков источников через запятую",
+)
+@click.option(
+    "--mix",
+    "-m",
+    "mix",
+    type=str,
+    default=None,
+    help="Доли типов источников, например: book=4,internet_resource=3,dissertation=1",
+)
+@click.option(
+    "--styles",
+    "styles",
+    type=str,
+    default="GOST,APA",
+    show_default=True,
+    help="Стили цитирования через запятую",
+)
+@click.option(
+    "--format",
+    "-f",
+    "output_format",
+    type=click.Choice(list(RENDERERS), case_sensitive=False),
+    default="docx",
+    show_default=True,
+    help="Формат выходных файлов",
+)
+@click.option("--memory", "memory", is_flag=True, default=False, help="Замеры пикового расхода памяти (медленнее)")
+@click.option(
+    "--output",
+    "-o",
+    "path_output",
+    type=str,
+    default=None,
+    help=f"Путь к JSON-файлу результатов (по умолчанию – файл с датой запуска в {BENCHMARK_RESULTS_PATH})",
+)
+@click.option(
+    "--baseline",
+    "-b",
+    "path_baseline",
+    type=click.Path(exists=True, dir_okay=False),
+    default=None,
+    help="Путь к JSON-файлу результатов предыдущего запуска для сравнения",
+)
+def run(  # pylint: disable=too-many-arguments,too-many-locals
+    sizes: str = DEFAULT_SIZES,
+    mix: Optional[str] = None,
+    styles: str = "GOST,APA",
+    output_format: str = "docx",
+    memory: bool = False,
+    path_output: Optional[str] = None,
+    path_baseline: Optional[str] = None,
+) -> None:
+    """
+    Замеры этапов обработки и сохранение результатов.
+
+    :param str sizes: Размеры списков источников через запятую
+    :param Optional[str] mix: Доли типов источников
+    :param str styles: Стили цитирования через запятую
+    :param str output_format: Формат выходных файлов
+    :param bool memory: Замеры пикового расхода памяти
+    :param Optional[str] path_output: Путь к JSON-файлу результатов
+    :param Optional[str] path_baseline: Путь к JSON-файлу результатов предыдущего запуска
+    """
+
+    # логирование исказило бы результаты замеров
+    logging.disable()
+
+    mix_weights = parse_mix(mix)
+    style_names = tuple(style.strip().upper() for style in styles.split(","))
+
+    results = {}
+    for size in (int(value) for value in sizes.split(",")):
+        results[str(size)] = measure(size, mix_weights, style_names, output_format.lower(), memory)
+
+        click.echo(f"{'Размер':>10}  {'Этап':<24}{'Время, с':>12}{'CPU, с':>12}{'Строк/с':>14}")
+        for name, result in results[str(size)].items():
+            rows_per_second = f"{result['rows_per_second']:>14.0f}" if result["rows_per_second"] else f"{'–':>14}"
+            click.echo(f"{size:>10}  {name:<24}{result['wall']:>12.3f}{result['cpu']:>12.3f}{rows_per_second}")
+
+    path = Path(path_output or Path(BENCHMARK_RESULTS_PATH) / f"{datetime.now():%Y%m%d-%H%M%S}.json")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(
+            {
+                "created": datetime.now().isoformat(timespec="seconds"),
+                "python": sys.version.split()[0],
+                "platform": platform.platform(),
+                "mix": mix_weights,
+                "styles": style_names,
+                "format": output_format.lower(),
+                "results": results,
+            },
+            file,
+            ensure_ascii=False,
+            indent=2,
+        )
+    click.echo(f"Результаты сохранены: {path}")
+
+    if path_baseline:
+        with open(path_baseline, encoding="utf-8") as file:
+            compare(results, json.load(file)["results"])
+
+
+if __name__ == "__main__":
+    run()  # pylint: disable=no-value-for-parameter
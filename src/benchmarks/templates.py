@@ -0,0 +1,126 @@
+"""
+Замер стоимости форматирования одного источника до и после предварительного разбора шаблонов.
+
+Запуск:
+
+.. code-block:: console
+
+    python -m benchmarks.templates --number 20000
+"""
+import logging
+import timeit
+from string import Template
+from typing import Type
+
+import click
+from pydantic import BaseModel
+
+from formatters.models import (
+    BookModel,
+    InternetResourceModel,
+    ArticlesCollectionModel,
+    ArticlesNewspaperModel,
+    DissertationModel,
+)
+from formatters.styles.apa import APACitationFormatter
+from formatters.styles.base import BaseCitationStyle
+from formatters.styles.gost import GOSTCitationFormatter
+
+
+# модели источников для замеров (по одной на каждый тип источника)
+MODELS: tuple[BaseModel, ...] = (
+    BookModel(
+        authors="Иванов И.М.",
+        title="Наука как искусство",
+        edition="3-е",
+        city="СПб.",
+        publishing_house="Просвещение",
+        year=2020,
+        pages=999,
+    ),
+    InternetResourceModel(
+        article="Наука как искусство",
+        website="Ведомости",
+        link="https://www.vedomosti.ru",
+        access_date="01.01.2021",
+    ),
+    ArticlesCollectionModel(
+        authors="Иванов И.М.",
+        article_title="Наука как искусство",
+        collection_title="Сборник научных трудов",
+        city="СПб.",
+        publishing_house="АСТ",
+        year=2020,
+        pages="25-30",
+    ),
+    ArticlesNewspaperModel(
+        authors="Иванов И.М.",
+        article_title="Наука как искусство",
+        newspaper_name="Новая Газета",
+        publishing_year=2023,
+        newspaper_publishing_date="01.01",
+        article_number=1,
+    ),
+    DissertationModel(
+        authors="Иванов И.М.",
+        article_title="Наука как искусство",
+        phd_or_cand="д-р. / канд.",
+        branch_of_sciences="экон.",
+        specialty_code="111",
+        publishing_city="Пермь",
+        publishing_year=2023,
+        pages="1",
+    ),
+)
+
+
+def legacy(style: Type[BaseCitationStyle]) -> Type[BaseCitationStyle]:
+    """
+    Получение класса стиля, создающего шаблон `string.Template` при каждом обращении (прежняя реализация).
+
+    :param style: Класс стиля цитирования.
+    :return: Класс стиля цитирования с прежней реализацией шаблона.
+    """
+
+    source = style.template.template
+
+    return type(f"Legacy{style.__name__}", (style,), {"template": property(lambda self: Template(source))})
+
+
+def measure(style: Type[BaseCitationStyle], model: BaseModel, number: int) -> float:
+    """
+    Замер стоимости форматирования источника.
+
+    :param style: Класс стиля цитирования.
+    :param model: Модель источника.
+    :param number: Количество повторов.
+    :return: Среднее время форматирования в микросекундах.
+    """
+
+    return timeit.timeit(lambda: style(model).substitute(), number=number) / number * 1e6
+
+
+@click.command()
+@click.option("--number", "-n", "number", type=int, default=20000, show_default=True, help="Количество повторов")
+def run(number: int) -> None:
+    """
+    Вывод стоимости форматирования одного источника (в микросекундах) для каждого стиля и типа источника.
+
+    :param int number: Количество повторов
+    """
+
+    # логирование каждого источника исказило бы результаты замеров
+    logging.disable()
+
+    click.echo(f"{'Стиль':<24}{'До, мкс':>12}{'После, мкс':>12}{'Ускорение':>12}")
+    for formatter in (GOSTCitationFormatter, APACitationFormatter):
+        for model in MODELS:
+            style = formatter.formatters_map[type(model).__name__]
+            before = measure(legacy(style), model, number)
+            after = measure(style, model, number)
+
+            click.echo(f"{style.__name__:<24}{before:>12.2f}{after:>12.2f}{before / after:>11.2f}x")
+
+
+if __name__ == "__main__":
+    run()  # pylint: disable=no-value-for-parameter
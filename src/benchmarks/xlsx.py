@@ -0,0 +1,87 @@
+"""
+Сравнение скорости чтения входного файла Excel через openpyxl и собственный потоковый разбор XML.
+
+Запуск:
+
+.. code-block:: console
+
+    python -m benchmarks.xlsx --size 100000
+    python -m benchmarks.xlsx --path ../media/input.xlsx
+"""
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional, Type
+
+import click
+
+from benchmarks.generator import generate_models, parse_mix, write_workbook
+from readers.base import BaseReader
+from readers.reader import BACKENDS, SourcesReader, load_workbook
+
+
+def measure(path: str, backend: str, trusted: bool = True) -> dict[str, float]:
+    """
+    Замер чтения строк листов и моделей входного файла.
+
+    :param path: Путь к входному файлу.
+    :param backend: Способ чтения рабочей книги.
+    :param trusted: Создание моделей без валидации.
+    :return: Количество строк, время чтения значений строк и время чтения моделей в секундах.
+    """
+
+    # зарегистрированные читатели – конкретные подклассы `BaseReader`
+    readers: list[Type[BaseReader]] = list(SourcesReader.readers)
+
+    start = time.perf_counter()
+    workbook = load_workbook(path, backend=backend)
+    try:
+        sheets = [workbook[reader_class(workbook).sheet] for reader_class in readers]
+        rows = sum(1 for sheet in sheets for _ in sheet.iter_rows(min_row=2))
+    finally:
+        workbook.close()
+    rows_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with SourcesReader(path, trusted=trusted, backend=backend) as reader:
+        reader.read()
+    models_seconds = time.perf_counter() - start
+
+    return {"rows": rows, "rows_seconds": rows_seconds, "models_seconds": models_seconds}
+
+
+@click.command()
+@click.option("--size", "-s", "size", type=int, default=100000, show_default=True, help="Количество источников")
+@click.option(
+    "--mix", "mix", type=str, default=None, help="Доли типов источников (например: book=0.5,dissertation=0.5)"
+)
+@click.option("--path", "path", type=click.Path(exists=True, dir_okay=False), default=None, help="Готовый входной файл")
+def run(size: int, mix: Optional[str] = None, path: Optional[str] = None) -> None:
+    """
+    Вывод пропускной способности чтения входного файла для каждого способа.
+
+    :param int size: Количество источников
+    :param Optional[str] mix: Доли типов источников
+    :param Optional[str] path: Готовый входной файл (вместо сгенерированного)
+    """
+
+    with tempfile.TemporaryDirectory() as directory:
+        if path is None:
+            path = str(Path(directory) / "input.xlsx")
+            write_workbook(path, generate_models(size, parse_mix(mix)))
+
+        results = {}
+        for backend in BACKENDS:
+            results[backend] = result = measure(path, backend)
+            rows_rate = result["rows"] / result["rows_seconds"]
+            models_rate = result["rows"] / result["models_seconds"]
+            click.echo(
+                f"{backend:<10}{result['rows_seconds']:>10.3f} с{rows_rate:>12.0f} строк/с"
+                f"{result['models_seconds']:>10.3f} с{models_rate:>12.0f} моделей/с"
+            )
+
+    click.echo(f"Ускорение чтения строк: {results['openpyxl']['rows_seconds'] / results['xlsx']['rows_seconds']:.1f}x")
+
+
+if __name__ == "__main__":
+    run()  # pylint: disable=no-value-for-parameter
@@ -1,7 +1,13 @@
 """
 Базовые функции форматирования списка источников
 """
+import heapq
+from collections import Counter
+from itertools import groupby
+from operator import attrgetter
+from typing import Any, ClassVar, Iterable, Mapping, Optional, Sequence, Type
 
+from formatters.collation import collate
 from formatters.styles.base import BaseCitationStyle
 from logger import get_logger
 
@@ -14,15 +20,60 @@ class BaseCitationFormatter:
     Базовый класс для итогового форматирования списка источников.
     """
 
-    def __init__(self, formatted_items: list[BaseCitationStyle]) -> None:
+    #: классы форматирования по наименованиям моделей источников
+    formatters_map: ClassVar[dict[str, Type[BaseCitationStyle]]] = {}
+
+    def __init__(self, formatted_items: list[BaseCitationStyle], keys: Optional[Sequence[str]] = None) -> None:
         """
         Конструктор.
 
         :param formatted_items: Список объектов для итогового форматирования
+        :param keys: Ранее сохраненные ключи сортировки объектов (см. `sort_keys`)
         """
 
         self.formatted_items = formatted_items
 
+        if keys is not None:
+            if len(keys) != len(formatted_items):
+                raise ValueError("Количество ключей сортировки не совпадает с количеством источников.")
+            for item, key in zip(formatted_items, keys):
+                item.__dict__["sort_key"] = key
+
+    def __len__(self) -> int:
+        return len(self.formatted_items)
+
+    @property
+    def sort_keys(self) -> list[str]:
+        """
+        Получение компактных ключей сортировки в порядке следования объектов (например, для сохранения).
+
+        :return:
+        """
+
+        return [item.sort_key for item in self.formatted_items]
+
+    @classmethod
+    def format_batches(cls, tables: Iterable[tuple[str, Mapping[str, Sequence[Any]]]]) -> dict[str, list[str]]:
+        """
+        Пакетное форматирование источников по типам (см. `BaseCitationStyle.format_batch`).
+
+        Строки не сортируются: результат соответствует порядку значений в столбцах каждого типа.
+
+        :param tables: Пары из наименования модели и столбцов значений полей (например, `RecordStore.iter_tables`).
+        :return: Отформатированные строки по наименованиям моделей.
+        """
+
+        return {name: cls.formatters_map[name].format_batch(columns) for name, columns in tables}
+
+    def summary(self) -> dict[str, int]:
+        """
+        Получение количества источников по классам форматирования (для логирования вместо записи о каждом источнике).
+
+        :return:
+        """
+
+        return dict(Counter(type(item).__name__ for item in self.formatted_items))
+
     def format(self) -> list[BaseCitationStyle]:
         """
         Форматирование списка источников.
@@ -30,6 +81,53 @@ class BaseCitationFormatter:
         :return:
         """
 
-        logger.info("Общее форматирование ...")
+        logger.info("Общее форматирование %s источников ...", len(self.formatted_items))
+
+        return self._resolve_ties(sorted(self.formatted_items, key=attrgetter("sort_key")))
+
+    def page(self, offset: int = 0, limit: Optional[int] = None) -> list[BaseCitationStyle]:
+        """
+        Получение части отсортированного списка источников.
+
+        Полная сортировка не выполняется: выбираются только первые `offset + limit` источников по ключам сортировки,
+        а строки форматируются только для источников, попавших в страницу (и источников с совпадающими ключами).
+
+        :param offset: Количество пропускаемых источников.
+        :param limit: Количество источников на странице (по умолчанию – все оставшиеся).
+        :return:
+        """
+
+        if limit is None:
+            return self.format()[offset:]
+
+        candidates = heapq.nsmallest(offset + limit, self.formatted_items, key=attrgetter("sort_key"))
+        if not candidates:
+            return []
+
+        # источники с ключом последнего кандидата попадают на страницу только после сравнения
+        # отформатированных строк, поэтому для сравнения отбираются все такие источники
+        boundary = candidates[-1].sort_key
+        items = [item for item in candidates if item.sort_key != boundary]
+        items.extend(item for item in self.formatted_items if item.sort_key == boundary)
+
+        end = offset + limit
+
+        return self._resolve_ties(items)[offset:end]
+
+    @staticmethod
+    def _resolve_ties(items: list[BaseCitationStyle]) -> list[BaseCitationStyle]:
+        """
+        Упорядочивание источников с совпадающими ключами сортировки по отформатированным строкам.
+
+        :param items: Список источников, отсортированный по ключам сортировки.
+        :return:
+        """
+
+        result = []
+        for _, group in groupby(items, key=attrgetter("sort_key")):
+            ties = list(group)
+            if len(ties) > 1:
+                ties.sort(key=lambda item: collate(item.formatted))
+            result.extend(ties)
 
-        return sorted(self.formatted_items, key=lambda item: item.formatted)
+        return result
@@ -0,0 +1,192 @@
+"""
+Кеш отформатированных строк списка источников между запусками.
+
+Ключ записи составляется из класса стиля цитирования, его шаблона и версии, а также значений полей шаблона,
+поэтому при изменении источника или правил форматирования запись перестает использоваться.
+"""
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+from functools import lru_cache
+from pathlib import Path
+from types import TracebackType
+from typing import Optional, Sequence, Type
+
+from formatters.styles.base import BaseCitationStyle
+from logger import get_logger
+from settings import CACHE_MAX_ENTRIES
+
+
+logger = get_logger(__name__)
+
+# количество ключей в одном запросе к базе данных (ограничение количества параметров SQLite)
+QUERY_BATCH_SIZE = 500
+
+
+@lru_cache(maxsize=None)
+def style_signature(style: Type[BaseCitationStyle]) -> tuple[str, int, str]:
+    """
+    Получение признаков правил форматирования стиля цитирования (вычисляются один раз для класса).
+
+    :param style: Класс стиля цитирования.
+    :return: Полное наименование класса, версия правил форматирования и хеш шаблона
+        (вместо самого шаблона, чтобы не увеличивать размер каждого ключа).
+    """
+
+    digest = hashlib.sha256(style.template.template.encode("utf-8")).hexdigest()[:16]
+
+    return f"{style.__module__}.{style.__qualname__}", style.version, digest
+
+
+def make_key(item: BaseCitationStyle) -> str:
+    """
+    Получение ключа записи кеша для источника.
+
+    Ключ – представление кортежа из признаков стиля цитирования и значений полей шаблона:
+    отформатированная строка зависит только от них (см. `BaseCitationStyle.format_batch`),
+    поэтому модель не сериализуется целиком и не хешируется.
+
+    :param item: Источник для форматирования.
+    :return:
+    """
+
+    data = item.data
+
+    return repr((*style_signature(type(item)), *[getattr(data, field) for field in item.template.batch_fields]))
+
+
+class FormattedCache:
+    """
+    Кеш отформатированных строк на диске (SQLite) с вытеснением давно не использованных записей.
+    """
+
+    def __init__(self, path: Path | str, max_entries: int = CACHE_MAX_ENTRIES) -> None:
+        """
+        Конструктор.
+
+        :param path: Путь к файлу кеша.
+        :param max_entries: Максимальное количество записей.
+        """
+
+        self.max_entries = max_entries
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, value TEXT NOT NULL, used INTEGER NOT NULL);
+            CREATE INDEX IF NOT EXISTS entries_used ON entries (used);
+            """
+        )
+
+        # номер обращения к кешу для определения давно не использованных записей
+        self.clock: int = self.connection.execute("SELECT COALESCE(MAX(used), 0) FROM entries").fetchone()[0]
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __enter__(self) -> FormattedCache:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Сохранение изменений и закрытие файла кеша.
+        """
+
+        self.connection.commit()
+        self.connection.close()
+
+    def __len__(self) -> int:
+        return self.connection.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def apply(self, items: Sequence[BaseCitationStyle]) -> None:
+        """
+        Подстановка отформатированных строк из кеша.
+
+        Строки найденных в кеше источников не форматируются повторно,
+        а строки остальных источников форматируются и сохраняются в кеш.
+
+        :param items: Источники для форматирования.
+        """
+
+        self.clock += 1
+        for start in range(0, len(items), QUERY_BATCH_SIZE):
+            stop = start + QUERY_BATCH_SIZE
+            batch = items[start:stop]
+            keys = [make_key(item) for item in batch]
+
+            placeholders = ",".join("?" * len(keys))
+            found = dict(self.connection.execute(f"SELECT key, value FROM entries WHERE key IN ({placeholders})", keys))
+
+            missing = []
+            for key, item in zip(keys, batch):
+                if key in found:
+                    # значение подставляется вместо отложенного форматирования (см. `BaseCitationStyle.formatted`)
+                    item.__dict__["formatted"] = found[key]
+                else:
+                    missing.append((key, item.formatted, self.clock))
+
+            if found:
+                self.connection.execute(
+                    f"UPDATE entries SET used = ? WHERE key IN ({','.join('?' * len(found))})",
+                    [self.clock, *found.keys()],
+                )
+            self.connection.executemany("INSERT OR REPLACE INTO entries (key, value, used) VALUES (?, ?, ?)", missing)
+
+            self.hits += len(found)
+            self.misses += len(missing)
+
+        self.evict()
+        self.connection.commit()
+
+    def evict(self) -> None:
+        """
+        Удаление давно не использованных записей сверх максимального количества.
+        """
+
+        excess = len(self) - self.max_entries
+        if excess > 0:
+            self.connection.execute(
+                "DELETE FROM entries WHERE key IN (SELECT key FROM entries ORDER BY used LIMIT ?)", (excess,)
+            )
+            self.evictions += excess
+
+    def stats(self) -> dict[str, float]:
+        """
+        Получение статистики использования кеша.
+
+        :return: Количество попаданий, промахов, вытесненных и хранимых записей, доля попаданий.
+        """
+
+        requests = self.hits + self.misses
+
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self),
+            "hit_rate": self.hits / requests if requests else 0.0,
+        }
+
+    def log_stats(self) -> None:
+        """
+        Вывод статистики использования кеша в лог.
+        """
+
+        stats = self.stats()
+        logger.info(
+            "Кеш отформатированных строк: попаданий – %s, промахов – %s, вытеснено – %s, записей – %s (%.1f%%).",
+            stats["hits"],
+            stats["misses"],
+            stats["evictions"],
+            stats["entries"],
+            stats["hit_rate"] * 100,
+        )
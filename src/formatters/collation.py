@@ -0,0 +1,132 @@
+"""
+Ключи сортировки списка источников по правилам ГОСТ.
+
+Источники упорядочиваются по алфавиту: сначала на кириллице, затем на латинице,
+внутри – по автору, затем по заглавию. Регистр букв не учитывается, «ё» приравнивается к «е».
+Буквы с диакритическими знаками и буквы других алфавитов на кириллице и латинице (é, ü, ø, ї, є, ґ)
+приравниваются к основным буквам, а символы остальных алфавитов располагаются после латиницы.
+Источники с совпадающими ключами упорядочиваются по отформатированным строкам.
+"""
+from __future__ import annotations
+
+import codecs
+import json
+import unicodedata
+from pathlib import Path
+from typing import Any, Optional
+
+# буквы алфавитов в порядке сортировки
+CYRILLIC = "абвгдежзийклмнопрстуфхцчшщъыьэюя"
+LATIN = "abcdefghijklmnopqrstuvwxyz"
+
+# порядок символов в ключах сортировки: управляющие символы, пробелы, цифры и знаки препинания,
+# затем буквы кириллицы, затем буквы латиницы
+ORDER = "".join(chr(code) for code in range(ord("a"))) + "{|}~\x7f«»–—№…" + CYRILLIC + LATIN
+
+# признак символа остальных алфавитов (за ним следует код символа, поэтому такие символы располагаются
+# после латиницы в порядке кодов)
+OTHER = "\uf8ff"
+
+# основные буквы для букв без разложения на букву и диакритические знаки (после приведения к нижнему регистру)
+LETTERS = {
+    "ґ": "г",
+    "є": "е",
+    "і": "и",
+    "ø": "o",
+    "æ": "ae",
+    "œ": "oe",
+    "ł": "l",
+    "đ": "d",
+    "ð": "d",
+    "þ": "th",
+    "ı": "i",
+    "ħ": "h",
+    "ŧ": "t",
+}
+
+# таблица кодирования символов в байты в порядке сортировки (кодирование выполняется на уровне C);
+# незадействованные байты заполняются символами из области для частного использования
+COLLATION_MAP = codecs.charmap_build(ORDER + OTHER + "".join(chr(0xE000 + code) for code in range(255 - len(ORDER))))
+
+# разделитель элементов ключа меньше любого символа текста, поэтому «Иванов» располагается перед «Иванова»
+SEPARATOR = "\x00"
+
+
+def replace_unmapped(error: UnicodeError) -> tuple[str, int]:
+    """
+    Замена символов, отсутствующих в таблице кодирования (обработчик ошибок кодирования «collation»).
+
+    Символ раскладывается на букву и диакритические знаки (NFKD), знаки отбрасываются, а буква
+    приравнивается к основной букве кириллицы или латиницы (см. `LETTERS`).
+
+    :param error: Ошибка кодирования с позициями незакодированных символов.
+    :return: Замена незакодированных символов и позиция продолжения кодирования.
+    """
+
+    if not isinstance(error, UnicodeEncodeError):
+        raise error
+
+    start, end = error.start, error.end
+    replacement = []
+    for char in error.object[start:end]:
+        for part in unicodedata.normalize("NFKD", char):
+            if unicodedata.combining(part):
+                continue
+
+            part = LETTERS.get(part, part)
+            if all(symbol in ORDER for symbol in part):
+                replacement.append(part)
+            else:
+                replacement.append(f"{OTHER}{ord(part):06x}")
+
+    return "".join(replacement), end
+
+
+codecs.register_error("collation", replace_unmapped)
+
+
+def collate(text: str) -> str:
+    """
+    Преобразование строки в ключ для сравнения по правилам сортировки.
+
+    :param text: Исходная строка.
+    :return: Ключ для сравнения строк.
+    """
+
+    # символы, отсутствующие в таблице, заменяются обработчиком `replace_unmapped`
+    return codecs.charmap_encode(text.casefold().replace("ё", "е"), "collation", COLLATION_MAP)[0].decode("latin-1")
+
+
+def make_key(*parts: Optional[Any]) -> str:
+    """
+    Получение компактного ключа сортировки из элементов описания источника.
+
+    :param parts: Элементы описания в порядке сортировки (например, автор и заглавие).
+    :return: Ключ сортировки.
+    """
+
+    return collate(SEPARATOR.join([str(part) if part else "" for part in parts]))
+
+
+def save_keys(path: Path | str, keys: list[str]) -> None:
+    """
+    Сохранение ключей сортировки в файл.
+
+    :param path: Путь к файлу.
+    :param keys: Ключи сортировки в порядке следования источников.
+    """
+
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(keys, file, ensure_ascii=False)
+
+
+def load_keys(path: Path | str) -> list[str]:
+    """
+    Загрузка ключей сортировки из файла.
+
+    :param path: Путь к файлу.
+    :return: Ключи сортировки в порядке следования источников.
+    """
+
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
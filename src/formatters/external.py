@@ -0,0 +1,198 @@
+"""
+Внешняя сортировка списка источников, не помещающегося в память.
+
+Отформатированные строки накапливаются порциями, каждая порция сортируется
+и сохраняется во временный файл, а затем файлы объединяются k-путевым слиянием.
+"""
+import heapq
+import os
+import pickle
+import tempfile
+import weakref
+from types import TracebackType
+from typing import Iterable, Iterator, Optional, Type
+
+from formatters.cache import FormattedCache
+from formatters.collation import collate
+from formatters.styles.base import BaseCitationStyle
+from logger import get_logger
+
+
+logger = get_logger(__name__)
+
+# количество записей в одном блоке временного файла (блоками записи читаются при слиянии)
+BLOCK_SIZE = 1024
+
+
+def run_order(record: tuple[str, str]) -> tuple[str, str]:
+    """
+    Получение ключа упорядочивания записи (ключ сортировки, затем отформатированная строка).
+
+    Порядок совпадает с порядком `BaseCitationFormatter.format`.
+
+    :param record: Запись из ключа сортировки и отформатированной строки.
+    :return:
+    """
+
+    return record[0], collate(record[1])
+
+
+def read_run(path: str) -> Iterator[tuple[str, str]]:
+    """
+    Чтение отсортированной порции записей из временного файла по блокам.
+
+    :param path: Путь к временному файлу.
+    :return: Генератор записей из ключа сортировки и отформатированной строки.
+    """
+
+    with open(path, "rb") as file:
+        while True:
+            try:
+                block = pickle.load(file)
+            except EOFError:
+                return
+            yield from block
+
+
+def remove_runs(paths: list[str]) -> None:
+    """
+    Удаление временных файлов порций.
+
+    :param paths: Пути к временным файлам (список очищается).
+    """
+
+    for path in paths:
+        if os.path.exists(path):
+            os.remove(path)
+
+    paths.clear()
+
+
+class ExternalSorter:
+    """
+    Внешняя сортировка отформатированных строк списка источников.
+
+    При итерации строки возвращаются в отсортированном порядке. Если порции сохранялись во временные файлы,
+    итерация выполняется однократно: после слияния временные файлы удаляются. Если слияние не выполнялось
+    или было прервано, файлы удаляются при закрытии (в том числе при выходе из блока `with`),
+    а также при удалении объекта сборщиком мусора или при завершении процесса.
+    """
+
+    def __init__(
+        self,
+        chunk_size: int,
+        directory: Optional[str] = None,
+        cache: Optional[FormattedCache] = None,
+    ) -> None:
+        """
+        Конструктор.
+
+        :param chunk_size: Количество записей в порции, сортируемой в памяти.
+        :param directory: Директория для временных файлов (по умолчанию – системная).
+        :param cache: Кеш отформатированных строк.
+        """
+
+        self.chunk_size = chunk_size
+        self.directory = directory
+        self.cache = cache
+        self.chunk: list[BaseCitationStyle] = []
+        self.runs: list[str] = []
+        self.count = 0
+        # список путей не связан с объектом, поэтому файлы удаляются и после удаления объекта
+        self._finalizer = weakref.finalize(self, remove_runs, self.runs)
+
+    def __enter__(self) -> "ExternalSorter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def add(self, item: BaseCitationStyle) -> None:
+        """
+        Добавление источника.
+
+        :param item: Источник для форматирования.
+        """
+
+        self.chunk.append(item)
+        self.count += 1
+
+        if len(self.chunk) >= self.chunk_size:
+            self.flush()
+
+    def extend(self, items: Iterable[BaseCitationStyle]) -> None:
+        """
+        Добавление источников.
+
+        :param items: Источники для форматирования.
+        """
+
+        for item in items:
+            self.add(item)
+
+    def flush(self) -> None:
+        """
+        Сортировка накопленной порции и сохранение ее во временный файл.
+        """
+
+        if not self.chunk:
+            return
+
+        records = self.records()
+        descriptor, path = tempfile.mkstemp(prefix="bibliography-", suffix=".run", dir=self.directory)
+        # файл удаляется при закрытии, даже если запись порции не завершена
+        self.runs.append(path)
+        with os.fdopen(descriptor, "wb") as file:
+            for start in range(0, len(records), BLOCK_SIZE):
+                end = start + BLOCK_SIZE
+                pickle.dump(records[start:end], file, protocol=pickle.HIGHEST_PROTOCOL)
+
+        logger.info("Сохранена отсортированная порция из %s записей ...", len(records))
+
+        self.chunk = []
+
+    def records(self) -> list[tuple[str, str]]:
+        """
+        Форматирование и сортировка накопленной порции.
+
+        :return: Отсортированные записи из ключа сортировки и отформатированной строки.
+        """
+
+        if self.cache is not None:
+            self.cache.apply(self.chunk)
+
+        return sorted(((item.sort_key, item.formatted) for item in self.chunk), key=run_order)
+
+    def close(self) -> None:
+        """
+        Удаление временных файлов.
+        """
+
+        remove_runs(self.runs)
+
+    def __getstate__(self) -> dict:
+        # соединение с кешем не передается в другие процессы
+        return {**self.__dict__, "cache": None}
+
+    def __iter__(self) -> Iterator[str]:
+        # все записи поместились в одну порцию – сортировка выполняется в памяти
+        if not self.runs:
+            for _, formatted in self.records():
+                yield formatted
+            return
+
+        self.flush()
+        logger.info("Слияние %s отсортированных порций ...", len(self.runs))
+        try:
+            for _, formatted in heapq.merge(*(read_run(path) for path in self.runs), key=run_order):
+                yield formatted
+        finally:
+            self.close()
@@ -2,7 +2,7 @@
 Описание схем объектов (DTO).
 """
 
-from typing import Optional
+from typing import Any, Optional
 
 from pydantic import BaseModel, Field
 
@@ -134,3 +134,16 @@ class ArticlesNewspaperModel(BaseModel):
     newspaper_publishing_date: str
     article_number: int = Field(..., gt=0)
 
+
+def model_name(model: Any) -> str:
+    """
+    Получение наименования модели источника для выбора класса форматирования.
+
+    Для строк колоночного хранилища (:mod:`readers.store`) возвращается наименование модели,
+    которую представляет строка.
+
+    :param model: Модель источника или строка хранилища.
+    :return: Наименование модели (`BookModel` и т.д.).
+    """
+
+    return getattr(type(model), "model_name", None) or type(model).__name__
@@ -0,0 +1,134 @@
+"""
+Параллельное форматирование списка источников одного стиля цитирования порциями в пуле процессов.
+
+Список моделей разбивается на последовательные порции. В задачу передаются только кортежи значений полей,
+необходимых стилю (по типам источников), а классы форматирования передаются процессам один раз при запуске.
+Каждый процесс форматирует порцию пакетно (см. `BaseCitationStyle.format_batch`) и сортирует ее,
+а отсортированные порции объединяются слиянием в том же порядке, что и `BaseCitationFormatter.format`.
+"""
+from __future__ import annotations
+
+import heapq
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Iterable, Iterator, Optional, Sequence, Type
+
+from pydantic import BaseModel
+
+from formatters.base import BaseCitationFormatter
+from formatters.external import run_order
+from formatters.models import model_name
+from formatters.styles.base import BaseCitationStyle
+from logger import get_logger
+
+
+logger = get_logger(__name__)
+
+# порция: по наименованиям моделей – номера источников в порции и кортежи значений полей
+Chunk = dict[str, tuple[list[int], list[tuple[Any, ...]]]]
+
+# количество порций на процесс (для равномерной загрузки процессов)
+CHUNKS_PER_WORKER = 4
+
+# классы форматирования в процессе пула (задаются при запуске процесса, см. `init_worker`)
+worker_formatters: dict[str, Type[BaseCitationStyle]] = {}
+
+
+def init_worker(formatters_map: dict[str, Type[BaseCitationStyle]]) -> None:
+    """
+    Инициализация процесса пула классами форматирования стиля цитирования.
+
+    :param formatters_map: Классы форматирования по наименованиям моделей.
+    """
+
+    worker_formatters.clear()
+    worker_formatters.update(formatters_map)
+
+
+def format_chunk(chunk: Chunk) -> list[tuple[str, str]]:
+    """
+    Форматирование и сортировка порции источников (выполняется в процессе пула).
+
+    :param chunk: Номера источников в порции и значения полей по наименованиям моделей.
+    :return: Записи из ключа сортировки и отформатированной строки, отсортированные как в `format`.
+    """
+
+    records: list[tuple[str, str, int]] = []
+    for name, (positions, rows) in chunk.items():
+        style = worker_formatters[name]
+        columns = dict(zip(style.batch_input_fields(), zip(*rows)))
+        formatted = style.format_batch(columns)
+        records.extend(zip(style.sort_key_batch(columns, formatted), formatted, positions))
+
+    # при совпадении ключей сохраняется исходный порядок источников, как при сортировке всего списка
+    records.sort(key=lambda record: (*run_order(record[:2]), record[2]))
+
+    return [(key, formatted) for key, formatted, _ in records]
+
+
+def partition(
+    models: Iterable[BaseModel],
+    formatters_map: dict[str, Type[BaseCitationStyle]],
+    chunk_size: int,
+) -> Iterator[Chunk]:
+    """
+    Разбиение списка источников на порции из значений полей.
+
+    :param models: Модели источников (или строки колоночного хранилища).
+    :param formatters_map: Классы форматирования по наименованиям моделей.
+    :param chunk_size: Количество источников в порции.
+    :return: Генератор порций.
+    """
+
+    fields = {name: style.batch_input_fields() for name, style in formatters_map.items()}
+    chunk: Chunk = {}
+    size = 0
+    for model in models:
+        name = model_name(model)
+        positions, rows = chunk.setdefault(name, ([], []))
+        positions.append(size)
+        rows.append(tuple(getattr(model, field) for field in fields[name]))
+        size += 1
+
+        if size >= chunk_size:
+            yield chunk
+            chunk, size = {}, 0
+
+    if chunk:
+        yield chunk
+
+
+def format_parallel(
+    formatter: Type[BaseCitationFormatter],
+    models: Sequence[BaseModel],
+    max_workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+) -> list[str]:
+    """
+    Параллельное форматирование и сортировка списка источников одного стиля цитирования.
+
+    Результат совпадает с `formatter(models).format()`.
+
+    :param formatter: Класс итогового форматирования стиля цитирования.
+    :param models: Модели источников (или колоночное хранилище).
+    :param max_workers: Количество процессов (по умолчанию – по количеству ядер).
+    :param chunk_size: Количество источников в порции (по умолчанию – `CHUNKS_PER_WORKER` порции на процесс).
+    :return: Отсортированные отформатированные строки.
+    """
+
+    max_workers = max_workers or os.cpu_count() or 1
+    chunk_size = chunk_size or max(1, math.ceil(len(models) / (max_workers * CHUNKS_PER_WORKER)))
+    chunks = partition(models, formatter.formatters_map, chunk_size)
+
+    if max_workers == 1:
+        init_worker(formatter.formatters_map)
+        runs = [format_chunk(chunk) for chunk in chunks]
+    else:
+        logger.info("Параллельное форматирование %s источников (процессов – %s) ...", len(models), max_workers)
+        with ProcessPoolExecutor(
+            max_workers=max_workers, initializer=init_worker, initargs=(formatter.formatters_map,)
+        ) as executor:
+            runs = list(executor.map(format_chunk, chunks))
+
+    return [formatted for _, formatted in heapq.merge(*runs, key=run_order)]
@@ -1,16 +1,25 @@
 """
 Стиль цитирования по apa 7th.
+
+Список упорядочивается так же, как по ГОСТ (см. :mod:`formatters.collation`): по автору, затем по заглавию,
+сначала источники на кириллице, затем на латинице. APA 7th задает алфавитный порядок по фамилии первого автора,
+но не порядок источников на разных алфавитах, поэтому для русскоязычного списка используется тот же порядок,
+что и для ГОСТ (одинаковые ключи используются при внешней сортировке и инкрементальной пересборке).
 """
-from string import Template
+from typing import Iterable, Optional, Sequence
 
 from pydantic import BaseModel
 
-from formatters.models import BookModel, InternetResourceModel, ArticlesCollectionModel, ArticlesNewspaperModel, DissertationModel
-from formatters.styles.base import BaseCitationStyle
-from logger import get_logger
-
-
-logger = get_logger(__name__)
+from formatters.base import BaseCitationFormatter
+from formatters.models import (
+    BookModel,
+    InternetResourceModel,
+    ArticlesCollectionModel,
+    ArticlesNewspaperModel,
+    DissertationModel,
+    model_name,
+)
+from formatters.styles.base import BaseCitationStyle, CompiledTemplate
 
 
 class APABook(BaseCitationStyle):
@@ -20,16 +29,12 @@ class APABook(BaseCitationStyle):
 
     data: BookModel
 
-    @property
-    def template(self) -> Template:
-        return Template(
-            "$authors ($year). $title."
-        )
+    sort_fields = ("authors", "title")
+    template = CompiledTemplate(
+        "$authors ($year). $title."
+    )
 
     def substitute(self) -> str:
-
-        logger.info('Форматирование книги "%s" ...', self.data.title)
-
         return self.template.substitute(
             authors=self.data.authors,
             title=self.data.title,
@@ -57,16 +62,12 @@ class APAInternetResource(BaseCitationStyle):
 
     data: InternetResourceModel
 
-    @property
-    def template(self) -> Template:
-        return Template(
-            "$website. (n.d.). $article. $link."
-        )
+    sort_fields = ("website", "article")
+    template = CompiledTemplate(
+        "$website. (n.d.). $article. $link."
+    )
 
     def substitute(self) -> str:
-
-        logger.info('Форматирование интернет-ресурса "%s" ...', self.data.article)
-
         return self.template.substitute(
             article=self.data.article,
             website=self.data.website,
@@ -82,16 +83,12 @@ class APACollectionArticle(BaseCitationStyle):
 
     data: ArticlesCollectionModel
 
-    @property
-    def template(self) -> Template:
-        return Template(
-            "$authors ($year). $article_title in $collection_title (p. $pages)."
-        )
+    sort_fields = ("authors", "article_title")
+    template = CompiledTemplate(
+        "$authors ($year). $article_title in $collection_title (p. $pages)."
+    )
 
     def substitute(self) -> str:
-
-        logger.info('Форматирование сборника статей "%s" ...', self.data.article_title)
-
         return self.template.substitute(
             authors=self.data.authors,
             article_title=self.data.article_title,
@@ -110,16 +107,13 @@ class APANewspaperArticle(BaseCitationStyle):
 
     data: ArticlesNewspaperModel
 
-    @property
-    def template(self) -> Template:
-        return Template(
-            "$authors ($publishing_year, $newspaper_publishing_date.). $article_title. "
-            "$newspaper_name. pp. $article_number A."
-        )
+    sort_fields = ("authors", "article_title")
+    template = CompiledTemplate(
+        "$authors ($publishing_year, $newspaper_publishing_date.). $article_title. "
+        "$newspaper_name. pp. $article_number A."
+    )
 
     def substitute(self) -> str:
-        logger.info('Форматирование статьи из газеты "%s" ...', self.data.article_title)
-
         return self.template.substitute(
             authors=self.data.authors,
             article_title=self.data.article_title,
@@ -137,16 +131,13 @@ class APADissertation(BaseCitationStyle):
 
     data: DissertationModel
 
-    @property
-    def template(self) -> Template:
-        return Template(
-            "$authors ($publishing_year). $article_title [$phd_or_cand $branch_of_sciences наук]. "
-            "$pages с."
-        )
+    sort_fields = ("authors", "article_title")
+    template = CompiledTemplate(
+        "$authors ($publishing_year). $article_title [$phd_or_cand $branch_of_sciences наук]. "
+        "$pages с."
+    )
 
     def substitute(self) -> str:
-        logger.info('Форматирование диссертации "%s" ...', self.data.article_title)
-
         return self.template.substitute(
             authors=self.data.authors,
             article_title=self.data.article_title,
@@ -159,9 +150,11 @@ class APADissertation(BaseCitationStyle):
 
         )
 
-class APACitationFormatter:
+class APACitationFormatter(BaseCitationFormatter):
     """
     Базовый класс для итогового форматирования списка источников.
+
+    Порядок сортировки намеренно совпадает с порядком ГОСТ (см. описание модуля).
     """
 
     formatters_map = {
@@ -172,24 +165,17 @@ class APACitationFormatter:
         DissertationModel.__name__: APADissertation,
     }
 
-    def __init__(self, models: list[BaseModel]) -> None:
+    def __init__(self, models: Iterable[BaseModel], keys: Optional[Sequence[str]] = None) -> None:
         """
         Конструктор.
 
-        :param models: Список объектов для форматирования
-        """
-
-        formatted_items = []
-        for model in models:
-            formatted_items.append(self.formatters_map.get(type(model).__name__)(model))  # type: ignore
-
-        self.formatted_items = formatted_items
-
-    def format(self) -> list[BaseCitationStyle]:
-        """
-        Форматирование списка источников.
+        Строки источников форматируются при первом обращении к ним (см. `BaseCitationStyle.formatted`).
 
-        :return:
+        :param models: Список объектов для форматирования
+        :param keys: Ранее сохраненные ключи сортировки объектов
         """
 
-        return sorted(self.formatted_items, key=lambda item: item.formatted)
+        super().__init__(
+            [self.formatters_map.get(model_name(model))(model) for model in models],  # type: ignore
+            keys,
+        )
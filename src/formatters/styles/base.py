@@ -3,29 +3,176 @@
 """
 
 from abc import ABC, abstractmethod
+from collections import ChainMap
+from functools import cached_property
 from string import Template
+from typing import Any, Callable, ClassVar, Mapping, Optional, Sequence
 
 from pydantic import BaseModel
 
+from formatters.collation import collate, make_key
+
+
+class CompiledTemplate(Template):
+    """
+    Шаблон строки, разобранный один раз при создании.
+
+    Шаблон в синтаксисе `string.Template` преобразуется в последовательность литералов и полей
+    и в строку формата для `str.format_map`, поэтому при заполнении не выполняется
+    повторный разбор шаблона регулярным выражением.
+    """
+
+    def __init__(self, template: str) -> None:
+        """
+        Конструктор.
+
+        :param template: Шаблон строки в синтаксисе `string.Template`.
+        """
+
+        super().__init__(template)
+
+        segments: list[tuple[bool, str]] = []
+        position = 0
+        for match in self.pattern.finditer(template):
+            start = match.start()
+            segments.append((False, template[position:start]))
+            position = match.end()
+
+            if name := match.group("named") or match.group("braced"):
+                segments.append((True, name))
+            elif match.group("escaped") is not None:
+                segments.append((False, self.delimiter))
+            else:
+                raise ValueError(f"Некорректный заполнитель в шаблоне: {template!r}")
+
+        segments.append((False, template[position:]))
+
+        #: последовательность литералов и полей шаблона (признак поля, текст или наименование поля)
+        self.segments = tuple((is_field, text) for is_field, text in segments if is_field or text)
+        #: наименования полей шаблона в порядке следования
+        self.fields = tuple(text for is_field, text in self.segments if is_field)
+        #: строка формата для `str.format_map` (значения приводятся к строке так же, как в `Template`)
+        self.format_string = "".join(
+            f"{{{text}!s}}" if is_field else text.replace("{", "{{").replace("}", "}}")
+            for is_field, text in self.segments
+        )
+        #: уникальные наименования полей шаблона (порядок позиционных аргументов `positional_string`)
+        self.batch_fields = tuple(dict.fromkeys(self.fields))
+        #: строка формата для `str.format` с позиционными аргументами (для пакетного форматирования)
+        self.positional_string = "".join(
+            f"{{{self.batch_fields.index(text)}!s}}" if is_field else text.replace("{", "{{").replace("}", "}}")
+            for is_field, text in self.segments
+        )
+
+    def substitute(  # pylint: disable=arguments-differ
+        self, mapping: Optional[Mapping[str, Any]] = None, /, **kwargs: Any
+    ) -> str:
+        """
+        Заполнение шаблона.
+
+        :param mapping: Значения полей шаблона.
+        :param kwargs: Значения полей шаблона.
+        :return: Заполненная строка.
+        """
+
+        if mapping is None:
+            mapping = kwargs
+        elif kwargs:
+            mapping = ChainMap(kwargs, mapping)  # type: ignore
+
+        return self.format_string.format_map(mapping)
+
 
 class BaseCitationStyle(ABC):
     """
     Абстрактный базовый класс стиля цитирования.
     """
 
+    #: шаблон для форматирования строки (разбирается один раз при создании класса)
+    template: ClassVar[CompiledTemplate]
+
+    #: поля модели для ключа сортировки (автор, затем заглавие);
+    #: если не заданы, сортировка выполняется по отформатированной строке
+    sort_fields: ClassVar[tuple[str, ...]] = ()
+
+    #: версия правил форматирования (увеличивается при изменении `substitute()` без изменения шаблона)
+    version: ClassVar[int] = 1
+
+    #: преобразования значений полей модели перед заполнением шаблона (как в `substitute()`, см. `format_batch`)
+    converters: ClassVar[dict[str, Callable[[Any], Any]]] = {}
+
     def __init__(self, data: BaseModel) -> None:
         self.data = data
-        self.formatted = self.substitute()
 
-    @property
-    @abstractmethod
-    def template(self) -> Template:
+    @cached_property
+    def formatted(self) -> str:
         """
-        Получение шаблона для форматирования строки.
+        Получение отформатированной строки (шаблон заполняется при первом обращении).
 
         :return:
         """
 
+        return self.substitute()
+
+    @cached_property
+    def sort_key(self) -> str:
+        """
+        Получение компактного ключа для сортировки списка источников (вычисляется один раз).
+
+        :return:
+        """
+
+        if self.sort_fields:
+            data = self.data
+            return make_key(*[getattr(data, field) for field in self.sort_fields])
+
+        return collate(self.formatted)
+
+    @classmethod
+    def format_batch(cls, columns: Mapping[str, Sequence[Any]]) -> list[str]:
+        """
+        Пакетное форматирование источников одного типа по столбцам значений полей.
+
+        Шаблон заполняется позиционной строкой формата за один проход по столбцам,
+        без создания объектов стиля и моделей для каждого источника. Результат совпадает с `substitute()`.
+
+        :param columns: Значения полей модели по наименованиям полей (столбцы одинаковой длины).
+        :return: Отформатированные строки в порядке столбцов.
+        """
+
+        converters = cls.converters
+        arrays = [
+            map(converters[field], columns[field]) if field in converters else columns[field]
+            for field in cls.template.batch_fields
+        ]
+
+        return list(map(cls.template.positional_string.format, *arrays))
+
+    @classmethod
+    def sort_key_batch(cls, columns: Mapping[str, Sequence[Any]], formatted: Sequence[str]) -> list[str]:
+        """
+        Пакетное получение ключей сортировки (совпадают с `sort_key`).
+
+        :param columns: Значения полей модели по наименованиям полей.
+        :param formatted: Отформатированные строки (см. `format_batch`).
+        :return: Ключи сортировки в порядке столбцов.
+        """
+
+        if cls.sort_fields:
+            return list(map(make_key, *(columns[field] for field in cls.sort_fields)))
+
+        return list(map(collate, formatted))
+
+    @classmethod
+    def batch_input_fields(cls) -> tuple[str, ...]:
+        """
+        Получение полей модели, необходимых для пакетного форматирования и ключей сортировки.
+
+        :return:
+        """
+
+        return tuple(dict.fromkeys((*cls.template.batch_fields, *cls.sort_fields)))
+
     @abstractmethod
     def substitute(self) -> str:
         """
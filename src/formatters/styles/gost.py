@@ -1,16 +1,31 @@
 """
 Стиль цитирования по ГОСТ Р 7.0.5-2008.
 """
-from string import Template
+from typing import Iterable, Optional, Sequence
 
 from pydantic import BaseModel
 
-from formatters.models import BookModel, InternetResourceModel, ArticlesCollectionModel, ArticlesNewspaperModel, DissertationModel
-from formatters.styles.base import BaseCitationStyle
-from logger import get_logger
+from formatters.base import BaseCitationFormatter
+from formatters.models import (
+    BookModel,
+    InternetResourceModel,
+    ArticlesCollectionModel,
+    ArticlesNewspaperModel,
+    DissertationModel,
+    model_name,
+)
+from formatters.styles.base import BaseCitationStyle, CompiledTemplate
 
 
-logger = get_logger(__name__)
+def format_edition(edition: Optional[str]) -> str:
+    """
+    Получение отформатированной информации об издании.
+
+    :param edition: Издание (`3-е`).
+    :return: Информация об издании или пустая строка.
+    """
+
+    return f"{edition} изд. – " if edition else ""
 
 
 class GOSTBook(BaseCitationStyle):
@@ -20,16 +35,13 @@ class GOSTBook(BaseCitationStyle):
 
     data: BookModel
 
-    @property
-    def template(self) -> Template:
-        return Template(
-            "$authors $title. – $edition$city: $publishing_house, $year. – $pages с."
-        )
+    sort_fields = ("authors", "title")
+    template = CompiledTemplate(
+        "$authors $title. – $edition$city: $publishing_house, $year. – $pages с."
+    )
+    converters = {"edition": format_edition}
 
     def substitute(self) -> str:
-
-        logger.info('Форматирование книги "%s" ...', self.data.title)
-
         return self.template.substitute(
             authors=self.data.authors,
             title=self.data.title,
@@ -47,7 +59,7 @@ class GOSTBook(BaseCitationStyle):
         :return: Информация об издательстве.
         """
 
-        return f"{self.data.edition} изд. – " if self.data.edition else ""
+        return format_edition(self.data.edition)
 
 
 class GOSTInternetResource(BaseCitationStyle):
@@ -57,16 +69,12 @@ class GOSTInternetResource(BaseCitationStyle):
 
     data: InternetResourceModel
 
-    @property
-    def template(self) -> Template:
-        return Template(
-            "$article // $website URL: $link (дата обращения: $access_date)."
-        )
+    sort_fields = ("article", "website")
+    template = CompiledTemplate(
+        "$article // $website URL: $link (дата обращения: $access_date)."
+    )
 
     def substitute(self) -> str:
-
-        logger.info('Форматирование интернет-ресурса "%s" ...', self.data.article)
-
         return self.template.substitute(
             article=self.data.article,
             website=self.data.website,
@@ -82,16 +90,12 @@ class GOSTCollectionArticle(BaseCitationStyle):
 
     data: ArticlesCollectionModel
 
-    @property
-    def template(self) -> Template:
-        return Template(
-            "$authors $article_title // $collection_title. – $city: $publishing_house, $year. – С. $pages."
-        )
+    sort_fields = ("authors", "article_title")
+    template = CompiledTemplate(
+        "$authors $article_title // $collection_title. – $city: $publishing_house, $year. – С. $pages."
+    )
 
     def substitute(self) -> str:
-
-        logger.info('Форматирование сборника статей "%s" ...', self.data.article_title)
-
         return self.template.substitute(
             authors=self.data.authors,
             article_title=self.data.article_title,
@@ -109,15 +113,12 @@ class GOSTNewspaperArticle(BaseCitationStyle):
 
     data: ArticlesNewspaperModel
 
-    @property
-    def template(self) -> Template:
-        return Template(
-            "$authors ($publishing_year) $article_title // $newspaper_name. $newspaper_publishing_date."
-        )
+    sort_fields = ("authors", "article_title")
+    template = CompiledTemplate(
+        "$authors ($publishing_year) $article_title // $newspaper_name. $newspaper_publishing_date."
+    )
 
     def substitute(self) -> str:
-        logger.info('Форматирование статьи из газеты "%s" ...', self.data.article_title)
-
         return self.template.substitute(
             authors=self.data.authors,
             article_title=self.data.article_title,
@@ -134,16 +135,13 @@ class GOSTDissertation(BaseCitationStyle):
 
     data: DissertationModel
 
-    @property
-    def template(self) -> Template:
-        return Template(
-            "$authors $article_title: дис. ... $phd_or_cand $branch_of_sciences: $specialty_code $publishing_city,"
-            " $publishing_year. $pages с."
-        )
+    sort_fields = ("authors", "article_title")
+    template = CompiledTemplate(
+        "$authors $article_title: дис. ... $phd_or_cand $branch_of_sciences: $specialty_code $publishing_city,"
+        " $publishing_year. $pages с."
+    )
 
     def substitute(self) -> str:
-        logger.info('Форматирование диссертации "%s" ...', self.data.article_title)
-
         return self.template.substitute(
             authors=self.data.authors,
             article_title=self.data.article_title,
@@ -155,7 +153,7 @@ class GOSTDissertation(BaseCitationStyle):
             pages=self.data.pages,
         )
 
-class GOSTCitationFormatter:
+class GOSTCitationFormatter(BaseCitationFormatter):
     """
     Базовый класс для итогового форматирования списка источников.
     """
@@ -168,24 +166,17 @@ class GOSTCitationFormatter:
         DissertationModel.__name__: GOSTDissertation,
     }
 
-    def __init__(self, models: list[BaseModel]) -> None:
+    def __init__(self, models: Iterable[BaseModel], keys: Optional[Sequence[str]] = None) -> None:
         """
         Конструктор.
 
-        :param models: Список объектов для форматирования
-        """
-
-        formatted_items = []
-        for model in models:
-            formatted_items.append(self.formatters_map.get(type(model).__name__)(model))  # type: ignore
-
-        self.formatted_items = formatted_items
-
-    def format(self) -> list[BaseCitationStyle]:
-        """
-        Форматирование списка источников.
+        Строки источников форматируются при первом обращении к ним (см. `BaseCitationStyle.formatted`).
 
-        :return:
+        :param models: Список объектов для форматирования
+        :param keys: Ранее сохраненные ключи сортировки объектов
         """
 
-        return sorted(self.formatted_items, key=lambda item: item.formatted)
+        super().__init__(
+            [self.formatters_map.get(model_name(model))(model) for model in models],  # type: ignore
+            keys,
+        )
@@ -0,0 +1,216 @@
+"""
+Инкрементальная пересборка выходных файлов по изменениям входного файла.
+
+Манифест предыдущего запуска хранит отпечатки строк каждого листа и отсортированные
+отформатированные строки каждого стиля цитирования. При следующем запуске читаются,
+форматируются и вставляются в отсортированные списки только добавленные строки,
+а удаленные строки исключаются из списков.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+from bisect import insort
+from collections import Counter
+from pathlib import Path
+from typing import Any, Iterable, Optional, Type
+
+from formatters.collation import collate
+from logger import get_logger
+from pipeline import CitationPipeline, render_files
+from readers.reader import SourcesReader
+from renderer import Renderer
+
+
+logger = get_logger(__name__)
+
+# версия формата манифеста
+MANIFEST_VERSION = 1
+
+
+def fingerprint(sheet: str, row: tuple[Any, ...]) -> str:
+    """
+    Получение отпечатка строки листа рабочей книги.
+
+    :param sheet: Наименование листа.
+    :param row: Кортеж значений ячеек строки.
+    :return: Хеш SHA-1 в шестнадцатеричном виде.
+    """
+
+    return hashlib.sha1(repr((sheet, row)).encode("utf-8")).hexdigest()
+
+
+def entry_order(entry: list) -> tuple[str, str]:
+    """
+    Получение ключа упорядочивания записи манифеста (совпадает с порядком `BaseCitationFormatter.format`).
+
+    :param entry: Запись из ключа сортировки, отформатированной строки и отпечатка строки листа.
+    :return:
+    """
+
+    return entry[0], collate(entry[1])
+
+
+class IncrementalBuild:
+    """
+    Инкрементальное оформление списка источников с манифестом предыдущего запуска.
+    """
+
+    def __init__(self, path: Path | str, styles: Iterable[str]) -> None:
+        """
+        Конструктор.
+
+        :param path: Путь к файлу манифеста.
+        :param styles: Наименования стилей цитирования (см. `CitationPipeline.citation_formatters`).
+        """
+
+        self.path = Path(path)
+        self.styles = tuple(style.upper() for style in styles)
+        self.signature = self.get_signature()
+
+        self.sheets: dict[str, dict[str, int]] = {}
+        self.entries: dict[str, list[list]] = {style: [] for style in self.styles}
+        self.stats = {"added": 0, "removed": 0, "unchanged": 0}
+
+        manifest = self.load()
+        if manifest is not None:
+            self.sheets = manifest["sheets"]
+            self.entries = manifest["entries"]
+
+    def get_signature(self) -> str:
+        """
+        Получение подписи правил форматирования (при ее изменении выполняется полная пересборка).
+
+        :return: Хеш SHA-1 в шестнадцатеричном виде.
+        """
+
+        rules = [
+            [style, name, formatter.template.template, formatter.version]
+            for style in self.styles
+            for name, formatter in CitationPipeline.citation_formatters[style].formatters_map.items()
+        ]
+
+        return hashlib.sha1(json.dumps(rules, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+    def load(self) -> Optional[dict]:
+        """
+        Загрузка манифеста предыдущего запуска.
+
+        :return: Манифест или `None`, если манифест отсутствует или создан для других правил форматирования.
+        """
+
+        if not self.path.exists():
+            return None
+
+        with open(self.path, encoding="utf-8") as file:
+            manifest = json.load(file)
+
+        if manifest.get("version") != MANIFEST_VERSION or manifest.get("signature") != self.signature:
+            logger.info("Манифест создан для других правил форматирования, выполняется полная пересборка ...")
+            return None
+
+        return manifest
+
+    def save(self) -> None:
+        """
+        Сохранение манифеста.
+        """
+
+        manifest = {
+            "version": MANIFEST_VERSION,
+            "signature": self.signature,
+            "sheets": self.sheets,
+            "entries": self.entries,
+        }
+        with open(self.path, "w", encoding="utf-8") as file:
+            json.dump(manifest, file, ensure_ascii=False)
+
+    def update(self, reader: SourcesReader) -> dict[str, int]:  # pylint: disable=too-many-locals
+        """
+        Обновление отсортированных списков по изменениям строк входного файла.
+
+        :param reader: Читатель входного файла.
+        :return: Количество добавленных, удаленных и неизмененных строк.
+        """
+
+        formatters_maps = {style: CitationPipeline.citation_formatters[style].formatters_map for style in self.styles}
+        removed: Counter = Counter()
+        added = []
+
+        for reader_class in reader.readers:
+            sheet_reader = reader_class(reader.workbook, reader.trusted)  # type: ignore
+            previous = self.sheets.get(sheet_reader.sheet, {})
+
+            current: Counter = Counter()
+            for row in sheet_reader.iter_rows():
+                key = fingerprint(sheet_reader.sheet, row)
+                current[key] += 1
+                # модели создаются только для строк, отсутствовавших в предыдущем запуске
+                if current[key] > previous.get(key, 0):
+                    added.append((key, sheet_reader.parse(row)))
+
+            for key, count in previous.items():
+                if count > current[key]:
+                    removed[key] += count - current[key]
+
+            self.sheets[sheet_reader.sheet] = dict(current)
+
+        self.stats = {
+            "added": len(added),
+            "removed": sum(removed.values()),
+            "unchanged": sum(sum(counts.values()) for counts in self.sheets.values()) - len(added),
+        }
+
+        for style in self.styles:
+            entries = self.entries[style]
+
+            if removed:
+                remaining = removed.copy()
+                kept = []
+                for entry in entries:
+                    if remaining[entry[2]] > 0:
+                        remaining[entry[2]] -= 1
+                    else:
+                        kept.append(entry)
+                entries = kept
+
+            for key, model in added:
+                item = formatters_maps[style][type(model).__name__](model)
+                insort(entries, [item.sort_key, item.formatted, key], key=entry_order)
+
+            self.entries[style] = entries
+
+        logger.info(
+            "Изменения входного файла: добавлено – %s, удалено – %s, без изменений – %s.",
+            self.stats["added"],
+            self.stats["removed"],
+            self.stats["unchanged"],
+        )
+
+        return self.stats
+
+    def rows(self, style: str) -> list[str]:
+        """
+        Получение отсортированных отформатированных строк для стиля цитирования.
+
+        :param style: Наименование стиля цитирования.
+        :return:
+        """
+
+        return [entry[1] for entry in self.entries[style.upper()]]
+
+    def render(
+        self,
+        paths: dict[str, Path | str],
+        renderer: Type[Renderer] = Renderer,
+        max_workers: Optional[int] = None,
+    ) -> None:
+        """
+        Генерация выходных файлов для стилей цитирования.
+
+        :param paths: Пути к выходным файлам по наименованиям стилей цитирования.
+        :param renderer: Класс генерации выходного файла.
+        :param max_workers: Максимальное количество процессов (по умолчанию – по количеству файлов).
+        """
+
+        render_files([(self.rows(style), path) for style, path in paths.items()], renderer, max_workers)
@@ -1,15 +1,212 @@
 """
 Функции для логирования.
+
+Обработчики логов создаются один раз для процесса и используются всеми логгерами модулей,
+поэтому повторные вызовы :func:`get_logger` не добавляют обработчики и не открывают новые файлы.
+Файл логов записывает (и переименовывает при превышении размера) только основной процесс:
+дочерние процессы пулов передают ему записи через очередь (см. :class:`SharedFileHandler`).
 """
+import atexit
 import logging
+import multiprocessing
+import os
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Any, Optional
+
+from settings import (
+    LOGGING_ASYNC,
+    LOGGING_BACKUP_COUNT,
+    LOGGING_FILE_NAME,
+    LOGGING_FORMAT,
+    LOGGING_LEVEL,
+    LOGGING_MAX_BYTES,
+    LOGGING_PATH,
+)
+
+
+def create_file_handler(
+    path: str,
+    max_bytes: int = LOGGING_MAX_BYTES,
+    backup_count: int = LOGGING_BACKUP_COUNT,
+) -> RotatingFileHandler:
+    """
+    Создание обработчика записи логов в файл ограниченного размера.
+
+    :param path: Путь к файлу логов
+    :param max_bytes: Максимальный размер файла логов в байтах (после превышения файл переименовывается)
+    :param backup_count: Количество сохраняемых предыдущих файлов логов
+    :return:
+    """
+
+    # файл открывается при первой записи (процессы без логов не держат открытых файлов)
+    return RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8", delay=True)
+
+
+class SharedFileHandler(logging.Handler):
+    """
+    Обработчик записи логов в файл, общий для процесса и его дочерних процессов.
+
+    Файл открывает и переименовывает только процесс, создавший обработчик. Перед запуском первого дочернего процесса
+    создается очередь записей, из которой поток основного процесса записывает записи в файл. Дочерние процессы,
+    запущенные копированием (`fork`), получают обработчик с очередью, а запущенные заново (`spawn`) –
+    подключаются к очереди при запуске (см. :func:`attach_worker`).
+    """
+
+    def __init__(self, path: str, max_bytes: int = LOGGING_MAX_BYTES, backup_count: int = LOGGING_BACKUP_COUNT) -> None:
+        """
+        Конструктор.
+
+        :param path: Путь к файлу логов
+        :param max_bytes: Максимальный размер файла логов в байтах
+        :param backup_count: Количество сохраняемых предыдущих файлов логов
+        """
+
+        super().__init__()
+        # процесс, записывающий файл
+        self.pid = os.getpid()
+        self.target = create_file_handler(path, max_bytes, backup_count)
+        # передача записей дочерних процессов в очередь основного процесса
+        self.sender: Optional[QueueHandler] = None
+        self.listener: Optional[QueueListener] = None
+        os.register_at_fork(before=self.share)
+
+    def setFormatter(self, fmt: Optional[logging.Formatter]) -> None:
+        # записи форматируются при записи в файл, дочерние процессы передают только текст сообщения
+        self.target.setFormatter(fmt)
 
-from settings import LOGGING_FORMAT, LOGGING_LEVEL, LOGGING_PATH
+    def share(self) -> Any:
+        """
+        Получение очереди записей дочерних процессов (создается в основном процессе при первом вызове).
+
+        :return: Очередь записей (`multiprocessing.Queue`).
+        """
+
+        if self.sender is None and os.getpid() == self.pid:
+            # очередь контекста `spawn` передается как процессам, запущенным заново, так и копированием
+            records = multiprocessing.get_context("spawn").Queue()
+            self.sender = QueueHandler(records)
+            self.listener = QueueListener(records, self.target)
+            self.listener.start()
+
+        return self.sender.queue if self.sender else None
+
+    def attach(self, records: Any) -> None:
+        """
+        Подключение к очереди записей основного процесса (в процессе, запущенном заново).
+
+        :param records: Очередь записей основного процесса (см. :meth:`share`).
+        """
+
+        self.pid = os.getppid()
+        self.sender = QueueHandler(records)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if os.getpid() == self.pid:
+            self.target.handle(record)
+        elif self.sender is not None:
+            self.sender.emit(record)
+
+    def close(self) -> None:
+        if self.listener is not None and os.getpid() == self.pid:
+            # записи, оставшиеся в очереди, записываются до закрытия файла
+            self.listener.stop()
+            self.listener = None
+        self.target.close()
+        super().close()
+
+
+# обработчики записи логов в файл процесса
+_file_handlers: list[SharedFileHandler] = []
+# обработчики логов процесса по формату и режиму записи
+_handlers: dict[tuple[str, bool], tuple[logging.Handler, ...]] = {}
+
+
+def get_handlers(
+    logging_format: str = LOGGING_FORMAT, asynchronous: bool = LOGGING_ASYNC
+) -> tuple[logging.Handler, ...]:
+    """
+    Получение обработчиков логов процесса (создаются один раз для каждого формата).
+
+    :param logging_format: Формат логов
+    :param asynchronous: Запись логов в отдельном потоке (вызывающий код только помещает запись в очередь)
+    :return:
+    """
+
+    key = (logging_format, asynchronous)
+    if key not in _handlers:
+        _handlers[key] = create_handlers(logging_format, asynchronous)
+
+    return _handlers[key]
+
+
+def create_handlers(logging_format: str, asynchronous: bool) -> tuple[logging.Handler, ...]:
+    """
+    Создание обработчиков логов.
+
+    :param logging_format: Формат логов
+    :param asynchronous: Запись логов в отдельном потоке
+    :return:
+    """
+
+    formatter = logging.Formatter(logging_format)
+
+    # запись логов в файл (общий для дочерних процессов)
+    file_handler = SharedFileHandler(os.path.join(LOGGING_PATH, LOGGING_FILE_NAME))
+    file_handler.setFormatter(formatter)
+    _file_handlers.append(file_handler)
+
+    # вывод логов в консоль
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(formatter)
+
+    if not asynchronous:
+        return file_handler, stream_handler
+
+    records: queue.SimpleQueue = queue.SimpleQueue()
+    listener = QueueListener(records, file_handler, stream_handler, respect_handler_level=True)
+    listener.start()
+    # поток записи не копируется в дочерний процесс, поэтому запускается в нем заново
+    os.register_at_fork(after_in_child=listener.start)
+    # записи, оставшиеся в очереди, записываются при завершении процесса
+    atexit.register(listener.stop)
+
+    return (QueueHandler(records),)
+
+
+def share_worker() -> tuple[Any]:
+    """
+    Получение очереди записей логов основного процесса для процессов пула, запускаемых заново.
+
+    .. code-block::
+
+        ProcessPoolExecutor(mp_context=get_context("spawn"), initializer=attach_worker, initargs=share_worker())
+
+    :return: Аргументы :func:`attach_worker`.
+    """
+
+    get_handlers()
+
+    return (_file_handlers[0].share(),)
+
+
+def attach_worker(records: Any) -> None:
+    """
+    Подключение записи логов в файл процесса пула к очереди основного процесса.
+
+    :param records: Очередь записей основного процесса (см. :func:`share_worker`).
+    """
+
+    get_handlers()
+    for handler in _file_handlers:
+        handler.attach(records)
 
 
 def get_logger(
     module_name: str,
     logging_level: str = LOGGING_LEVEL,
     logging_format: str = LOGGING_FORMAT,
+    asynchronous: bool = LOGGING_ASYNC,
 ) -> logging.Logger:
     """
     Настройка логгера.
@@ -17,19 +214,15 @@ def get_logger(
     :param module_name: Наименование модуля
     :param logging_level: Уровень логирования
     :param logging_format: Формат логов
+    :param asynchronous: Запись логов в отдельном потоке (вызывающий код только помещает запись в очередь)
     :return:
     """
 
-    # запись логов в файлы
     logger = logging.getLogger(module_name)
     logger.setLevel(logging_level)
-    file_handler = logging.FileHandler(f"{LOGGING_PATH}/{module_name}.log")
-    file_handler.setFormatter(logging.Formatter(logging_format))
-    logger.addHandler(file_handler)
 
-    # вывод логов в консоль
-    stream_handler = logging.StreamHandler()
-    stream_handler.setFormatter(logging.Formatter(logging_format))
-    logger.addHandler(stream_handler)
+    for handler in get_handlers(logging_format, asynchronous):
+        # обработчик, уже добавленный логгеру, повторно не добавляется
+        logger.addHandler(handler)
 
     return logger
@@ -2,15 +2,22 @@
 Запуск приложения.
 """
 from enum import Enum, unique
+from pathlib import Path
+from typing import Iterable, Optional
 
 import click
+from pydantic import BaseModel
 
-from formatters.styles.gost import GOSTCitationFormatter
-from formatters.styles.apa import APACitationFormatter
+from formatters.cache import FormattedCache
+from incremental import IncrementalBuild
 from logger import get_logger
-from readers.reader import SourcesReader
-from renderer import Renderer
-from settings import INPUT_FILE_PATH, OUTPUT_FILE_PATH, OUTPUT_FILE_PATH_APA
+from pipeline import CitationPipeline
+from profiling import profiler, stage
+from readers.reader import BACKENDS, SourcesReader, open_reader
+from readers.snapshot import Snapshot, write_snapshot
+from readers.store import RecordStore
+from renderer import RENDERERS
+from settings import CACHE_FILE_PATH, INPUT_FILE_PATH, OUTPUT_FILE_PATH, OUTPUT_FILE_PATH_APA, READER_BACKEND
 
 logger = get_logger(__name__)
 
@@ -26,6 +33,89 @@ class CitationEnum(Enum):
     APA = "apa"  # American Psychological Association
 
 
+def generate(  # pylint: disable=too-many-arguments,too-many-locals
+    path_input: str,
+    paths: dict[str, str],
+    workers: int = 1,
+    trusted: bool = False,
+    chunk_size: Optional[int] = None,
+    path_cache: str = "",
+    path_manifest: Optional[str] = None,
+    render_workers: Optional[int] = None,
+    output_format: str = "docx",
+    backend: str = READER_BACKEND,
+    path_snapshot: Optional[str] = None,
+    path_save_snapshot: Optional[str] = None,
+    columnar: bool = False,
+    format_workers: int = 1,
+) -> int:
+    """
+    Оформление списка источников входного файла и генерация выходных файлов.
+
+    :param str path_input: Путь к входному файлу (Excel, JSON Lines или CSV)
+    :param dict[str, str] paths: Пути к выходным файлам по наименованиям стилей цитирования
+    :param int workers: Количество процессов для параллельного чтения листов входного файла
+    :param bool trusted: Чтение входного файла без валидации
+    :param Optional[int] chunk_size: Размер порции для внешней сортировки
+    :param str path_cache: Путь к файлу кеша отформатированных строк
+    :param Optional[str] path_manifest: Путь к манифесту для инкрементальной пересборки
+    :param Optional[int] render_workers: Количество процессов для генерации выходных файлов
+    :param str output_format: Формат выходных файлов (см. `renderer.RENDERERS`)
+    :param str backend: Способ чтения входного файла Excel (см. `readers.reader.BACKENDS`)
+    :param Optional[str] path_snapshot: Путь к снимку источников для чтения вместо входного файла
+    :param Optional[str] path_save_snapshot: Путь для сохранения снимка прочитанных источников
+    :param bool columnar: Хранение источников в колоночном хранилище вместо списка моделей (меньше памяти)
+    :param int format_workers: Количество процессов для параллельного форматирования каждого стиля порциями
+    :return: Количество источников.
+    """
+
+    styles = tuple(paths)
+    renderer = RENDERERS[output_format]
+
+    if path_manifest:
+        if path_snapshot or not isinstance(open_reader(path_input), SourcesReader):
+            raise ValueError("Инкрементальная пересборка поддерживается только для входных файлов Excel.")
+
+        build = IncrementalBuild(path_manifest, styles)
+        with SourcesReader(path_input, trusted=trusted, backend=backend) as workbook:
+            build.update(workbook)
+
+        logger.info("Генерация выходных файлов ...")
+        build.render(paths, renderer, render_workers)  # type: ignore
+        build.save()
+
+        return len(build.rows(styles[0]))
+
+    cache = FormattedCache(path_cache) if path_cache else None
+    try:
+        reader = Snapshot(path_snapshot) if path_snapshot else open_reader(path_input, trusted=trusted, backend=backend)
+        models: Iterable[BaseModel]
+        with reader:
+            if path_save_snapshot:
+                models = reader.read(workers)
+                with stage("save_snapshot") as timing:
+                    timing.rows = write_snapshot(path_save_snapshot, models)
+            elif chunk_size or path_snapshot or (columnar and workers == 1):
+                # модели читаются потоком без накопления в памяти (при внешней сортировке, из снимка
+                # и при переносе в колоночное хранилище)
+                models = reader.iter_models()
+            else:
+                models = reader.read(workers)
+            if columnar and not chunk_size:
+                pipeline = CitationPipeline(RecordStore(models), styles, cache=cache, format_workers=format_workers)
+            else:
+                pipeline = CitationPipeline(models, styles, chunk_size, cache, format_workers)
+
+        logger.info("Генерация выходных файлов ...")
+        pipeline.render(paths, renderer, render_workers)  # type: ignore
+    finally:
+        if cache is not None:
+            cache.log_stats()
+            cache.close()
+
+    return len(pipeline)
+
+
 @click.command()
 @click.option(
     "--citation",
@@ -43,7 +133,7 @@ class CitationEnum(Enum):
     type=str,
     default=INPUT_FILE_PATH,
     show_default=True,
-    help="Путь к входному файлу",
+    help="Путь к входному файлу (*.xlsx, *.jsonl или *.csv)",
 )
 @click.option(
     "--path_output",
@@ -52,13 +142,131 @@ class CitationEnum(Enum):
     type=str,
     default=OUTPUT_FILE_PATH,
     show_default=True,
-    help="Путь к выходному файлу",
+    help="Путь к выходному файлу (`-` – стандартный поток вывода)",
+)
+@click.option(
+    "--format",
+    "-f",
+    "output_format",
+    type=click.Choice(list(RENDERERS), case_sensitive=False),
+    default="docx",
+    show_default=True,
+    help="Формат выходного файла",
+)
+@click.option(
+    "--backend",
+    "backend",
+    type=click.Choice(BACKENDS, case_sensitive=False),
+    default=READER_BACKEND,
+    show_default=True,
+    help="Способ чтения входного файла Excel (xlsx – собственный потоковый разбор XML без openpyxl)",
+)
+@click.option(
+    "--workers",
+    "-w",
+    "workers",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Количество процессов для параллельного чтения листов входного файла",
+)
+@click.option(
+    "--trusted",
+    "trusted",
+    is_flag=True,
+    default=False,
+    help="Чтение входного файла без валидации (для ранее проверенных файлов)",
+)
+@click.option(
+    "--validate",
+    "validate",
+    is_flag=True,
+    default=False,
+    help="Только проверка входного файла с выводом всех ошибочных строк",
+)
+@click.option(
+    "--chunk_size",
+    "chunk_size",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Размер порции для внешней сортировки списков источников, не помещающихся в память",
 )
-def process_input(
+@click.option(
+    "--cache",
+    "path_cache",
+    type=str,
+    default=CACHE_FILE_PATH,
+    help="Путь к файлу кеша отформатированных строк между запусками",
+)
+@click.option(
+    "--manifest",
+    "path_manifest",
+    type=str,
+    default=None,
+    help="Путь к манифесту предыдущего запуска для пересборки только по изменившимся строкам",
+)
+@click.option(
+    "--from_snapshot",
+    "path_snapshot",
+    type=click.Path(exists=True, dir_okay=False),
+    default=None,
+    help="Путь к снимку источников, сохраненному ранее (входной файл не читается)",
+)
+@click.option(
+    "--save_snapshot",
+    "path_save_snapshot",
+    type=str,
+    default=None,
+    help="Путь для сохранения снимка прочитанных источников для последующих запусков",
+)
+@click.option(
+    "--columnar",
+    "columnar",
+    is_flag=True,
+    default=False,
+    help="Хранение источников в колоночном хранилище вместо моделей (для очень больших списков)",
+)
+@click.option(
+    "--format_workers",
+    "format_workers",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Количество процессов для параллельного форматирования каждого стиля порциями (без кеша)",
+)
+@click.option(
+    "--profile",
+    "path_profile",
+    type=str,
+    default=None,
+    help="Путь к JSON-отчету с временем, CPU, пиковой памятью и количеством строк по этапам обработки",
+)
+@click.option(
+    "--pstats",
+    "path_pstats",
+    type=str,
+    default=None,
+    help="Путь к файлу профилирования вызовов функций (cProfile/pstats)",
+)
+def process_input(  # pylint: disable=too-many-arguments,too-many-locals
     citation: str = CitationEnum.GOST.name,
     path_input: str = INPUT_FILE_PATH,
     path_output: str = OUTPUT_FILE_PATH,
-    path_output_apa: str = OUTPUT_FILE_PATH_APA
+    path_output_apa: str = OUTPUT_FILE_PATH_APA,
+    output_format: str = "docx",
+    backend: str = READER_BACKEND,
+    workers: int = 1,
+    trusted: bool = False,
+    validate: bool = False,
+    chunk_size: Optional[int] = None,
+    path_cache: str = CACHE_FILE_PATH,
+    path_manifest: Optional[str] = None,
+    path_snapshot: Optional[str] = None,
+    path_save_snapshot: Optional[str] = None,
+    columnar: bool = False,
+    format_workers: int = 1,
+    path_profile: Optional[str] = None,
+    path_pstats: Optional[str] = None,
 ) -> None:
     """
     Генерация файла Word с оформленным библиографическим списком.
@@ -67,33 +275,86 @@ def process_input(
     :param str path_input: Путь к входному файлу
     :param str path_output: Путь к выходному файлу для GHOST
     :param str path_output_apa: Путь к выходному файлу для APA 7th
+    :param str output_format: Формат выходных файлов
+    :param str backend: Способ чтения входного файла Excel
+    :param int workers: Количество процессов для параллельного чтения листов входного файла
+    :param bool trusted: Чтение входного файла без валидации
+    :param bool validate: Только проверка входного файла
+    :param Optional[int] chunk_size: Размер порции для внешней сортировки
+    :param str path_cache: Путь к файлу кеша отформатированных строк
+    :param Optional[str] path_manifest: Путь к манифесту для инкрементальной пересборки
+    :param Optional[str] path_snapshot: Путь к снимку источников для чтения вместо входного файла
+    :param Optional[str] path_save_snapshot: Путь для сохранения снимка прочитанных источников
+    :param bool columnar: Хранение источников в колоночном хранилище
+    :param int format_workers: Количество процессов для параллельного форматирования каждого стиля
+    :param Optional[str] path_profile: Путь к JSON-отчету о замерах по этапам обработки
+    :param Optional[str] path_pstats: Путь к файлу профилирования вызовов функций
     """
 
+    output_format = output_format.lower()
+    if output_format != "docx":
+        # пути к выходным файлам по умолчанию получают расширение выбранного формата
+        suffix = RENDERERS[output_format].suffix
+        if path_output == OUTPUT_FILE_PATH:
+            path_output = str(Path(path_output).with_suffix(suffix))
+        if path_output_apa == OUTPUT_FILE_PATH_APA:
+            path_output_apa = str(Path(path_output_apa).with_suffix(suffix))
+
     logger.info(
         """Обработка команды с параметрами:
         - Стиль цитирования: %s.
         - Путь к входному файлу: %s.
         - Путь к выходному файлу GHOST: %s.
         - Путь к выходному файлу APA: %s.""",
-
         citation,
         path_input,
         path_output,
         path_output_apa,
     )
 
-    models = SourcesReader(path_input).read()
-    formatted_models = tuple(
-        str(item) for item in GOSTCitationFormatter(models).format()
-    )
+    backend = backend.lower()
+    if validate:
+        with open_reader(path_input, backend=backend) as reader:
+            errors = reader.validate()
+        for error in errors:
+            logger.error("Лист «%s», строка %s: %s", error.sheet, error.row, error.errors)
+        if errors:
+            raise click.ClickException(f"Количество ошибочных строк: {len(errors)}.")
 
-    formatted_models_apa = tuple(
-        str(item) for item in APACitationFormatter(models).format()
-    )
+        logger.info("Проверка входного файла успешно завершена.")
+        return
+
+    profiling = bool(path_profile or path_pstats)
+    if profiling:
+        profiler.start(pstats=bool(path_pstats))
 
-    logger.info("Генерация выходных файлов ...")
-    Renderer(formatted_models).render(path_output)
-    Renderer(formatted_models_apa).render(path_output_apa)
+    try:
+        with stage("generate") as timing:
+            timing.rows = generate(
+                path_input,
+                {CitationEnum.GOST.name: path_output, CitationEnum.APA.name: path_output_apa},
+                workers=workers,
+                trusted=trusted,
+                chunk_size=chunk_size,
+                path_cache=path_cache,
+                path_manifest=path_manifest,
+                # при замерах выходные файлы генерируются в текущем процессе, чтобы учесть этапы генерации
+                render_workers=1 if profiling else None,
+                output_format=output_format,
+                backend=backend,
+                path_snapshot=path_snapshot,
+                path_save_snapshot=path_save_snapshot,
+                columnar=columnar,
+                format_workers=format_workers,
+            )
+    finally:
+        if profiling:
+            profiler.stop()
+            profiler.log()
+            if path_profile:
+                profiler.save(path_profile)
+            if path_pstats:
+                profiler.dump_stats(path_pstats)
 
     logger.info("Команда успешно завершена.")
 
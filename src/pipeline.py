@@ -0,0 +1,212 @@
+"""
+Конвейер оформления списка источников сразу в нескольких стилях цитирования.
+"""
+from __future__ import annotations
+
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, Iterable, Optional, Sequence, Sized, Type
+
+from pydantic import BaseModel
+
+from formatters.base import BaseCitationFormatter
+from formatters.cache import FormattedCache
+from formatters.external import ExternalSorter
+from formatters.models import model_name
+from formatters.parallel import format_parallel
+from formatters.styles.apa import APACitationFormatter
+from formatters.styles.gost import GOSTCitationFormatter
+from logger import get_logger
+from profiling import stage
+from renderer import Renderer
+
+
+logger = get_logger(__name__)
+
+
+def render_file(renderer: Type[Renderer], rows: Iterable[str], path: Path | str) -> None:
+    """
+    Генерация выходного файла (выполняется в отдельном процессе).
+
+    :param renderer: Класс генерации выходного файла.
+    :param rows: Отформатированные строки списка источников.
+    :param path: Путь для сохранения выходного файла.
+    """
+
+    with stage(f"render:{Path(path).name}", len(rows) if isinstance(rows, Sized) else None):
+        renderer(rows).render(path)
+
+
+def render_files(
+    jobs: list[tuple[Iterable[str], Path | str]],
+    renderer: Type[Renderer] = Renderer,
+    max_workers: Optional[int] = None,
+) -> None:
+    """
+    Параллельная генерация выходных файлов в пуле процессов.
+
+    :param jobs: Пары из отформатированных строк и пути к выходному файлу.
+    :param renderer: Класс генерации выходного файла.
+    :param max_workers: Максимальное количество процессов (по умолчанию – по количеству файлов).
+    """
+
+    if len(jobs) < 2 or max_workers == 1:
+        for rows, path in jobs:
+            render_file(renderer, rows, path)
+        return
+
+    with ProcessPoolExecutor(max_workers=max_workers or len(jobs)) as executor:
+        futures = [executor.submit(render_file, renderer, rows, path) for rows, path in jobs]
+        for future in futures:
+            future.result()
+
+
+class CitationPipeline:
+    """
+    Оформление списка источников в нескольких стилях цитирования за один проход по моделям.
+    """
+
+    # зарегистрированные стили цитирования
+    citation_formatters: dict[str, Type[BaseCitationFormatter]] = {
+        "GOST": GOSTCitationFormatter,
+        "APA": APACitationFormatter,
+    }
+
+    def __init__(
+        self,
+        models: Iterable[BaseModel],
+        styles: Iterable[str],
+        chunk_size: Optional[int] = None,
+        cache: Optional[FormattedCache] = None,
+        format_workers: Optional[int] = None,
+    ) -> None:
+        """
+        Конструктор.
+
+        :param models: Модели источников (достаточно однократного прохода, например, генератора).
+        :param styles: Наименования стилей цитирования (см. `citation_formatters`).
+        :param chunk_size: Размер порции для внешней сортировки (по умолчанию сортировка выполняется в памяти).
+        :param cache: Кеш отформатированных строк.
+        :param format_workers: Количество процессов для параллельного форматирования каждого стиля порциями
+            (без внешней сортировки и кеша).
+        """
+
+        self.styles = tuple(style.upper() for style in styles)
+        self.cache = cache
+        self.format_workers = format_workers
+        self.models: Optional[Sequence[BaseModel]] = None
+        self.formatters: dict[str, BaseCitationFormatter] = {}
+        self.sorters: dict[str, ExternalSorter] = {}
+        if format_workers and format_workers > 1:
+            if not chunk_size and cache is None:
+                # источники форматируются в пуле процессов при получении строк стиля (см. `rows`)
+                with stage("collect") as timing:
+                    self.models = models if isinstance(models, Sequence) else list(models)
+                    timing.rows = len(self.models)
+                return
+
+            logger.warning("Параллельное форматирование не используется с внешней сортировкой и кешем.")
+
+        formatters_maps = [self.citation_formatters[style].formatters_map for style in self.styles]
+
+        collectors: list[Callable] = []
+        for style in self.styles:
+            if chunk_size:
+                self.sorters[style] = ExternalSorter(chunk_size, cache=cache)
+                collectors.append(self.sorters[style].add)
+            else:
+                self.formatters[style] = BaseCitationFormatter([])
+                collectors.append(self.formatters[style].formatted_items.append)
+
+        with stage("collect") as timing:
+            for model in models:
+                name = model_name(model)
+                for collect, formatters_map in zip(collectors, formatters_maps):
+                    collect(formatters_map[name](model))
+            timing.rows = len(self)
+
+        if cache is not None:
+            for style, formatter in self.formatters.items():
+                with stage(f"cache:{style}", len(formatter)):
+                    cache.apply(formatter.formatted_items)
+
+    def __len__(self) -> int:
+        if not self.styles:
+            return 0
+
+        if self.models is not None:
+            return len(self.models)
+
+        style = self.styles[0]
+
+        return len(self.sorters[style]) if style in self.sorters else len(self.formatters[style])
+
+    def rows(self, style: str) -> Iterable[str]:
+        """
+        Получение отсортированных отформатированных строк для стиля цитирования.
+
+        При внешней сортировке строки возвращаются потоком из временных файлов (однократно).
+
+        :param style: Наименование стиля цитирования.
+        :return:
+        """
+
+        style = style.upper()
+        if style in self.sorters:
+            return self.sorters[style]
+
+        if self.models is not None:
+            formatter_cls = self.citation_formatters[style]
+            with stage(f"format:{style}", len(self.models)):
+                rows = tuple(format_parallel(formatter_cls, self.models, self.format_workers))
+            logger.info("Стиль %s: отформатировано источников – %s (параллельно).", style, len(rows))
+
+            return rows
+
+        formatter = self.formatters[style]
+        with stage(f"sort:{style}", len(formatter)):
+            items = formatter.format()
+        with stage(f"format:{style}", len(items)):
+            rows = tuple(str(item) for item in items)
+
+        # итоги этапа логируются одной записью, а не по каждому источнику
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Стиль %s: отформатировано источников – %s %s.", style, len(rows), formatter.summary())
+
+        return rows
+
+    def format(self) -> dict[str, tuple[str, ...]]:
+        """
+        Форматирование и сортировка списка источников для каждого стиля цитирования.
+
+        :return: Отформатированные строки по наименованиям стилей цитирования.
+        """
+
+        return {style: tuple(self.rows(style)) for style in self.styles}
+
+    def render(
+        self,
+        paths: dict[str, Path | str],
+        renderer: Type[Renderer] = Renderer,
+        max_workers: Optional[int] = None,
+    ) -> None:
+        """
+        Генерация выходных файлов для стилей цитирования.
+
+        Файлы для разных стилей генерируются параллельно в пуле процессов.
+
+        :param paths: Пути к выходным файлам по наименованиям стилей цитирования.
+        :param renderer: Класс генерации выходного файла.
+        :param max_workers: Максимальное количество процессов (по умолчанию – по количеству файлов).
+        """
+
+        # временные файлы внешней сортировки передаются процессам генерации вместо самих строк
+        # (при использовании кеша строки форматируются в текущем процессе)
+        for style, sorter in self.sorters.items():
+            if sorter.runs or self.cache is not None:
+                with stage(f"sort:{style}", len(sorter)):
+                    sorter.flush()
+                logger.info("Стиль %s: источников – %s (внешняя сортировка).", style, len(sorter))
+
+        render_files([(self.rows(style), path) for style, path in paths.items()], renderer, max_workers)
@@ -0,0 +1,235 @@
+"""
+Замеры времени и памяти по этапам обработки.
+
+Этапы размечаются контекстным менеджером :func:`stage`. Пока замеры не включены (:meth:`Profiler.start`),
+разметка не выполняет никаких измерений:
+
+.. code-block::
+
+    with stage("read:Книга") as timing:
+        models = reader.read()
+        timing.rows = len(models)
+"""
+from __future__ import annotations
+
+import cProfile
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import ContextManager, Iterator, Optional
+
+from pydantic import BaseModel
+
+from logger import get_logger
+
+
+logger = get_logger(__name__)
+
+
+class StageReport(BaseModel):
+    """
+    Результаты замеров этапа обработки:
+
+    .. code-block::
+
+        StageReport(
+            name="read:Книга",
+            depth=1,
+            wall=0.125,
+            cpu=0.12,
+            peak_memory=1048576,
+            rows=1000,
+        )
+    """
+
+    name: str
+    depth: int
+    wall: float
+    cpu: float
+    peak_memory: Optional[int]
+    rows: Optional[int]
+
+
+class StageTimer:
+    """
+    Выполняющийся этап обработки.
+    """
+
+    __slots__ = ("name", "rows", "peak_memory")
+
+    def __init__(self, name: str, rows: Optional[int] = None) -> None:
+        """
+        Конструктор.
+
+        :param name: Наименование этапа.
+        :param rows: Количество обработанных строк (может быть задано по окончании этапа).
+        """
+
+        self.name = name
+        self.rows = rows
+        # наибольший пик памяти вложенных этапов (пик памяти сбрасывается при входе во вложенный этап)
+        self.peak_memory = 0
+
+
+class Profiler:
+    """
+    Сбор замеров по этапам обработки.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.stages: list[StageReport] = []
+        self.profile: Optional[cProfile.Profile] = None
+        self._stack: list[StageTimer] = []
+
+    def start(self, memory: bool = True, pstats: bool = False) -> None:
+        """
+        Включение замеров.
+
+        :param memory: Замеры пикового расхода памяти (`tracemalloc` замедляет выполнение).
+        :param pstats: Профилирование вызовов функций (`cProfile`).
+        """
+
+        self.enabled = True
+        self.stages = []
+        if memory:
+            tracemalloc.start()
+        if pstats:
+            self.profile = cProfile.Profile()
+            self.profile.enable()
+
+    def stop(self) -> None:
+        """
+        Выключение замеров.
+        """
+
+        if self.profile is not None:
+            self.profile.disable()
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self.enabled = False
+
+    @contextmanager
+    def stage(self, name: str, rows: Optional[int] = None) -> Iterator[StageTimer]:
+        """
+        Замеры этапа обработки.
+
+        :param name: Наименование этапа.
+        :param rows: Количество обрабатываемых строк (может быть задано атрибутом `rows` по окончании этапа).
+        :return: Выполняющийся этап.
+        """
+
+        timer = StageTimer(name, rows)
+        if not self.enabled:
+            yield timer
+            return
+
+        memory = tracemalloc.is_tracing()
+        if memory:
+            if self._stack:
+                self._stack[-1].peak_memory = max(self._stack[-1].peak_memory, tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+
+        depth = len(self._stack)
+        self._stack.append(timer)
+        # отчет о вложенных этапах следует за отчетом об объемлющем этапе
+        index = len(self.stages)
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield timer
+        finally:
+            wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+            self._stack.pop()
+
+            peak_memory = None
+            if memory and tracemalloc.is_tracing():
+                peak_memory = max(timer.peak_memory, tracemalloc.get_traced_memory()[1])
+                if self._stack:
+                    self._stack[-1].peak_memory = max(self._stack[-1].peak_memory, peak_memory)
+
+            self.stages.insert(
+                index,
+                StageReport(name=name, depth=depth, wall=wall, cpu=cpu, peak_memory=peak_memory, rows=timer.rows),
+            )
+
+    def record(self, name: str, wall: float, cpu: float, rows: Optional[int] = None) -> None:
+        """
+        Добавление отчета об этапе, замеры которого накоплены вызывающим кодом.
+
+        Используется для операций, чередующихся с другими внутри потоковой обработки
+        (например, валидации моделей при чтении строк), время которых суммируется по частям.
+        Этап считается вложенным в выполняющийся этап; пик памяти не замеряется.
+
+        :param name: Наименование этапа.
+        :param wall: Суммарное время выполнения.
+        :param cpu: Суммарное процессорное время.
+        :param rows: Количество обработанных строк.
+        """
+
+        if self.enabled:
+            self.stages.append(
+                StageReport(name=name, depth=len(self._stack), wall=wall, cpu=cpu, peak_memory=None, rows=rows)
+            )
+
+    def report(self) -> dict:
+        """
+        Получение отчета о замерах.
+
+        :return: Замеры по этапам в порядке начала этапов.
+        """
+
+        return {"stages": [report.dict() for report in self.stages]}
+
+    def log(self) -> None:
+        """
+        Логирование замеров по этапам.
+        """
+
+        for report in self.stages:
+            logger.info(
+                "%s%s: %.3f с (CPU %.3f с), пик памяти: %s, строк: %s.",
+                "  " * report.depth,
+                report.name,
+                report.wall,
+                report.cpu,
+                report.peak_memory,
+                report.rows,
+            )
+
+    def save(self, path: Path | str) -> None:
+        """
+        Сохранение отчета о замерах в формате JSON.
+
+        :param path: Путь к файлу отчета.
+        """
+
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.report(), file, ensure_ascii=False, indent=2)
+
+    def dump_stats(self, path: Path | str) -> None:
+        """
+        Сохранение результатов профилирования вызовов функций (формат `pstats`).
+
+        :param path: Путь к файлу результатов.
+        """
+
+        if self.profile is not None:
+            self.profile.dump_stats(str(path))
+
+
+# замеры текущего процесса
+profiler = Profiler()
+
+
+def stage(name: str, rows: Optional[int] = None) -> ContextManager[StageTimer]:
+    """
+    Замеры этапа обработки в текущем процессе (см. :meth:`Profiler.stage`).
+
+    :param name: Наименование этапа.
+    :param rows: Количество обрабатываемых строк.
+    :return:
+    """
+
+    return profiler.stage(name, rows)
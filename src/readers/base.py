@@ -2,31 +2,129 @@
 Функции чтения исходного файла.
 """
 
+import time
 from abc import ABC, abstractmethod
 from datetime import date
-from typing import Type
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Iterator, NamedTuple, Type
 
 from openpyxl.workbook import Workbook
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 
 from logger import get_logger
+from profiling import profiler, stage
+from readers.xlsx import XLSXWorkbook
+
+if TYPE_CHECKING:
+    from pydantic.error_wrappers import ErrorDict
+else:
+    # описание ошибки валидации `pydantic` объявлено только для проверки типов
+    ErrorDict = dict
 
 logger = get_logger(__name__)
 
 
+def to_int(value: Any) -> int:
+    """
+    Преобразование значения ячейки в целое число.
+
+    :param value: Значение ячейки.
+    :return: Целое число.
+    """
+
+    return int(str(value))
+
+
+def to_str(value: Any) -> str:
+    """
+    Преобразование значения ячейки в строку без пробелов по краям.
+
+    :param value: Значение ячейки.
+    :return: Строка.
+    """
+
+    return str(value).strip()
+
+
+def to_date(value: Any) -> Any:
+    """
+    Преобразование даты из ячейки в строку формата `ДД.ММ.ГГГГ`.
+
+    :param value: Значение ячейки.
+    :return: Строка с датой или исходное значение, если ячейка не содержит дату.
+    """
+
+    return value.strftime("%d.%m.%Y") if isinstance(value, date) else value
+
+
+class Column(NamedTuple):
+    """
+    Описание столбца листа рабочей книги в плане чтения.
+    """
+
+    #: наименование атрибута модели
+    attr: str
+    #: индекс столбца
+    position: int
+    #: функция преобразования значения ячейки
+    convert: Callable[[Any], Any]
+
+
+class RowError(BaseModel):
+    """
+    Ошибка чтения строки листа рабочей книги:
+
+    .. code-block::
+
+        RowError(
+            sheet="Книга",
+            row=3,
+            errors=[{"loc": ("year",), "msg": "ensure this value is greater than 0", "type": "value_error"}],
+        )
+    """
+
+    sheet: str
+    row: int
+    errors: list[ErrorDict]
+
+
 class BaseReader(ABC):
     """
     Базовый класс читателя исходного файла.
     """
 
-    def __init__(self, workbook: Workbook) -> None:
+    # функции преобразования значений ячеек по типам данных из `attributes` (для совместимости)
+    converters: ClassVar[dict[type, Callable[[Any], Any]]] = {
+        int: to_int,
+        str: to_str,
+        date: to_date,
+    }
+
+    #: план чтения столбцов листа (наименование атрибута модели, индекс столбца, функция преобразования значения):
+    #:
+    #: .. code-block::
+    #:
+    #:     columns = (
+    #:         Column("authors", 0, to_str),
+    #:         Column("title", 1, to_str),
+    #:         Column("year", 5, to_int),
+    #:     )
+    columns: ClassVar[tuple[Column, ...]] = ()
+
+    def __init__(self, workbook: Workbook | XLSXWorkbook, trusted: bool = False) -> None:
         """
         Конструктор.
 
-        :param workbook: Рабочая книга Excel.
+        :param workbook: Рабочая книга Excel (`openpyxl` или `readers.xlsx`).
+        :param trusted: Создание моделей без валидации (для ранее проверенных исходных файлов).
         """
 
         self.workbook = workbook
+        self.trusted = trusted
+
+        reader = type(self)
+        if not reader.columns:
+            # столбцы описаны словарем `attributes`: план компилируется один раз для класса читателя
+            reader.columns = reader.compile(self.attributes)
 
     @property
     @abstractmethod
@@ -47,11 +145,13 @@ class BaseReader(ABC):
         """
 
     @property
-    @abstractmethod
     def attributes(self) -> dict:
         """
         Получение списка наименований атрибутов с информацией об индексе столбца и типе данных.
 
+        Сохранено для совместимости с читателями, не объявляющими план чтения `columns`:
+        атрибуты компилируются в такой же план (см. `compile`).
+
         .. code-block::
 
             {
@@ -64,43 +164,150 @@ class BaseReader(ABC):
                 "pages": {6: int},
             }
 
-        :return: Атрибуты с информацией об индексе столбца и типе данных
+        :return: Атрибуты с информацией об индексе столбца и типе данных (по умолчанию – пустой словарь)
         """
 
-    def read(self) -> list[BaseModel]:
+        return {}
+
+    def iter_numbered_rows(self) -> Iterator[tuple[int, tuple[Any, ...]]]:
         """
-        Чтение исходного файла.
+        Построчное чтение значений ячеек листа рабочей книги с номерами строк.
 
-        :return: Список моделей строк в виде DTO (Data Transfer Objects).
+        Строки читаются по одной (без создания объектов ячеек),
+        поэтому расход памяти не зависит от размера листа.
+
+        :return: Генератор пар из номера строки листа и кортежа значений ячеек заполненных строк.
         """
 
-        models = []
         # чтение со второй строки таблицы (первая строка содержит заголовок)
-        for row in self.workbook[self.sheet].iter_rows(min_row=2):
+        for number, row in enumerate(self.workbook[self.sheet].iter_rows(min_row=2, values_only=True), start=2):
             # обработка строки идет только, если заполнены обязательные столбцы
-            if row[0].value:
-                attrs = {}
+            if row and row[0]:
+                yield number, row
+
+    def iter_rows(self) -> Iterator[tuple[Any, ...]]:
+        """
+        Построчное чтение значений ячеек листа рабочей книги.
+
+        :return: Генератор кортежей значений ячеек заполненных строк.
+        """
+
+        for _, row in self.iter_numbered_rows():
+            yield row
+
+    @classmethod
+    def compile(cls, attributes: dict) -> tuple[Column, ...]:
+        """
+        Компиляция плана чтения столбцов из атрибутов (см. `attributes`).
+
+        :param attributes: Атрибуты с информацией об индексе столбца и типе данных.
+        :return: Описания столбцов с индексами и функциями преобразования значений.
+        """
+
+        columns = []
+        for attr, params in attributes.items():
+            position, data_type = next(iter(params.items()))
+            # значения столбцов неизвестных типов данных не преобразуются
+            columns.append(Column(attr, position, cls.converters.get(data_type, lambda value: value)))
+
+        return tuple(columns)
+
+    def convert(self, row: tuple[Any, ...]) -> dict[str, Any]:
+        """
+        Преобразование значений ячеек строки в атрибуты модели.
+
+        :param row: Кортеж значений ячеек строки.
+        :return: Атрибуты модели.
+        """
+
+        size = len(row)
+        attrs = {}
+        for attr, position, convert in self.columns:
+            # в листе могут отсутствовать пустые столбцы в конце строки
+            value = row[position] if position < size else None
+            # пустые значения передаются в модель без преобразования
+            attrs[attr] = convert(value) if value else value
+
+        return attrs
+
+    def parse(self, row: tuple[Any, ...]) -> BaseModel:
+        """
+        Преобразование значений ячеек строки в модель.
 
-                # обработка заданных в методе `attributes()` атрибутов
-                for attr, params in self.attributes.items():
-                    index, data_type = list(params.items())[0]
-                    attrs[attr] = row[index].value
+        :param row: Кортеж значений ячеек строки.
+        :return: Модель строки в виде DTO (Data Transfer Object).
+        """
+
+        if self.trusted:
+            return self.model.construct(**self.convert(row))
+
+        return self.model(**self.convert(row))
+
+    def iter_models(self) -> Iterator[BaseModel]:
+        """
+        Потоковое чтение исходного файла.
 
-                    if not attrs[attr]:
-                        continue
+        :return: Генератор моделей строк в виде DTO (Data Transfer Objects).
+        """
+
+        parse = self.parse
+        for row in self.iter_rows():
+            yield parse(row)
 
-                    if data_type is int:
-                        attrs[attr] = int(str(attrs.get(attr)))
+    def read(self) -> list[BaseModel]:
+        """
+        Чтение исходного файла.
 
-                    if data_type is str:
-                        attrs[attr] = str(attrs.get(attr)).strip()
+        Строки читаются, преобразуются и проверяются (валидация моделей) за один проход.
+        При включенных замерах время преобразования и валидации строк суммируется
+        в отдельный вложенный этап `validate:<лист>`.
 
-                    if data_type is date:
-                        value = attrs.get(attr)
-                        if isinstance(value, date):
-                            attrs[attr] = value.strftime("%d.%m.%Y")
+        :return: Список моделей строк в виде DTO (Data Transfer Objects).
+        """
 
-                # добавление считанной и обработанной строки в список моделей
-                models.append(self.model(**attrs))
+        with stage(f"read:{self.sheet}") as timing:
+            if not profiler.enabled:
+                models = list(self.iter_models())
+            else:
+                parse = self.parse
+                models = []
+                wall = cpu = 0.0
+                for row in self.iter_rows():
+                    start_wall, start_cpu = time.perf_counter(), time.process_time()
+                    models.append(parse(row))
+                    wall += time.perf_counter() - start_wall
+                    cpu += time.process_time() - start_cpu
+                profiler.record(f"validate:{self.sheet}", wall, cpu, len(models))
+            timing.rows = len(models)
 
         return models
+
+    def validate(self) -> list[RowError]:
+        """
+        Проверка всех строк листа без остановки на первой ошибке.
+
+        :return: Список ошибок с номерами строк листа (пустой, если все строки корректны).
+        """
+
+        errors = []
+        for number, row in self.iter_numbered_rows():
+            size = len(row)
+            attrs = {}
+            row_errors: list[ErrorDict] = []
+            for attr, position, convert in self.columns:
+                value = row[position] if position < size else None
+                try:
+                    attrs[attr] = convert(value) if value else value
+                except (TypeError, ValueError) as ex:
+                    row_errors.append({"loc": (attr,), "msg": str(ex), "type": "type_error"})
+
+            if not row_errors:
+                try:
+                    self.model(**attrs)
+                except ValidationError as ex:
+                    row_errors.extend(ex.errors())
+
+            if row_errors:
+                errors.append(RowError(sheet=self.sheet, row=number, errors=row_errors))
+
+        return errors
@@ -1,25 +1,68 @@
 """
 Чтение исходного файла.
 """
-from datetime import date
-from typing import Type
+from concurrent.futures import ProcessPoolExecutor
+from functools import cached_property
+from itertools import repeat
+from pathlib import Path
+from types import TracebackType
+from typing import IO, Iterator, Optional, Type
 
 import openpyxl
 from openpyxl.workbook import Workbook
 
+from pydantic import BaseModel
+
 from formatters.models import BookModel, InternetResourceModel, ArticlesCollectionModel, ArticlesNewspaperModel, DissertationModel
 from logger import get_logger
-from readers.base import BaseReader
+from profiling import stage
+from readers.base import BaseReader, Column, RowError, to_date, to_int, to_str
+from readers.text import CSVReader, JSONLinesReader, TextReader
+from readers.xlsx import XLSXWorkbook
+from settings import READER_BACKEND
 
 
 logger = get_logger(__name__)
 
+# способы чтения рабочей книги Excel: `openpyxl` или собственный потоковый разбор XML (`readers.xlsx`)
+BACKENDS = ("openpyxl", "xlsx")
+
+
+def load_workbook(
+    path: str | IO[bytes], read_only: bool = True, backend: str = READER_BACKEND
+) -> Workbook | XLSXWorkbook:
+    """
+    Открытие рабочей книги Excel.
+
+    :param path: Путь (или файловый объект) к исходному файлу.
+    :param read_only: Потоковое чтение рабочей книги (для `openpyxl`, собственный разбор всегда потоковый).
+    :param backend: Способ чтения рабочей книги (см. `BACKENDS`).
+    :return: Рабочая книга.
+    """
+
+    if backend == "xlsx":
+        return XLSXWorkbook(path)
+    if backend != "openpyxl":
+        raise ValueError(f"Неизвестный способ чтения рабочей книги: {backend}.")
+
+    return openpyxl.load_workbook(path, read_only=read_only)
+
 
 class BookReader(BaseReader):
     """
     Чтение модели книги.
     """
 
+    columns = (
+        Column("authors", 0, to_str),
+        Column("title", 1, to_str),
+        Column("edition", 2, to_str),
+        Column("city", 3, to_str),
+        Column("publishing_house", 4, to_str),
+        Column("year", 5, to_int),
+        Column("pages", 6, to_int),
+    )
+
     @property
     def model(self) -> Type[BookModel]:
         return BookModel
@@ -28,24 +71,19 @@ class BookReader(BaseReader):
     def sheet(self) -> str:
         return "Книга"
 
-    @property
-    def attributes(self) -> dict:
-        return {
-            "authors": {0: str},
-            "title": {1: str},
-            "edition": {2: str},
-            "city": {3: str},
-            "publishing_house": {4: str},
-            "year": {5: int},
-            "pages": {6: int},
-        }
-
 
 class InternetResourceReader(BaseReader):
     """
     Чтение модели интернет-ресурса.
     """
 
+    columns = (
+        Column("article", 0, to_str),
+        Column("website", 1, to_str),
+        Column("link", 2, to_str),
+        Column("access_date", 3, to_date),
+    )
+
     @property
     def model(self) -> Type[InternetResourceModel]:
         return InternetResourceModel
@@ -54,21 +92,22 @@ class InternetResourceReader(BaseReader):
     def sheet(self) -> str:
         return "Интернет-ресурс"
 
-    @property
-    def attributes(self) -> dict:
-        return {
-            "article": {0: str},
-            "website": {1: str},
-            "link": {2: str},
-            "access_date": {3: date},
-        }
-
 
 class ArticlesCollectionReader(BaseReader):
     """
     Чтение модели сборника статей.
     """
 
+    columns = (
+        Column("authors", 0, to_str),
+        Column("article_title", 1, to_str),
+        Column("collection_title", 2, to_str),
+        Column("city", 3, to_str),
+        Column("publishing_house", 4, to_str),
+        Column("year", 5, to_int),
+        Column("pages", 6, to_str),
+    )
+
     @property
     def model(self) -> Type[ArticlesCollectionModel]:
         return ArticlesCollectionModel
@@ -77,23 +116,20 @@ class ArticlesCollectionReader(BaseReader):
     def sheet(self) -> str:
         return "Статья из сборника"
 
-    @property
-    def attributes(self) -> dict:
-        return {
-            "authors": {0: str},
-            "article_title": {1: str},
-            "collection_title": {2: str},
-            "city": {3: str},
-            "publishing_house": {4: str},
-            "year": {5: int},
-            "pages": {6: str},
-        }
-
 class ArticleMagazineReader(BaseReader):
     """
     Чтение модели статьи из газеты.
     """
 
+    columns = (
+        Column("authors", 0, to_str),
+        Column("article_title", 1, to_str),
+        Column("newspaper_name", 2, to_str),
+        Column("publishing_year", 3, to_int),
+        Column("newspaper_publishing_date", 4, to_str),
+        Column("article_number", 5, to_int),
+    )
+
     @property
     def model(self) -> Type[ArticlesNewspaperModel]:
         return ArticlesNewspaperModel
@@ -102,23 +138,23 @@ class ArticleMagazineReader(BaseReader):
     def sheet(self) -> str:
         return "Статья из газеты"
 
-    @property
-    def attributes(self) -> dict:
-        return {
-            "authors": {0: str},
-            "article_title": {1: str},
-            "newspaper_name": {2: str},
-            "publishing_year": {3: int},
-            "newspaper_publishing_date": {4: str},
-            "article_number": {5: int},
-        }
-
 
 class DissertationReader(BaseReader):
     """
     Чтение модели диссертации.
     """
 
+    columns = (
+        Column("authors", 0, to_str),
+        Column("article_title", 1, to_str),
+        Column("phd_or_cand", 2, to_str),
+        Column("branch_of_sciences", 3, to_str),
+        Column("specialty_code", 4, to_str),
+        Column("publishing_city", 5, to_str),
+        Column("publishing_year", 6, to_int),
+        Column("pages", 7, to_int),
+    )
+
     @property
     def model(self) -> Type[DissertationModel]:
         return DissertationModel
@@ -127,18 +163,29 @@ class DissertationReader(BaseReader):
     def sheet(self) -> str:
         return "Диссертация"
 
-    @property
-    def attributes(self) -> dict:
-        return {
-            "authors": {0: str},
-            "article_title": {1: str},
-            "phd_or_cand": {2: str},
-            "branch_of_sciences": {3: str},
-            "specialty_code": {4: str},
-            "publishing_city": {5: str},
-            "publishing_year": {6: int},
-            "pages": {7: int},
-        }
+
+def read_sheet(
+    path: str, reader: Type[BaseReader], trusted: bool = False, backend: str = READER_BACKEND
+) -> list[BaseModel]:
+    """
+    Чтение одного листа исходного файла.
+
+    Функция выполняется в отдельном процессе при параллельном чтении,
+    поэтому рабочая книга открывается заново в потоковом режиме.
+
+    :param path: Путь к исходному файлу для чтения.
+    :param reader: Класс читателя листа.
+    :param trusted: Создание моделей без валидации.
+    :param backend: Способ чтения рабочей книги.
+    :return: Список прочитанных моделей (строк) листа.
+    """
+
+    workbook = load_workbook(path, backend=backend)
+    try:
+        return reader(workbook, trusted).read()
+    finally:
+        workbook.close()
+
 
 class SourcesReader:
     """
@@ -154,26 +201,145 @@ class SourcesReader:
         DissertationReader
     ]
 
-    def __init__(self, path: str) -> None:
+    def __init__(self, path: str, read_only: bool = True, trusted: bool = False, backend: str = READER_BACKEND) -> None:
         """
         Конструктор.
 
         :param path: Путь к исходному файлу для чтения.
+        :param read_only: Потоковое чтение рабочей книги (без загрузки всех ячеек в память).
+        :param trusted: Создание моделей без валидации (для ранее проверенных исходных файлов).
+        :param backend: Способ чтения рабочей книги (`openpyxl` или `xlsx` – собственный потоковый разбор XML).
+        """
+
+        self.path = path
+        self.read_only = read_only
+        self.trusted = trusted
+        self.backend = backend
+
+    @cached_property
+    def workbook(self) -> Workbook | XLSXWorkbook:
+        """
+        Получение рабочей книги (загружается при первом обращении).
+
+        :return: Рабочая книга Excel.
         """
 
         logger.info("Загрузка рабочей книги ...")
-        self.workbook: Workbook = openpyxl.load_workbook(path)
 
-    def read(self) -> list:
+        with stage("load_workbook"):
+            return load_workbook(self.path, self.read_only, self.backend)
+
+    def __enter__(self) -> "SourcesReader":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Закрытие исходного файла (для потокового режима чтения).
+        """
+
+        if "workbook" in self.__dict__:
+            self.workbook.close()
+
+    def iter_models(self) -> Iterator[BaseModel]:
+        """
+        Потоковое чтение исходного файла.
+
+        :return: Генератор прочитанных моделей (строк).
+        """
+
+        for reader in self.readers:
+            logger.info("Чтение %s ...", reader)
+            yield from reader(self.workbook, self.trusted).iter_models()  # type: ignore
+
+    def read(self, workers: int = 1) -> list:
         """
         Чтение исходного файла.
 
+        :param workers: Количество процессов для параллельного чтения листов.
         :return: Список прочитанных моделей (строк).
         """
 
+        if workers > 1:
+            return self.read_parallel(workers)
+
         items = []
         for reader in self.readers:
             logger.info("Чтение %s ...", reader)
-            items.extend(reader(self.workbook).read())  # type: ignore
+            items.extend(reader(self.workbook, self.trusted).read())  # type: ignore
+
+        logger.info("Прочитано источников: %s.", len(items))
 
         return items
+
+    def read_parallel(self, max_workers: Optional[int] = None) -> list:
+        """
+        Параллельное чтение листов исходного файла в пуле процессов.
+
+        Каждый процесс открывает исходный файл в потоковом режиме и читает только свой лист.
+        Результаты объединяются в порядке регистрации читателей,
+        поэтому порядок моделей совпадает с последовательным чтением.
+
+        :param max_workers: Максимальное количество процессов (по умолчанию – по количеству листов).
+        :return: Список прочитанных моделей (строк).
+        """
+
+        logger.info("Параллельное чтение листов рабочей книги ...")
+
+        items = []
+        with stage("read_parallel") as timing, ProcessPoolExecutor(
+            max_workers=min(max_workers or len(self.readers), len(self.readers))
+        ) as executor:
+            for models in executor.map(
+                read_sheet, repeat(self.path), self.readers, repeat(self.trusted), repeat(self.backend)
+            ):
+                items.extend(models)
+            timing.rows = len(items)
+
+        return items
+
+    def validate(self) -> list[RowError]:
+        """
+        Проверка всех строк исходного файла без остановки на первой ошибке.
+
+        :return: Список ошибок с наименованиями листов и номерами строк.
+        """
+
+        errors = []
+        for reader in self.readers:
+            logger.info("Проверка %s ...", reader)
+            errors.extend(reader(self.workbook).validate())  # type: ignore
+
+        return errors
+
+
+# читатели текстовых форматов по расширениям файлов
+TEXT_READERS: dict[str, Type[TextReader]] = {
+    ".jsonl": JSONLinesReader,
+    ".ndjson": JSONLinesReader,
+    ".csv": CSVReader,
+}
+
+
+def open_reader(path: str, trusted: bool = False, backend: str = READER_BACKEND) -> SourcesReader | TextReader:
+    """
+    Получение читателя исходного файла по его расширению (по умолчанию – файл Excel).
+
+    :param path: Путь к исходному файлу для чтения.
+    :param trusted: Создание моделей без валидации.
+    :param backend: Способ чтения рабочей книги Excel.
+    :return: Читатель исходного файла.
+    """
+
+    reader = TEXT_READERS.get(Path(path).suffix.lower())
+    if reader is not None:
+        return reader(path, trusted)
+
+    return SourcesReader(path, trusted=trusted, backend=backend)
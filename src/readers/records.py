@@ -0,0 +1,83 @@
+"""
+Чтение источников из записей (словарей) текстовых форматов.
+
+Запись содержит тип источника в поле `type` и поля соответствующей модели:
+
+.. code-block::
+
+    {
+        "type": "book",
+        "authors": "Иванов И.М., Петров С.Н.",
+        "title": "Наука как искусство",
+        "edition": "3-е",
+        "city": "СПб.",
+        "publishing_house": "Просвещение",
+        "year": 2020,
+        "pages": 999
+    }
+"""
+from typing import Any, Iterable, Iterator, Type
+
+from pydantic import BaseModel
+
+from formatters.models import (
+    ArticlesCollectionModel,
+    ArticlesNewspaperModel,
+    BookModel,
+    DissertationModel,
+    InternetResourceModel,
+)
+
+
+# модели источников по типам записей
+RECORD_TYPES: dict[str, Type[BaseModel]] = {
+    "book": BookModel,
+    "internet_resource": InternetResourceModel,
+    "articles_collection": ArticlesCollectionModel,
+    "newspaper_article": ArticlesNewspaperModel,
+    "dissertation": DissertationModel,
+}
+
+# поле записи с типом источника
+TYPE_FIELD = "type"
+
+
+def parse_record(record: dict[str, Any], trusted: bool = False) -> BaseModel:
+    """
+    Получение модели источника из записи.
+
+    :param record: Запись с типом источника и полями модели.
+    :param trusted: Создание модели без валидации (для ранее проверенных записей).
+    :return: Модель источника.
+    :raises ValueError: Если тип источника не поддерживается или запись не проходит валидацию.
+    """
+
+    # строковые значения очищаются от пробелов по краям так же, как значения ячеек Excel (см. `readers.base.to_str`)
+    fields: dict[str, Any] = {
+        name: value.strip() if isinstance(value, str) else value for name, value in record.items()
+    }
+    kind = fields.pop(TYPE_FIELD, None)
+    if kind is not None and not isinstance(kind, str):
+        raise ValueError(f"Тип источника не является строкой: {kind!r}.")
+
+    model = RECORD_TYPES.get(kind) if isinstance(kind, str) else None
+    if model is None:
+        raise ValueError(f"Неизвестный тип источника: {kind!r}.")
+
+    if trusted:
+        return model.construct(**fields)
+
+    return model(**fields)
+
+
+def parse_records(records: Iterable[dict[str, Any]], trusted: bool = False) -> Iterator[BaseModel]:
+    """
+    Потоковое получение моделей источников из записей.
+
+    :param records: Записи с типами источников и полями моделей.
+    :param trusted: Создание моделей без валидации.
+    :return: Генератор моделей источников.
+    """
+
+    for record in records:
+        yield parse_record(record, trusted)
@@ -0,0 +1,356 @@
+"""
+Двоичный снимок прочитанных источников для повторных запусков без чтения входного файла.
+
+Снимок хранит таблицу строк (каждая строка – один раз), столбцы полей по типам источников
+и порядок источников. Секции выровнены по 8 байт, числа записаны в порядке байтов платформы:
+
+.. code-block::
+
+    BIBSNAP\\0           сигнатура (8 байт)
+    <размер>            размер метаданных (uint64)
+    <метаданные>        JSON: версия, порядок байтов, количество источников, смещения секций
+    строки              смещения (uint64, количество строк + 1) и текст строк в UTF-8
+    столбцы             по типам источников: индексы строк (uint32) или целые значения (int64)
+    порядок             тип (uint8) и номер в типе (uint32) для каждого источника
+
+Снимок открывается через `mmap`, модели создаются без валидации (`construct`) только при обращении:
+
+.. code-block::
+
+    with Snapshot("sources.snapshot") as snapshot:
+        model = snapshot[0]
+"""
+from __future__ import annotations
+
+import json
+import mmap
+import struct
+import sys
+from array import array
+from collections.abc import Sequence
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Iterable, Iterator, Literal, Optional, Type, overload
+
+from pydantic import BaseModel
+
+from formatters.models import model_name
+from logger import get_logger
+from profiling import stage
+from readers.base import RowError
+from readers.records import RECORD_TYPES
+
+
+logger = get_logger(__name__)
+
+# сигнатура и версия формата снимка
+MAGIC = b"BIBSNAP\0"
+SNAPSHOT_VERSION = 1
+HEADER = struct.Struct("<8sQ")
+ALIGNMENT = 8
+
+# коды типов столбцов (`array`): индекс строки в таблице строк и целое значение
+STRING_COLUMN = "I"
+INTEGER_COLUMN = "q"
+# значения отсутствующих полей
+NULL_STRING = 0xFFFFFFFF
+NULL_INTEGER = -(2**63)
+
+
+def align(offset: int) -> int:
+    """
+    Выравнивание смещения секции.
+
+    :param offset: Смещение.
+    :return: Ближайшее кратное `ALIGNMENT` смещение, не меньшее заданного.
+    """
+
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def schema(model: Type[BaseModel]) -> list[tuple[str, str]]:
+    """
+    Получение столбцов снимка для модели источника.
+
+    :param model: Класс модели.
+    :return: Пары из наименования поля и кода типа столбца.
+    """
+
+    return [
+        (name, INTEGER_COLUMN if issubclass(field.type_, int) else STRING_COLUMN)
+        for name, field in model.__fields__.items()
+    ]
+
+
+def write_snapshot(path: Path | str, models: Iterable[BaseModel]) -> int:  # pylint: disable=too-many-locals
+    """
+    Сохранение снимка источников.
+
+    :param path: Путь к файлу снимка.
+    :param models: Модели источников (или строки колоночного хранилища) в порядке списка.
+    :return: Количество сохраненных источников.
+    :raises ValueError: Если тип источника не поддерживается (не зарегистрирован в `RECORD_TYPES`).
+    """
+
+    kinds = {model.__name__: index for index, model in enumerate(RECORD_TYPES.values())}
+    schemas = [schema(model) for model in RECORD_TYPES.values()]
+    columns = [[array(code) for _, code in fields] for fields in schemas]
+    counts = [0] * len(kinds)
+    order_kinds = array("B")
+    order_rows = array("I")
+    strings: dict[str, int] = {}
+
+    for model in models:
+        kind = kinds.get(model_name(model))
+        if kind is None:
+            raise ValueError(f"Тип источника не поддерживается снимком: {model_name(model)}.")
+
+        order_kinds.append(kind)
+        order_rows.append(counts[kind])
+        counts[kind] += 1
+        for (field, code), column in zip(schemas[kind], columns[kind]):
+            value = getattr(model, field, None)
+            if value is None:
+                column.append(NULL_STRING if code == STRING_COLUMN else NULL_INTEGER)
+            elif code == STRING_COLUMN:
+                column.append(strings.setdefault(str(value), len(strings)))
+            else:
+                column.append(value)
+
+    text = bytearray()
+    offsets = array("Q", [0])
+    for value in strings:
+        text += value.encode("utf-8")
+        offsets.append(len(text))
+
+    # секции данных и их смещения от начала данных
+    sections: list[Any] = []
+    position = 0
+
+    def add(section: Any) -> int:
+        nonlocal position
+        offset = position
+        sections.append(section)
+        position = align(position + memoryview(section).nbytes)
+        return offset
+
+    metadata = {
+        "version": SNAPSHOT_VERSION,
+        "byteorder": sys.byteorder,
+        "rows": len(order_kinds),
+        "strings": {"count": len(strings), "offsets": add(offsets), "text": add(text), "size": len(text)},
+        "types": [
+            {
+                "name": name,
+                "rows": counts[kind],
+                "columns": [
+                    {"field": field, "code": code, "offset": add(column)}
+                    for (field, code), column in zip(schemas[kind], columns[kind])
+                ],
+            }
+            for kind, name in enumerate(RECORD_TYPES)
+        ],
+        "order": {"kinds": add(order_kinds), "rows": add(order_rows)},
+    }
+    header = json.dumps(metadata, ensure_ascii=False).encode("utf-8")
+
+    with open(path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, len(header)))
+        file.write(header)
+        file.write(bytes(align(file.tell()) - file.tell()))
+        for section in sections:
+            file.write(section)
+            file.write(bytes(align(file.tell()) - file.tell()))
+
+    logger.info("Сохранен снимок источников: %s (строк в таблице строк: %s).", len(order_kinds), len(strings))
+
+    return len(order_kinds)
+
+
+class Snapshot(Sequence):
+    """
+    Снимок источников, открытый через `mmap` (последовательность моделей, создаваемых при обращении).
+
+    Интерфейс чтения совпадает с :class:`readers.reader.SourcesReader`, поэтому снимок используется
+    вместо входного файла. Строки декодируются один раз, и модели разделяют одни и те же объекты строк.
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        """
+        Конструктор.
+
+        :param path: Путь к файлу снимка.
+        :raises ValueError: Если файл не является снимком или создан несовместимой версией.
+        """
+
+        self.path = path
+        with open(path, "rb") as file:
+            self.buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._views: list[memoryview] = []
+
+        try:
+            magic, size = HEADER.unpack_from(self.buffer) if len(self.buffer) >= HEADER.size else (b"", 0)
+            if magic != MAGIC:
+                raise ValueError(f"Файл не является снимком источников: {path}.")
+            begin, end = HEADER.size, HEADER.size + size
+            metadata = json.loads(self.buffer[begin:end])
+            self.load(metadata, align(end))
+        except Exception:
+            self.close()
+            raise
+
+    def load(self, metadata: dict[str, Any], start: int) -> None:
+        """
+        Проверка метаданных снимка и получение представлений секций без копирования.
+
+        :param metadata: Метаданные снимка.
+        :param start: Смещение начала данных.
+        """
+
+        if metadata.get("version") != SNAPSHOT_VERSION or metadata.get("byteorder") != sys.byteorder:
+            raise ValueError(f"Снимок создан несовместимой версией или на другой платформе: {self.path}.")
+
+        def view(offset: int, count: int, code: Literal["B", "I", "Q", "q"]) -> memoryview:
+            begin = start + offset
+            end = begin + count * struct.calcsize(code)
+            section = memoryview(self.buffer)[begin:end].cast(code)
+            self._views.append(section)
+            return section
+
+        self.size: int = metadata["rows"]
+        strings = metadata["strings"]
+        self._offsets = view(strings["offsets"], strings["count"] + 1, "Q")
+        self._text = view(strings["text"], strings["size"], "B")
+        self._strings: list[Optional[str]] = [None] * strings["count"]
+
+        self._types: list[tuple[Type[BaseModel], list[tuple[str, bool, memoryview]]]] = []
+        for kind in metadata["types"]:
+            model = RECORD_TYPES.get(kind["name"])
+            fields = [(column["field"], column["code"]) for column in kind["columns"]]
+            if model is None or fields != schema(model):
+                raise ValueError(f"Снимок создан для другой версии моделей ({kind['name']}): {self.path}.")
+
+            columns = [
+                (column["field"], column["code"] == STRING_COLUMN, view(column["offset"], kind["rows"], column["code"]))
+                for column in kind["columns"]
+            ]
+            self._types.append((model, columns))
+
+        self._kinds = view(metadata["order"]["kinds"], self.size, "B")
+        self._rows = view(metadata["order"]["rows"], self.size, "I")
+
+    def __enter__(self) -> Snapshot:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.size
+
+    @overload
+    def __getitem__(self, index: int) -> BaseModel:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[BaseModel]:
+        ...
+
+    def __getitem__(self, index: int | slice) -> BaseModel | list[BaseModel]:
+        if isinstance(index, slice):
+            return [self.model(position) for position in range(*index.indices(self.size))]
+
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("Индекс источника вне снимка.")
+
+        return self.model(index)
+
+    def __iter__(self) -> Iterator[BaseModel]:
+        for index in range(self.size):
+            yield self.model(index)
+
+    def string(self, index: int) -> Optional[str]:
+        """
+        Получение строки из таблицы строк (декодируется при первом обращении).
+
+        :param index: Индекс строки.
+        :return:
+        """
+
+        if index == NULL_STRING:
+            return None
+
+        value = self._strings[index]
+        if value is None:
+            begin, end = self._offsets[index], self._offsets[index + 1]
+            value = self._strings[index] = str(self._text[begin:end], "utf-8")
+
+        return value
+
+    def model(self, index: int) -> BaseModel:
+        """
+        Создание модели источника без валидации (данные проверены при создании снимка).
+
+        :param index: Порядковый номер источника.
+        :return:
+        """
+
+        model, columns = self._types[self._kinds[index]]
+        row = self._rows[index]
+        values: dict[str, Any] = {}
+        for field, is_string, column in columns:
+            value = column[row]
+            if is_string:
+                values[field] = self.string(value)
+            else:
+                values[field] = None if value == NULL_INTEGER else value
+
+        return model.construct(**values)
+
+    def close(self) -> None:
+        """
+        Закрытие файла снимка (созданные модели остаются доступны).
+        """
+
+        for section in self._views:
+            section.release()
+        self._views = []
+        self.buffer.close()
+
+    def iter_models(self) -> Iterator[BaseModel]:
+        """
+        Потоковое чтение снимка.
+
+        :return: Генератор моделей (строк).
+        """
+
+        logger.info("Чтение снимка %s ...", self.path)
+
+        return iter(self)
+
+    def read(self, workers: int = 1) -> list:  # pylint: disable=unused-argument
+        """
+        Чтение снимка.
+
+        :param workers: Не используется: модели создаются без разбора входного файла.
+        :return: Список моделей (строк).
+        """
+
+        with stage(f"read:{self.path}", self.size):
+            return list(self.iter_models())
+
+    def validate(self) -> list[RowError]:
+        """
+        Проверка снимка (модели проверены при создании снимка).
+
+        :return: Пустой список ошибок.
+        """
+
+        return []
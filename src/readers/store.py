@@ -0,0 +1,225 @@
+"""
+Колоночное хранилище прочитанных источников.
+
+Значения полей хранятся списками по типам источников, а повторяющиеся строки и числа (города, издательства, годы)
+хранятся в одном экземпляре. Вместо модели pydantic для каждого источника создается легкое представление строки
+(`__slots__`) с теми же атрибутами, поэтому хранилище передается в классы форматирования вместо списка моделей:
+
+.. code-block::
+
+    store = RecordStore(reader.iter_models())
+    formatter = GOSTCitationFormatter(store)
+"""
+from __future__ import annotations
+
+from array import array
+from collections.abc import Sequence
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Iterable, Iterator, Type, overload
+
+from pydantic import BaseModel
+
+from formatters.models import model_name
+
+
+class RecordView:
+    """
+    Базовый класс представления строки хранилища (атрибуты полей создаются для каждой модели, см. `view_class`).
+    """
+
+    __slots__ = ("columns", "row")
+
+    #: представляемая модель источника и ее наименование (для выбора класса форматирования)
+    model: ClassVar[Type[BaseModel]]
+    model_name: ClassVar[str]
+    #: наименования полей модели в порядке столбцов
+    fields: ClassVar[tuple[str, ...]]
+
+    def __init__(self, columns: list[list[Any]], row: int) -> None:
+        """
+        Конструктор.
+
+        :param columns: Столбцы полей типа источника.
+        :param row: Номер строки в столбцах.
+        """
+
+        self.columns = columns
+        self.row = row
+
+    def dict(self) -> dict[str, Any]:
+        """
+        Получение значений полей (как `BaseModel.dict`).
+
+        :return:
+        """
+
+        row = self.row
+
+        return {field: column[row] for field, column in zip(self.fields, self.columns)}
+
+    def to_model(self) -> BaseModel:
+        """
+        Создание модели источника без валидации.
+
+        :return:
+        """
+
+        return self.model.construct(**self.dict())
+
+    if TYPE_CHECKING:
+        # атрибуты полей создаются для каждой модели (см. `view_class`)
+        def __getattr__(self, name: str) -> Any:
+            ...
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (RecordView, BaseModel)):
+            return model_name(other) == self.model_name and other.dict() == self.dict()
+
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{field}={value!r}" for field, value in self.dict().items())
+
+        return f"{self.model_name}View({fields})"
+
+
+def column_getter(index: int) -> Callable[[RecordView], Any]:
+    """
+    Получение функции чтения значения поля из столбца хранилища.
+
+    :param index: Номер столбца поля.
+    :return:
+    """
+
+    def get(view: RecordView) -> Any:
+        return view.columns[index][view.row]
+
+    return get
+
+
+@lru_cache(maxsize=None)
+def view_class(model: Type[BaseModel]) -> Type[RecordView]:
+    """
+    Получение класса представления строки для модели источника (создается один раз для модели).
+
+    :param model: Класс модели.
+    :return: Класс представления с атрибутами полей модели.
+    """
+
+    fields = tuple(model.__fields__)
+    namespace: dict[str, Any] = {
+        "__slots__": (),
+        "__doc__": f"Представление строки хранилища – {model.__name__}.",
+        "model": model,
+        "model_name": model.__name__,
+        "fields": fields,
+    }
+    for index, field in enumerate(fields):
+        namespace[field] = property(column_getter(index))
+
+    return type(f"{model.__name__}View", (RecordView,), namespace)
+
+
+class RecordStore(Sequence):
+    """
+    Колоночное хранилище источников (последовательность представлений строк в порядке добавления).
+    """
+
+    def __init__(self, models: Iterable[BaseModel] = ()) -> None:
+        """
+        Конструктор.
+
+        :param models: Модели источников (достаточно однократного прохода, например, генератора).
+        """
+
+        # классы представлений и столбцы полей по типам источников
+        self.views: list[Type[RecordView]] = []
+        self.tables: list[list[list[Any]]] = []
+        self._kinds: dict[Type[BaseModel], int] = {}
+        # тип источника и номер строки в столбцах типа для каждого источника
+        self.kinds = array("B")
+        self.rows = array("I")
+        # единственные экземпляры повторяющихся значений
+        self.values: dict[Any, Any] = {}
+
+        self.extend(models)
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    @overload
+    def __getitem__(self, index: int) -> RecordView:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[RecordView]:
+        ...
+
+    def __getitem__(self, index: int | slice) -> RecordView | list[RecordView]:
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(len(self)))]
+
+        kind = self.kinds[index]
+
+        return self.views[kind](self.tables[kind], self.rows[index])
+
+    def __iter__(self) -> Iterator[RecordView]:
+        views, tables = self.views, self.tables
+        for kind, row in zip(self.kinds, self.rows):
+            yield views[kind](tables[kind], row)
+
+    def append(self, model: BaseModel | RecordView) -> None:
+        """
+        Добавление источника.
+
+        :param model: Модель источника (или строка другого хранилища).
+        """
+
+        source = model.model if isinstance(model, RecordView) else type(model)
+        kind = self._kinds.get(source)
+        if kind is None:
+            kind = self._kinds[source] = len(self.views)
+            self.views.append(view_class(source))
+            self.tables.append([[] for _ in source.__fields__])
+
+        columns = self.tables[kind]
+        self.kinds.append(kind)
+        self.rows.append(len(columns[0]) if columns else 0)
+
+        intern = self.values.setdefault
+        for field, column in zip(self.views[kind].fields, columns):
+            value = getattr(model, field)
+            # `bool` и `float`, равные целым числам, не заменяются целыми числами
+            column.append(intern(value, value) if type(value) in (str, int) else value)
+
+    def extend(self, models: Iterable[BaseModel | RecordView]) -> None:
+        """
+        Добавление источников.
+
+        :param models: Модели источников.
+        """
+
+        for model in models:
+            self.append(model)
+
+    def iter_tables(self) -> Iterator[tuple[str, dict[str, list[Any]]]]:
+        """
+        Получение столбцов полей по типам источников (для пакетного форматирования).
+
+        :return: Генератор пар из наименования модели и столбцов по наименованиям полей.
+        """
+
+        for view, columns in zip(self.views, self.tables):
+            yield view.model_name, dict(zip(view.fields, columns))
+
+    def summary(self) -> dict[str, int]:
+        """
+        Получение количества источников по типам и количества уникальных значений.
+
+        :return:
+        """
+
+        summary = {view.model_name: len(table[0]) if table else 0 for view, table in zip(self.views, self.tables)}
+        summary["values"] = len(self.values)
+
+        return summary
@@ -0,0 +1,234 @@
+"""
+Потоковое чтение источников из текстовых форматов (JSON Lines, CSV).
+
+Каждая строка (запись) содержит тип источника в поле `type` и поля соответствующей модели (см. :mod:`readers.records`).
+Файл читается построчно, модели создаются по мере чтения без загрузки всего файла в память.
+"""
+import csv
+import json
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from types import TracebackType
+from typing import Any, Callable, Iterator, Optional, Type
+
+from pydantic import BaseModel, ValidationError
+
+from logger import get_logger
+from profiling import stage
+from readers.base import BaseReader, ErrorDict, RowError
+from readers.records import RECORD_TYPES, TYPE_FIELD, parse_record
+
+
+logger = get_logger(__name__)
+
+
+def value_error(field: str, error: Exception) -> ErrorDict:
+    """
+    Получение описания ошибки строки в формате ошибок валидации `pydantic`.
+
+    :param field: Наименование поля с ошибкой.
+    :param error: Исключение.
+    :return: Описание ошибки.
+    """
+
+    return {"loc": (field,), "msg": str(error), "type": "value_error"}
+
+
+@lru_cache(maxsize=None)
+def field_converters(model: Type[BaseModel]) -> dict[str, Callable[[Any], Any]]:
+    """
+    Получение функций приведения строковых значений к типам полей модели (кроме строковых полей).
+
+    Используются при создании моделей без валидации, которая иначе приводит значения к типам полей.
+
+    :param model: Модель источника.
+    :return: Функции преобразования значений по наименованиям полей (см. `BaseReader.converters`).
+    """
+
+    converters = {}
+    for name, field in model.__fields__.items():
+        for data_type, convert in BaseReader.converters.items():
+            # ограниченные типы (`conint`, `Field(..., gt=0)`) являются подклассами основных типов
+            if data_type is not str and isinstance(field.type_, type) and issubclass(field.type_, data_type):
+                converters[name] = convert
+                break
+
+    return converters
+
+
+class TextReader(ABC):
+    """
+    Базовый класс потокового чтения источников из текстового файла.
+    """
+
+    def __init__(self, path: str, trusted: bool = False, encoding: str = "utf-8") -> None:
+        """
+        Конструктор.
+
+        :param path: Путь к исходному файлу для чтения.
+        :param trusted: Создание моделей без валидации (для ранее проверенных исходных файлов).
+        :param encoding: Кодировка исходного файла.
+        """
+
+        self.path = path
+        self.trusted = trusted
+        self.encoding = encoding
+
+    def __enter__(self) -> "TextReader":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Закрытие исходного файла (файл открывается только на время чтения, метод нужен для совместимости
+        с :class:`readers.reader.SourcesReader`).
+        """
+
+    @abstractmethod
+    def iter_lines(self) -> Iterator[tuple[int, Any]]:
+        """
+        Потоковое чтение строк исходного файла без разбора записей.
+
+        :return: Генератор пар из номера строки и строки (или значений строки).
+        """
+
+    def decode(self, line: Any) -> dict[str, Any]:
+        """
+        Разбор записи из строки исходного файла.
+
+        :param line: Строка (или значения строки) исходного файла.
+        :return: Запись с типом источника и полями модели.
+        :raises ValueError: Если строка не содержит запись.
+        """
+
+        return line
+
+    def iter_records(self) -> Iterator[tuple[int, dict[str, Any]]]:
+        """
+        Потоковое чтение записей исходного файла.
+
+        :return: Генератор пар из номера строки и записи.
+        """
+
+        decode = self.decode
+        for number, line in self.iter_lines():
+            yield number, decode(line)
+
+    def iter_models(self) -> Iterator[BaseModel]:
+        """
+        Потоковое чтение исходного файла.
+
+        :return: Генератор прочитанных моделей (строк).
+        """
+
+        logger.info("Чтение %s ...", self.path)
+
+        for _, record in self.iter_records():
+            yield parse_record(record, self.trusted)
+
+    def read(self, workers: int = 1) -> list:  # pylint: disable=unused-argument
+        """
+        Чтение исходного файла.
+
+        :param workers: Не используется: текстовый файл читается последовательно.
+        :return: Список прочитанных моделей (строк).
+        """
+
+        with stage(f"read:{self.path}") as timing:
+            models = list(self.iter_models())
+            timing.rows = len(models)
+
+        return models
+
+    def validate(self) -> list[RowError]:
+        """
+        Проверка всех строк исходного файла без остановки на первой ошибке.
+
+        :return: Список ошибок с типами источников и номерами строк.
+        """
+
+        errors = []
+        for number, line in self.iter_lines():
+            try:
+                record = self.decode(line)
+            except ValueError as ex:
+                # строка не разбирается как запись (например, некорректный JSON)
+                errors.append(RowError(sheet="", row=number, errors=[value_error("__root__", ex)]))
+                continue
+
+            kind = str(record.get(TYPE_FIELD) or "")
+            try:
+                parse_record(record)
+            except ValidationError as ex:
+                errors.append(RowError(sheet=kind, row=number, errors=ex.errors()))
+            except ValueError as ex:
+                errors.append(RowError(sheet=kind, row=number, errors=[value_error(TYPE_FIELD, ex)]))
+
+        return errors
+
+
+class JSONLinesReader(TextReader):
+    """
+    Чтение источников из файла JSON Lines (одна запись – JSON-объект в строке).
+    """
+
+    def iter_lines(self) -> Iterator[tuple[int, str]]:
+        with open(self.path, encoding=self.encoding) as file:
+            for number, line in enumerate(file, start=1):
+                if line.strip():
+                    yield number, line
+
+    def decode(self, line: str) -> dict[str, Any]:
+        record = json.loads(line)
+        if not isinstance(record, dict):
+            raise ValueError(f"Строка не является JSON-объектом: {line.strip()[:50]!r}.")
+
+        return record
+
+
+class CSVReader(TextReader):
+    """
+    Чтение источников из файла CSV.
+
+    Первая строка содержит наименования полей (в том числе `type`), пустые ячейки считаются незаполненными полями.
+    Значения читаются как строки и приводятся к типам полей при валидации моделей
+    (или по типам полей модели при создании моделей без валидации, см. `field_converters`).
+    """
+
+    def __init__(self, path: str, trusted: bool = False, encoding: str = "utf-8", delimiter: str = ",") -> None:
+        """
+        Конструктор.
+
+        :param path: Путь к исходному файлу для чтения.
+        :param trusted: Создание моделей без валидации (для ранее проверенных исходных файлов).
+        :param encoding: Кодировка исходного файла.
+        :param delimiter: Разделитель полей.
+        """
+
+        super().__init__(path, trusted, encoding)
+        self.delimiter = delimiter
+
+    def iter_lines(self) -> Iterator[tuple[int, dict[str, Any]]]:
+        with open(self.path, encoding=self.encoding, newline="") as file:
+            reader = csv.reader(file, delimiter=self.delimiter)
+            header = next(reader, [])
+            for row in reader:
+                if any(row):
+                    # номер строки с учетом переносов внутри значений
+                    yield reader.line_num, {field: value for field, value in zip(header, row) if value}
+
+    def decode(self, line: dict[str, Any]) -> dict[str, Any]:
+        model = RECORD_TYPES.get(str(line.get(TYPE_FIELD)).strip())
+        if self.trusted and model is not None:
+            for name, convert in field_converters(model).items():
+                if name in line:
+                    line[name] = convert(line[name])
+
+        return line
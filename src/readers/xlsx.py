@@ -0,0 +1,550 @@
+"""
+Потоковое чтение файлов Excel (XLSX) без сторонних библиотек.
+
+Рабочая книга читается напрямую из ZIP-архива: общие строки (`xl/sharedStrings.xml`) и листы
+разбираются потоково обработчиками событий `expat`, а значения строк листа возвращаются кортежами,
+как `openpyxl` в режиме `read_only` с `values_only=True`:
+
+.. code-block::
+
+    with XLSXWorkbook("input.xlsx") as workbook:
+        for row in workbook["Книга"].iter_rows(min_row=2, values_only=True):
+            ...
+
+Формулы возвращаются строкой формулы (`=A1+1`), как в `openpyxl` без `data_only`;
+для общих формул (`<f t="shared">` без текста) возвращается сохраненное значение.
+Числа в форматах продолжительности (`[h]:mm:ss`), как и в `openpyxl` 3.0 в режиме `read_only`, возвращаются датами.
+"""
+from __future__ import annotations
+
+import re
+import zipfile
+from datetime import datetime, timedelta
+from itertools import chain
+from pathlib import Path, PurePosixPath
+from types import TracebackType
+from typing import IO, Any, Iterator, Optional, Type
+from xml.etree.ElementTree import parse
+from xml.parsers import expat
+
+
+# пространства имен SpreadsheetML
+MAIN_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+RELATIONSHIPS_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+PACKAGE_RELATIONSHIPS_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+# наименования элементов листа в событиях expat (пространство имен и имя через пробел)
+ROW_TAG = "http://schemas.openxmlformats.org/spreadsheetml/2006/main row"
+CELL_TAG = "http://schemas.openxmlformats.org/spreadsheetml/2006/main c"
+VALUE_TAG = "http://schemas.openxmlformats.org/spreadsheetml/2006/main v"
+FORMULA_TAG = "http://schemas.openxmlformats.org/spreadsheetml/2006/main f"
+INLINE_STRING_TAG = "http://schemas.openxmlformats.org/spreadsheetml/2006/main is"
+TEXT_TAG = "http://schemas.openxmlformats.org/spreadsheetml/2006/main t"
+PHONETIC_TAG = "http://schemas.openxmlformats.org/spreadsheetml/2006/main rPh"
+STRING_ITEM_TAG = "http://schemas.openxmlformats.org/spreadsheetml/2006/main si"
+DIMENSION_TAG = "http://schemas.openxmlformats.org/spreadsheetml/2006/main dimension"
+SHEET_DATA_TAG = "http://schemas.openxmlformats.org/spreadsheetml/2006/main sheetData"
+
+# размер порции XML, передаваемой парсеру за один раз
+CHUNK_SIZE = 1 << 16
+DIGITS = "0123456789"
+
+# встроенные форматы дат и времени (идентификаторы `numFmtId`)
+BUILTIN_DATE_FORMATS = frozenset((*range(14, 23), 45, 46, 47))
+# части формата, не влияющие на определение даты (строки в кавычках и модификаторы в скобках, кроме `[h]`)
+FORMAT_STRIP = re.compile(r'".*?"|\[(?!hh?\]|mm?\]|ss?\])[^\]]*\]')
+FORMAT_DATE = re.compile(r"[^\\][dmhysDMHYS]")
+
+# начало отсчета дат Excel (с учетом ошибочного 29.02.1900) и для книг с датами от 1904 года
+WINDOWS_EPOCH = datetime(1899, 12, 30)
+MAC_EPOCH = datetime(1904, 1, 1)
+SECONDS_PER_DAY = 86400
+
+# индексы столбцов по буквенным обозначениям (`A` – 1)
+COLUMNS: dict[str, int] = {}
+
+
+def column_index(letters: str) -> int:
+    """
+    Получение номера столбца по буквенному обозначению.
+
+    :param letters: Буквенное обозначение столбца (`A`, `AB` и т.д.).
+    :return: Номер столбца (начиная с 1).
+    """
+
+    index = COLUMNS.get(letters)
+    if index is None:
+        index = 0
+        for letter in letters:
+            index = index * 26 + ord(letter) - 64
+        COLUMNS[letters] = index
+
+    return index
+
+
+def split_reference(reference: str) -> tuple[int, int]:
+    """
+    Получение номеров строки и столбца по адресу ячейки.
+
+    :param reference: Адрес ячейки (`B12`).
+    :return: Номер строки и номер столбца.
+    """
+
+    letters = reference.rstrip(DIGITS)
+    digits = len(letters)
+
+    return int(reference[digits:]), column_index(letters)
+
+
+def is_date_format(code: str) -> bool:
+    """
+    Проверка, является ли формат числа форматом даты или времени.
+
+    :param code: Код формата числа.
+    :return:
+    """
+
+    return FORMAT_DATE.search(FORMAT_STRIP.sub("", code.split(";")[0])) is not None
+
+
+def from_excel(value: float, epoch: datetime = WINDOWS_EPOCH) -> Any:
+    """
+    Преобразование числа Excel в дату, время или продолжительность.
+
+    :param value: Число дней от начала отсчета.
+    :param epoch: Начало отсчета дат рабочей книги.
+    :return: Дата и время или время (для значений меньше суток).
+    """
+
+    day, fraction = divmod(value, 1)
+    diff = timedelta(milliseconds=round(fraction * SECONDS_PER_DAY * 1000))
+    if 0 <= value < 1 and diff.days == 0:
+        return (datetime.min + diff).time()
+    if 0 < value < 60 and epoch == WINDOWS_EPOCH:
+        # даты до 01.03.1900 (Excel считает 1900 год високосным)
+        day += 1
+
+    return epoch + timedelta(days=day) + diff
+
+
+def to_number(value: str) -> int | float:
+    """
+    Преобразование значения числовой ячейки.
+
+    :param value: Текст значения.
+    :return: Целое число, если значение не содержит дробной части или экспоненты, иначе – вещественное.
+    """
+
+    if "." in value or "E" in value or "e" in value:
+        return float(value)
+
+    return int(value)
+
+
+class StringsParser:
+    """
+    Разбор общих строк (`xl/sharedStrings.xml`) обработчиками событий `expat`.
+
+    Текст строки (`<si>`) собирается из простого текста и форматированных фрагментов (`<r>`)
+    без фонетических подсказок (`<rPh>`), как в `openpyxl`.
+    """
+
+    def __init__(self) -> None:
+        self.strings: list[str] = []
+        self.parts: list[str] = []
+        self.text: Optional[list[str]] = None
+        self.phonetic = False
+
+        self.parser = expat.ParserCreate(namespace_separator=" ")
+        self.parser.buffer_text = True
+        self.parser.StartElementHandler = self.start
+        self.parser.EndElementHandler = self.end
+        self.parser.CharacterDataHandler = self.data
+
+    def start(self, name: str, attributes: dict[str, str]) -> None:  # pylint: disable=unused-argument
+        if name == TEXT_TAG:
+            if not self.phonetic:
+                self.text = []
+        elif name == STRING_ITEM_TAG:
+            self.parts = []
+        elif name == PHONETIC_TAG:
+            self.phonetic = True
+
+    def end(self, name: str) -> None:
+        if name == TEXT_TAG:
+            if self.text is not None:
+                self.parts.append("".join(self.text))
+                self.text = None
+        elif name == STRING_ITEM_TAG:
+            self.strings.append("".join(self.parts))
+        elif name == PHONETIC_TAG:
+            self.phonetic = False
+
+    def data(self, text: str) -> None:
+        if self.text is not None:
+            self.text.append(text)
+
+    def parse(self, source: IO[bytes]) -> list[str]:
+        """
+        Разбор общих строк.
+
+        :param source: Поток XML-файла общих строк.
+        :return: Общие строки в порядке индексов.
+        """
+
+        self.parser.ParseFile(source)
+
+        return self.strings
+
+
+class SheetParser:
+    """
+    Разбор XML листа обработчиками событий `expat`.
+
+    Обработчики `expat` вызываются без построения дерева элементов, поэтому разбор в несколько раз быстрее
+    `iterparse`. Разобранные строки накапливаются в `rows` и забираются после каждой порции XML.
+    """
+
+    def __init__(self, workbook: "XLSXWorkbook") -> None:
+        """
+        Конструктор.
+
+        :param workbook: Рабочая книга.
+        """
+
+        self.shared_strings = workbook.shared_strings
+        self.date_styles = workbook.date_styles
+        self.epoch = workbook.epoch
+
+        self.rows: list[tuple[int, list[tuple[int, Any]]]] = []
+        self.dimension: Optional[str] = None
+        self.row_number = 0
+        self.cells: list[tuple[int, Any]] = []
+        self.column = 0
+        self.data_type = "n"
+        self.style: Optional[str] = None
+        self.value: Optional[str] = None
+        self.formula: Optional[str] = None
+        # текст строки с форматированием в ячейке (`<is>`), `None` – вне строки
+        self.inline: Optional[list[str]] = None
+        self.phonetic = False
+        # текст текущего элемента, `None` – текст не собирается
+        self.text: Optional[list[str]] = None
+
+        self.parser = expat.ParserCreate(namespace_separator=" ")
+        self.parser.buffer_text = True
+        self.parser.StartElementHandler = self.start
+        self.parser.EndElementHandler = self.end
+        self.parser.CharacterDataHandler = self.data
+
+    def start(self, name: str, attributes: dict[str, str]) -> None:
+        # проверки упорядочены по частоте элементов
+        if name == CELL_TAG:
+            reference = attributes.get("r")
+            self.column = column_index(reference.rstrip(DIGITS)) if reference else self.column + 1
+            self.data_type = attributes.get("t", "n")
+            self.style = attributes.get("s")
+            self.value = self.formula = self.inline = None
+        elif name == VALUE_TAG or name == FORMULA_TAG:  # pylint: disable=consider-using-in
+            self.text = []
+        elif name == ROW_TAG:
+            number = attributes.get("r")
+            self.row_number = int(float(number)) if number else self.row_number + 1
+            self.cells = []
+            self.column = 0
+        elif name == TEXT_TAG:
+            if self.inline is not None and not self.phonetic:
+                self.text = []
+        elif name == INLINE_STRING_TAG:
+            self.inline = []
+        elif name == PHONETIC_TAG:
+            self.phonetic = True
+        elif name == DIMENSION_TAG:
+            self.dimension = attributes.get("ref", "")
+
+    def end(self, name: str) -> None:
+        if name == VALUE_TAG:
+            self.value = "".join(self.text or ())
+            self.text = None
+        elif name == CELL_TAG:
+            self.cells.append((self.column, self.convert()))
+        elif name == ROW_TAG:
+            self.rows.append((self.row_number, self.cells))
+        elif name == FORMULA_TAG:
+            self.formula = "".join(self.text or ())
+            self.text = None
+        elif name == TEXT_TAG:
+            if self.text is not None and self.inline is not None:
+                self.inline.append("".join(self.text))
+            self.text = None
+        elif name == PHONETIC_TAG:
+            self.phonetic = False
+
+    def data(self, text: str) -> None:
+        if self.text is not None:
+            self.text.append(text)
+
+    def convert(self) -> Any:  # pylint: disable=too-many-return-statements
+        """
+        Преобразование значения разобранной ячейки по ее типу и стилю.
+
+        :return:
+        """
+
+        if self.formula:
+            return f"={self.formula}"
+
+        data_type = self.data_type
+        if data_type == "inlineStr":
+            return "".join(self.inline) if self.inline is not None else None
+
+        value = self.value
+        if not value:
+            return None
+        if data_type == "s":
+            return self.shared_strings[int(value)]
+        if data_type == "n":
+            number = to_number(value)
+            if self.style is not None:
+                style = int(self.style)
+                if style in self.date_styles:
+                    return from_excel(number, self.epoch)
+            return number
+        if data_type == "b":
+            return bool(int(value))
+        if data_type == "d":
+            return datetime.fromisoformat(value.rstrip("Z"))
+
+        return value
+
+
+class XLSXWorksheet:
+    """
+    Лист рабочей книги с потоковым чтением строк.
+    """
+
+    def __init__(self, workbook: "XLSXWorkbook", title: str, path: str) -> None:
+        """
+        Конструктор.
+
+        :param workbook: Рабочая книга.
+        :param title: Наименование листа.
+        :param path: Путь к XML-файлу листа в архиве.
+        """
+
+        self.workbook = workbook
+        self.title = title
+        self.path = path
+
+    def iter_cells(self, parser: Optional[SheetParser] = None) -> Iterator[tuple[int, list[tuple[int, Any]]]]:
+        """
+        Потоковое чтение заполненных ячеек листа.
+
+        :param parser: Парсер листа (для получения размеров листа по ходу чтения).
+        :return: Генератор пар из номера строки и списка пар из номера столбца и значения ячейки.
+        """
+
+        parser = parser or SheetParser(self.workbook)
+        with self.workbook.archive.open(self.path) as source:
+            while chunk := source.read(CHUNK_SIZE):
+                parser.parser.Parse(chunk, False)
+                if parser.rows:
+                    rows, parser.rows = parser.rows, []
+                    yield from rows
+            parser.parser.Parse(b"", True)
+            yield from parser.rows
+
+    @staticmethod
+    def dimensions(parser: SheetParser) -> tuple[Optional[int], Optional[int]]:
+        """
+        Получение количества строк и столбцов листа из элемента `<dimension>` (если указан).
+
+        :param parser: Парсер листа, разобравший начало листа.
+        :return: Номер последней строки и номер последнего столбца.
+        """
+
+        reference = (parser.dimension or "").split(":")[-1]
+        if reference.rstrip(DIGITS) and reference[-1:].isdigit():
+            return split_reference(reference)
+
+        return None, None
+
+    def iter_rows(  # pylint: disable=too-many-locals
+        self,
+        min_row: int = 1,
+        max_row: Optional[int] = None,
+        values_only: bool = True,
+    ) -> Iterator[tuple[Any, ...]]:
+        """
+        Потоковое чтение значений строк листа.
+
+        Пропущенные строки и ячейки заполняются значениями `None` до размеров листа из `<dimension>`,
+        как в `openpyxl`.
+
+        :param min_row: Номер первой строки.
+        :param max_row: Номер последней строки (по умолчанию – по размеру листа).
+        :param values_only: Поддерживается только чтение значений (для совместимости с `openpyxl`).
+        :return: Генератор кортежей значений ячеек.
+        """
+
+        if not values_only:
+            raise ValueError("Поддерживается только чтение значений ячеек (values_only=True).")
+
+        parser = SheetParser(self.workbook)
+        cells_iterator = self.iter_cells(parser)
+        # `<dimension>` предшествует данным листа, поэтому размеры известны после разбора первой порции
+        first = next(cells_iterator, None)
+        last_row, max_column = self.dimensions(parser)
+        max_row = max_row or last_row
+        empty_row: tuple[Any, ...] = (None,) * max_column if max_column else ()
+
+        counter = min_row
+        number = 1
+        for number, cells in chain((first,) if first else (), cells_iterator):
+            if max_row is not None and number > max_row:
+                break
+
+            # пропущенные строки
+            for _ in range(counter, number):
+                counter += 1
+                yield empty_row
+
+            if counter <= number:
+                counter += 1
+                width = max_column or (cells[-1][0] if cells else 0)
+                row: list[Any] = [None] * width
+                for column, value in cells:
+                    if column <= width:
+                        row[column - 1] = value
+                yield tuple(row)
+
+        if max_row is not None and max_row < number:
+            for _ in range(counter, max_row + 1):
+                yield empty_row
+
+
+class XLSXWorkbook:
+    """
+    Рабочая книга Excel с потоковым чтением листов.
+    """
+
+    def __init__(self, path: Path | str | IO[bytes]) -> None:
+        """
+        Конструктор.
+
+        :param path: Путь (или файловый объект) к файлу Excel.
+        """
+
+        # архив закрывается в `close` (как рабочая книга openpyxl в режиме потокового чтения)
+        self.archive = zipfile.ZipFile(path)  # pylint: disable=consider-using-with
+        self.epoch = WINDOWS_EPOCH
+        self.sheets: dict[str, str] = {}
+        self.date_styles: frozenset[int] = frozenset()
+        self._shared_strings: Optional[list[str]] = None
+
+        self.load_workbook()
+        self.load_styles()
+
+    def __enter__(self) -> "XLSXWorkbook":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def __getitem__(self, name: str) -> XLSXWorksheet:
+        if name not in self.sheets:
+            raise KeyError(f"Worksheet {name} does not exist.")
+
+        return XLSXWorksheet(self, name, self.sheets[name])
+
+    @property
+    def sheetnames(self) -> list[str]:
+        """
+        Получение наименований листов в порядке следования.
+
+        :return:
+        """
+
+        return list(self.sheets)
+
+    def close(self) -> None:
+        """
+        Закрытие файла рабочей книги.
+        """
+
+        self.archive.close()
+
+    def load_workbook(self) -> None:
+        """
+        Чтение списка листов (`xl/workbook.xml`) и путей к ним (`xl/_rels/workbook.xml.rels`).
+        """
+
+        with self.archive.open("xl/_rels/workbook.xml.rels") as source:
+            targets = {
+                relationship.get("Id"): relationship.get("Target", "")
+                for relationship in parse(source).getroot().iter(f"{PACKAGE_RELATIONSHIPS_NS}Relationship")
+            }
+
+        with self.archive.open("xl/workbook.xml") as source:
+            root = parse(source).getroot()
+
+        properties = root.find(f"{MAIN_NS}workbookPr")
+        if properties is not None and properties.get("date1904") in ("1", "true"):
+            self.epoch = MAC_EPOCH
+
+        for sheet in root.iter(f"{MAIN_NS}sheet"):
+            target = targets[sheet.get(f"{RELATIONSHIPS_NS}id")]
+            # путь указывается относительно `xl/` или от корня архива
+            path = target.lstrip("/") if target.startswith("/") else str(PurePosixPath("xl") / target)
+            self.sheets[sheet.get("name", "")] = path
+
+    def load_styles(self) -> None:
+        """
+        Определение стилей ячеек с форматами дат (`xl/styles.xml`).
+        """
+
+        if "xl/styles.xml" not in self.archive.NameToInfo:
+            return
+
+        with self.archive.open("xl/styles.xml") as source:
+            root = parse(source).getroot()
+
+        formats = {
+            int(number_format.get("numFmtId", 0)): number_format.get("formatCode", "")
+            for number_format in root.iter(f"{MAIN_NS}numFmt")
+        }
+
+        date_styles = set()
+        cell_formats = root.find(f"{MAIN_NS}cellXfs")
+        for index, cell_format in enumerate(cell_formats if cell_formats is not None else ()):
+            format_id = int(cell_format.get("numFmtId", 0))
+            code = formats.get(format_id)
+            if code is None:
+                if format_id in BUILTIN_DATE_FORMATS:
+                    date_styles.add(index)
+            elif is_date_format(code):
+                date_styles.add(index)
+
+        self.date_styles = frozenset(date_styles)
+
+    @property
+    def shared_strings(self) -> list[str]:
+        """
+        Получение общих строк рабочей книги (читаются потоково при первом обращении).
+
+        :return:
+        """
+
+        if self._shared_strings is None:
+            strings: list[str] = []
+            if "xl/sharedStrings.xml" in self.archive.NameToInfo:
+                with self.archive.open("xl/sharedStrings.xml") as source:
+                    strings = StringsParser().parse(source)
+            self._shared_strings = strings
+
+        return self._shared_strings
@@ -3,26 +3,54 @@
 """
 from __future__ import annotations
 
+import html
+import re
+import sys
+import zipfile
+from functools import lru_cache
+from io import BytesIO, TextIOWrapper
 from pathlib import Path
+from typing import IO, Iterable, Iterator, Type
+from xml.sax.saxutils import escape
 
 from docx import Document
+from docx.document import Document as DocumentObject
 from docx.enum.text import WD_ALIGN_PARAGRAPH  # pylint: disable=E0611
 from docx.shared import Pt
 
 
+# путь для вывода в стандартный поток вывода
+STDOUT = "-"
+
+
+def binary_output(path: Path | str | IO[bytes]) -> Path | str | IO[bytes]:
+    """
+    Получение назначения для записи двоичного выходного файла.
+
+    :param path: Путь (или файловый объект) для сохранения выходного файла, `-` – стандартный поток вывода.
+    :return:
+    """
+
+    return sys.stdout.buffer if path == STDOUT else path
+
+
 class Renderer:
     """
     Создание выходного файла – Word.
     """
 
-    def __init__(self, rows: tuple[str, ...]):
+    # расширение выходного файла
+    suffix = ".docx"
+
+    def __init__(self, rows: Iterable[str]):
         self.rows = rows
 
-    def render(self, path: Path | str) -> None:
+    @staticmethod
+    def create_document() -> DocumentObject:
         """
-        Метод генерации Word-файла со списком использованных источников.
+        Создание документа Word с заголовком и стилями текста (без списка источников).
 
-        :param Path | str path: Путь для сохранения выходного файла.
+        :return: Документ Word.
         """
 
         document = Document()
@@ -40,9 +68,331 @@ class Renderer:
         style_normal.paragraph_format.line_spacing = 1.5
         style_normal.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
 
+        return document
+
+    def render(self, path: Path | str | IO[bytes]) -> None:
+        """
+        Метод генерации Word-файла со списком использованных источников.
+
+        :param Path | str | IO[bytes] path: Путь (или файловый объект) для сохранения выходного файла.
+        """
+
+        document = self.create_document()
+
         for row in self.rows:
             # добавление источника
             document.add_paragraph(row, style="List Number")
 
         # сохранение файла Word
-        document.save(path)
+        document.save(binary_output(path))
+
+
+# символы, недопустимые в XML (python-docx также отклоняет строки с такими символами)
+INVALID_XML_CHARS = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\ud800-\udfff￾￿]")
+# символы, которые Word хранит отдельными элементами (табуляция и перевод строки)
+SPECIAL_CHARS = re.compile("([\t\n\r])")
+
+# количество абзацев, кодируемых и записываемых в файл за одну операцию
+WRITE_BATCH_SIZE = 512
+
+
+@lru_cache(maxsize=1)
+def base_package() -> tuple[bytes, str, bytes, bytes]:
+    """
+    Получение базового пакета документа Word без списка источников (создается один раз).
+
+    :return: Содержимое пакета, наименование стиля нумерованного списка,
+        начало `word/document.xml` (до окончания заголовка) и окончание (параметры раздела).
+    """
+
+    document = Renderer.create_document()
+    style_id = document.styles["List Number"].style_id
+
+    stream = BytesIO()
+    document.save(stream)
+    package = stream.getvalue()
+
+    with zipfile.ZipFile(BytesIO(package)) as archive:
+        xml = archive.read("word/document.xml")
+
+    # абзацы списка источников располагаются перед параметрами раздела в конце тела документа
+    position = xml.rindex(b"<w:sectPr")
+
+    return package, style_id, xml[:position], xml[position:]
+
+
+def text_xml(text: str) -> str:
+    """
+    Получение XML-элемента `<w:t>` с экранированным текстом.
+
+    :param text: Текст.
+    :return: XML-фрагмент.
+    """
+
+    if len(text.strip()) < len(text):
+        return f'<w:t xml:space="preserve">{escape(text)}</w:t>'
+
+    return f"<w:t>{escape(text)}</w:t>"
+
+
+def paragraph_xml(text: str, style_id: str) -> str:
+    """
+    Получение XML-фрагмента абзаца нумерованного списка, аналогичного `Document.add_paragraph`.
+
+    :param text: Текст абзаца.
+    :param style_id: Идентификатор стиля абзаца.
+    :return: XML-фрагмент.
+    """
+
+    if INVALID_XML_CHARS.search(text):
+        raise ValueError(f"Строка содержит символы, недопустимые в XML: {text!r}")
+
+    properties = f'<w:pPr><w:pStyle w:val="{style_id}"/></w:pPr>'
+    if not text:
+        return f"<w:p>{properties}</w:p>"
+
+    if not SPECIAL_CHARS.search(text):
+        return f"<w:p>{properties}<w:r>{text_xml(text)}</w:r></w:p>"
+
+    content = []
+    for part in SPECIAL_CHARS.split(text):
+        if part == "\t":
+            content.append("<w:tab/>")
+        elif part in ("\n", "\r"):
+            content.append("<w:br/>")
+        elif part:
+            content.append(text_xml(part))
+
+    return f"<w:p>{properties}<w:r>{''.join(content)}</w:r></w:p>"
+
+
+class FastRenderer(Renderer):
+    """
+    Создание выходного файла – Word без объектной модели python-docx.
+
+    Абзацы списка источников записываются потоком в `word/document.xml` базового пакета документа,
+    поэтому результат совпадает с `Renderer`, а расход памяти не зависит от количества источников.
+    """
+
+    def iter_chunks(self, style_id: str) -> Iterator[bytes]:
+        """
+        Получение закодированных XML-фрагментов абзацев пачками.
+
+        :param style_id: Идентификатор стиля абзаца.
+        :return: Генератор XML-фрагментов в кодировке UTF-8.
+        """
+
+        batch = []
+        for row in self.rows:
+            batch.append(paragraph_xml(row, style_id))
+            if len(batch) >= WRITE_BATCH_SIZE:
+                yield "".join(batch).encode("utf-8")
+                batch = []
+
+        if batch:
+            yield "".join(batch).encode("utf-8")
+
+    def render(self, path: Path | str | IO[bytes]) -> None:
+        """
+        Метод генерации Word-файла со списком использованных источников.
+
+        :param Path | str | IO[bytes] path: Путь (или файловый объект) для сохранения выходного файла.
+        """
+
+        package, style_id, head, tail = base_package()
+
+        try:
+            with zipfile.ZipFile(BytesIO(package)) as source, zipfile.ZipFile(
+                binary_output(path), "w", zipfile.ZIP_DEFLATED
+            ) as target:
+                for info in source.infolist():
+                    if info.filename != "word/document.xml":
+                        target.writestr(info, source.read(info))
+                        continue
+
+                    document_info = zipfile.ZipInfo(info.filename, info.date_time)
+                    document_info.compress_type = info.compress_type
+                    document_info.external_attr = info.external_attr
+                    with target.open(document_info, "w") as file:
+                        file.write(head)
+                        for chunk in self.iter_chunks(style_id):
+                            file.write(chunk)
+                        file.write(tail)
+        except ValueError:
+            # недописанный файл удаляется, как если бы документ не был сохранен
+            if isinstance(path, (str, Path)) and path != STDOUT:
+                Path(path).unlink(missing_ok=True)
+            raise
+
+
+class TextRenderer(Renderer):
+    """
+    Базовый класс потоковой генерации текстового выходного файла.
+
+    Строки списка источников записываются в файл пачками по мере получения, без накопления в памяти.
+    """
+
+    suffix = ".txt"
+
+    def header(self) -> str:
+        """
+        Получение начала файла (до списка источников).
+
+        :return:
+        """
+
+        return ""
+
+    def footer(self) -> str:
+        """
+        Получение окончания файла (после списка источников).
+
+        :return:
+        """
+
+        return ""
+
+    def entry(self, number: int, text: str) -> str:
+        """
+        Получение записи источника.
+
+        :param number: Порядковый номер источника.
+        :param text: Отформатированная строка источника.
+        :return:
+        """
+
+        return f"{number}. {text}\n"
+
+    def write(self, file: IO[str]) -> None:
+        """
+        Запись списка источников в текстовый поток.
+
+        :param file: Текстовый поток.
+        """
+
+        file.write(self.header())
+
+        batch = []
+        for number, row in enumerate(self.rows, start=1):
+            batch.append(self.entry(number, row))
+            if len(batch) >= WRITE_BATCH_SIZE:
+                file.write("".join(batch))
+                batch = []
+
+        file.write("".join(batch))
+        file.write(self.footer())
+
+    def render(self, path: Path | str | IO[bytes]) -> None:
+        """
+        Метод генерации текстового файла со списком использованных источников.
+
+        :param Path | str | IO[bytes] path: Путь (или файловый объект) для сохранения выходного файла,
+            `-` – стандартный поток вывода.
+        """
+
+        if path == STDOUT:
+            self.write(sys.stdout)
+            sys.stdout.flush()
+        elif isinstance(path, (str, Path)):
+            with open(path, "w", encoding="utf-8", newline="\n") as file:
+                self.write(file)
+        else:
+            stream = TextIOWrapper(path, encoding="utf-8", newline="\n")
+            try:
+                self.write(stream)
+                stream.flush()
+            finally:
+                # файловый объект остается открытым для вызывающего кода
+                stream.detach()
+
+
+class PlainTextRenderer(TextRenderer):
+    """
+    Создание выходного файла – обычный текст (нумерованный список).
+    """
+
+    def header(self) -> str:
+        return "Список использованной литературы\n\n"
+
+
+class HTMLRenderer(TextRenderer):
+    """
+    Создание выходного файла – HTML-страница с нумерованным списком.
+    """
+
+    suffix = ".html"
+
+    def header(self) -> str:
+        return (
+            '<!DOCTYPE html>\n<html lang="ru">\n<head>\n<meta charset="utf-8">\n'
+            "<title>Список использованной литературы</title>\n</head>\n<body>\n"
+            "<h1>Список использованной литературы</h1>\n<ol>\n"
+        )
+
+    def footer(self) -> str:
+        return "</ol>\n</body>\n</html>\n"
+
+    def entry(self, number: int, text: str) -> str:
+        return f"<li>{html.escape(INVALID_XML_CHARS.sub('', text), quote=False)}</li>\n"
+
+
+# символы разметки Markdown, экранируемые в тексте
+MARKDOWN_CHARS = re.compile(r"([\\`*_\[\]<>#|])")
+
+
+class MarkdownRenderer(TextRenderer):
+    """
+    Создание выходного файла – Markdown с нумерованным списком.
+    """
+
+    suffix = ".md"
+
+    def header(self) -> str:
+        return "# Список использованной литературы\n\n"
+
+    def entry(self, number: int, text: str) -> str:
+        # переводы строк внутри записи не должны разрывать элемент списка
+        text = " ".join(MARKDOWN_CHARS.sub(r"\\\1", text).splitlines())
+
+        return f"{number}. {text}\n"
+
+
+# экранирование специальных символов BibTeX (LaTeX)
+BIBTEX_CHARS = str.maketrans(
+    {
+        "\\": r"\textbackslash{}",
+        "{": r"\{",
+        "}": r"\}",
+        "&": r"\&",
+        "%": r"\%",
+        "$": r"\$",
+        "#": r"\#",
+        "_": r"\_",
+        "~": r"\textasciitilde{}",
+        "^": r"\textasciicircum{}",
+    }
+)
+
+
+class BibTeXRenderer(TextRenderer):
+    """
+    Создание выходного файла – BibTeX.
+
+    Оформленная строка источника сохраняется в поле `note` записи `@misc`,
+    поэтому порядок и оформление списка совпадают с остальными форматами.
+    """
+
+    suffix = ".bib"
+
+    def entry(self, number: int, text: str) -> str:
+        return f"@misc{{ref{number},\n  note = {{{text.translate(BIBTEX_CHARS)}}}\n}}\n\n"
+
+
+# классы генерации выходного файла по форматам
+RENDERERS: dict[str, Type[Renderer]] = {
+    "docx": FastRenderer,
+    "txt": PlainTextRenderer,
+    "html": HTMLRenderer,
+    "md": MarkdownRenderer,
+    "bibtex": BibTeXRenderer,
+}
@@ -0,0 +1,453 @@
+"""
+Сервис генерации списков источников по HTTP.
+
+Сервис работает в одном процессе на `asyncio` и держит пул процессов для оформления и генерации выходных файлов,
+поэтому модули, шаблоны стилей и шаблон выходного файла загружаются один раз, а не при каждом запуске приложения.
+
+Поддерживаемые запросы:
+
+- `POST /bibliography?style=GOST` – генерация выходного файла Word. Тело запроса – входной файл Excel
+  или JSON-массив записей источников (заголовок `Content-Type: application/json`, см. :mod:`readers.records`);
+- `GET /metrics` – количество запросов и статистика времени ответа;
+- `GET /health` – проверка работоспособности.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import multiprocessing
+import time
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from http import HTTPStatus
+from io import BytesIO
+from typing import Optional
+from urllib.parse import parse_qs, urlsplit
+
+import click
+
+from logger import attach_worker, get_logger, share_worker
+from pipeline import CitationPipeline
+from readers.reader import SourcesReader
+from readers.records import parse_records
+from renderer import FastRenderer, base_package
+from settings import (
+    SERVICE_CONCURRENCY,
+    SERVICE_HOST,
+    SERVICE_MAX_BODY_SIZE,
+    SERVICE_PORT,
+    SERVICE_READ_TIMEOUT,
+    SERVICE_WORKERS,
+)
+
+
+logger = get_logger(__name__)
+
+# тип содержимого выходного файла Word
+DOCX_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+# количество последних запросов для расчета статистики времени ответа
+LATENCY_WINDOW = 1000
+
+
+def warm_up() -> None:
+    """
+    Подготовка процесса пула: загрузка модулей и шаблона выходного файла до первого запроса.
+    """
+
+    base_package()
+
+
+def build_document(body: bytes, content_type: str, style: str) -> bytes:
+    """
+    Оформление списка источников и генерация выходного файла (выполняется в процессе пула).
+
+    :param body: Входной файл Excel или JSON-массив записей источников.
+    :param content_type: Тип содержимого тела запроса.
+    :param style: Наименование стиля цитирования.
+    :return: Выходной файл Word.
+    :raises ValueError: Если входные данные не удалось прочитать.
+    """
+
+    try:
+        if content_type.startswith("application/json"):
+            records = json.loads(body)
+            if not isinstance(records, list):
+                raise ValueError("Ожидается JSON-массив записей источников.")
+            models = list(parse_records(records))
+        else:
+            with SourcesReader(BytesIO(body)) as reader:  # type: ignore
+                models = reader.read()
+    except Exception as ex:
+        # исключения валидации передаются из процесса пула одним сообщением
+        raise ValueError(f"Не удалось прочитать источники: {ex}") from None
+
+    buffer = BytesIO()
+    FastRenderer(CitationPipeline(models, (style,)).rows(style)).render(buffer)
+
+    return buffer.getvalue()
+
+
+async def read_head(reader: asyncio.StreamReader) -> tuple[str, str, dict[str, str]]:
+    """
+    Чтение строки запроса и заголовков.
+
+    :param reader: Поток чтения запроса.
+    :return: Метод, путь запроса и заголовки (наименования в нижнем регистре).
+    :raises ValueError: Если строка запроса или заголовки некорректны.
+    """
+
+    method, target, _ = (await reader.readline()).decode("latin-1").split(" ", 2)
+    headers = {}
+    while line := (await reader.readline()).decode("latin-1").strip():
+        name, value = line.split(":", 1)
+        headers[name.strip().lower()] = value.strip()
+
+    return method, target, headers
+
+
+class Metrics:
+    """
+    Метрики обработки запросов.
+    """
+
+    def __init__(self, window: int = LATENCY_WINDOW) -> None:
+        """
+        Конструктор.
+
+        :param window: Количество последних запросов для расчета статистики времени ответа.
+        """
+
+        self.requests = 0
+        self.in_flight = 0
+        self.statuses: Counter[int] = Counter()
+        self.latencies: deque[float] = deque(maxlen=window)
+
+    def observe(self, status: int, seconds: float) -> None:
+        """
+        Учет обработанного запроса.
+
+        :param status: Код ответа.
+        :param seconds: Время ответа в секундах.
+        """
+
+        self.requests += 1
+        self.statuses[status] += 1
+        self.latencies.append(seconds)
+
+    def stats(self) -> dict:
+        """
+        Получение метрик.
+
+        :return: Количество запросов (всего, в обработке, по кодам ответа) и время ответа в миллисекундах
+            (среднее, перцентили и максимальное) по последним запросам.
+        """
+
+        latencies = sorted(self.latencies)
+        latency = {}
+        if latencies:
+            latency = {
+                "mean": sum(latencies) / len(latencies) * 1000,
+                "p50": latencies[int(len(latencies) * 0.5)] * 1000,
+                "p95": latencies[min(int(len(latencies) * 0.95), len(latencies) - 1)] * 1000,
+                "p99": latencies[min(int(len(latencies) * 0.99), len(latencies) - 1)] * 1000,
+                "max": latencies[-1] * 1000,
+            }
+
+        return {
+            "requests": self.requests,
+            "in_flight": self.in_flight,
+            "statuses": {str(status): count for status, count in sorted(self.statuses.items())},
+            "latency_ms": latency,
+        }
+
+
+class Response:
+    """
+    Ответ на HTTP-запрос.
+    """
+
+    def __init__(
+        self,
+        status: HTTPStatus,
+        body: bytes = b"",
+        content_type: str = "application/json",
+        headers: Optional[dict] = None,
+    ) -> None:
+        self.status = status
+        self.body = body
+        self.content_type = content_type
+        self.headers = headers or {}
+
+    @classmethod
+    def json(cls, status: HTTPStatus, data: dict) -> "Response":
+        """
+        Ответ в формате JSON.
+
+        :param status: Код ответа.
+        :param data: Данные ответа.
+        :return:
+        """
+
+        return cls(status, json.dumps(data, ensure_ascii=False).encode("utf-8"))
+
+    @classmethod
+    def error(cls, status: HTTPStatus, message: str) -> "Response":
+        """
+        Ответ с описанием ошибки.
+
+        :param status: Код ответа.
+        :param message: Описание ошибки.
+        :return:
+        """
+
+        return cls.json(status, {"error": message})
+
+    def encode(self) -> bytes:
+        """
+        Получение ответа для передачи по сети.
+
+        :return:
+        """
+
+        headers = {
+            "Content-Type": self.content_type,
+            "Content-Length": str(len(self.body)),
+            "Connection": "close",
+            **self.headers,
+        }
+        head = f"HTTP/1.1 {self.status.value} {self.status.phrase}\r\n"
+        head += "".join(f"{name}: {value}\r\n" for name, value in headers.items())
+
+        return (head + "\r\n").encode("latin-1") + self.body
+
+
+class BibliographyService:
+    """
+    Сервис генерации списков источников.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = SERVICE_WORKERS,
+        concurrency: int = SERVICE_CONCURRENCY,
+        max_body_size: int = SERVICE_MAX_BODY_SIZE,
+        read_timeout: float = SERVICE_READ_TIMEOUT,
+    ) -> None:
+        """
+        Конструктор.
+
+        :param max_workers: Количество процессов для оформления и генерации выходных файлов.
+        :param concurrency: Максимальное количество одновременно обрабатываемых запросов.
+        :param max_body_size: Максимальный размер тела запроса в байтах.
+        :param read_timeout: Время ожидания заголовков и тела запроса в секундах.
+        """
+
+        self.max_workers = max_workers
+        self.concurrency = concurrency
+        self.max_body_size = max_body_size
+        self.read_timeout = read_timeout
+        self.metrics = Metrics()
+        self.executor: Optional[ProcessPoolExecutor] = None
+        self.semaphore: Optional[asyncio.Semaphore] = None
+        self.server: Optional[asyncio.Server] = None
+
+    async def start(self, host: str = SERVICE_HOST, port: int = SERVICE_PORT) -> asyncio.Server:
+        """
+        Запуск сервиса.
+
+        :param host: Адрес.
+        :param port: Порт (`0` – любой свободный порт).
+        :return: Запущенный сервер.
+        """
+
+        # процессы пула запускаются заново (а не копированием текущего процесса), чтобы не унаследовать сокеты,
+        # и все сразу, до приема соединений; логи процессов пула записываются основным процессом
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=attach_worker,
+            initargs=share_worker(),
+        )
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(loop.run_in_executor(self.executor, warm_up) for _ in range(self.max_workers)))
+
+        self.semaphore = asyncio.Semaphore(self.concurrency)
+        self.server = await asyncio.start_server(self.handle, host, port)
+
+        logger.info("Сервис запущен: %s.", ", ".join(str(socket.getsockname()) for socket in self.server.sockets))
+
+        return self.server
+
+    async def close(self) -> None:
+        """
+        Остановка сервиса.
+        """
+
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        if self.executor is not None:
+            self.executor.shutdown()
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Обработка соединения (один запрос на соединение).
+
+        :param reader: Поток чтения запроса.
+        :param writer: Поток записи ответа.
+        """
+
+        start = time.perf_counter()
+        self.metrics.in_flight += 1
+        try:
+            response = await self.respond(reader)
+        except Exception as ex:  # pylint: disable=broad-except
+            logger.error("При обработке запроса возникла ошибка: %s", ex)
+            response = Response.error(HTTPStatus.INTERNAL_SERVER_ERROR, str(ex))
+        finally:
+            self.metrics.in_flight -= 1
+
+        try:
+            writer.write(response.encode())
+            await writer.drain()
+        finally:
+            writer.close()
+            self.metrics.observe(response.status.value, time.perf_counter() - start)
+
+    async def respond(self, reader: asyncio.StreamReader) -> Response:  # pylint: disable=too-many-return-statements
+        """
+        Чтение запроса и получение ответа.
+
+        :param reader: Поток чтения запроса.
+        :return:
+        """
+
+        try:
+            method, target, headers = await asyncio.wait_for(read_head(reader), self.read_timeout)
+            length = int(headers.get("content-length", 0))
+            if length < 0:
+                raise ValueError(f"Некорректный размер тела запроса: {length}.")
+        except asyncio.TimeoutError:
+            return Response.error(HTTPStatus.REQUEST_TIMEOUT, "Превышено время ожидания запроса.")
+        except ValueError:
+            return Response.error(HTTPStatus.BAD_REQUEST, "Некорректный запрос.")
+
+        if length > self.max_body_size:
+            return Response.error(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Превышен размер тела запроса.")
+
+        url = urlsplit(target)
+        if method == "GET" and url.path == "/health":
+            return Response.json(HTTPStatus.OK, {"status": "ok"})
+        if method == "GET" and url.path == "/metrics":
+            return Response.json(HTTPStatus.OK, self.metrics.stats())
+        if method == "POST" and url.path == "/bibliography":
+            style = parse_qs(url.query).get("style", ["GOST"])[0].upper()
+            return await self.bibliography(reader, length, headers.get("content-type", ""), style)
+
+        return Response.error(HTTPStatus.NOT_FOUND, "Неизвестный запрос.")
+
+    async def bibliography(self, reader: asyncio.StreamReader, length: int, content_type: str, style: str) -> Response:
+        """
+        Чтение тела запроса и генерация выходного файла в пуле процессов.
+
+        Тело запроса читается только после получения разрешения на обработку, поэтому в памяти находятся тела
+        не более чем `concurrency` запросов.
+
+        :param reader: Поток чтения запроса (после заголовков).
+        :param length: Размер тела запроса в байтах (входной файл Excel или JSON-массив записей источников).
+        :param content_type: Тип содержимого тела запроса.
+        :param style: Наименование стиля цитирования.
+        :return:
+        """
+
+        if style not in CitationPipeline.citation_formatters:
+            return Response.error(HTTPStatus.BAD_REQUEST, f"Неподдерживаемый стиль цитирования: {style}.")
+        if not length:
+            return Response.error(HTTPStatus.BAD_REQUEST, "Не передан список источников.")
+
+        async with self.semaphore:  # type: ignore
+            try:
+                body = await asyncio.wait_for(reader.readexactly(length), self.read_timeout)
+            except asyncio.TimeoutError:
+                return Response.error(HTTPStatus.REQUEST_TIMEOUT, "Превышено время ожидания тела запроса.")
+            except asyncio.IncompleteReadError:
+                return Response.error(HTTPStatus.BAD_REQUEST, "Тело запроса передано не полностью.")
+
+            loop = asyncio.get_running_loop()
+            try:
+                document = await loop.run_in_executor(self.executor, build_document, body, content_type, style)
+            except ValueError as ex:
+                return Response.error(HTTPStatus.BAD_REQUEST, str(ex))
+
+        return Response(
+            HTTPStatus.OK,
+            document,
+            DOCX_CONTENT_TYPE,
+            {"Content-Disposition": f'attachment; filename="bibliography_{style.lower()}.docx"'},
+        )
+
+
+async def serve(host: str, port: int, max_workers: int, concurrency: int) -> None:
+    """
+    Запуск сервиса до остановки процесса.
+
+    :param host: Адрес.
+    :param port: Порт.
+    :param max_workers: Количество процессов для оформления и генерации выходных файлов.
+    :param concurrency: Максимальное количество одновременно обрабатываемых запросов.
+    """
+
+    service = BibliographyService(max_workers, concurrency)
+    server = await service.start(host, port)
+    try:
+        await server.serve_forever()
+    finally:
+        await service.close()
+
+
+@click.command()
+@click.option("--host", "host", type=str, default=SERVICE_HOST, show_default=True, help="Адрес сервиса")
+@click.option(
+    "--port", "port", type=click.IntRange(min=0), default=SERVICE_PORT, show_default=True, help="Порт сервиса"
+)
+@click.option(
+    "--workers",
+    "-w",
+    "max_workers",
+    type=click.IntRange(min=1),
+    default=SERVICE_WORKERS,
+    show_default=True,
+    help="Количество процессов для оформления и генерации выходных файлов",
+)
+@click.option(
+    "--concurrency",
+    "-c",
+    "concurrency",
+    type=click.IntRange(min=1),
+    default=SERVICE_CONCURRENCY,
+    show_default=True,
+    help="Максимальное количество одновременно обрабатываемых запросов",
+)
+def run_service(
+    host: str = SERVICE_HOST,
+    port: int = SERVICE_PORT,
+    max_workers: int = SERVICE_WORKERS,
+    concurrency: int = SERVICE_CONCURRENCY,
+) -> None:
+    """
+    Запуск сервиса генерации списков источников.
+
+    :param str host: Адрес сервиса
+    :param int port: Порт сервиса
+    :param int max_workers: Количество процессов для оформления и генерации выходных файлов
+    :param int concurrency: Максимальное количество одновременно обрабатываемых запросов
+    """
+
+    try:
+        asyncio.run(serve(host, port, max_workers, concurrency))
+    except KeyboardInterrupt:
+        logger.info("Сервис остановлен.")
+
+
+if __name__ == "__main__":
+    run_service()  # pylint: disable=no-value-for-parameter
@@ -13,11 +13,42 @@ INPUT_FILE_PATH: str = os.getenv("INPUT_FILE_PATH", "../media/input.xlsx")
 OUTPUT_FILE_PATH: str = os.getenv("OUTPUT_FILE_PATH", "../media/output.docx")
 OUTPUT_FILE_PATH_APA: str = os.getenv("OUTPUT_FILE_PATH_APA", "../media/output_apa.docx")
 
+# путь к файлу кеша отформатированных строк (кеш не используется, если путь не задан)
+CACHE_FILE_PATH: str = os.getenv("CACHE_FILE_PATH", "")
+# максимальное количество записей в кеше отформатированных строк
+CACHE_MAX_ENTRIES: int = int(os.getenv("CACHE_MAX_ENTRIES", "1000000"))
+
 # путь к директории для логирования
 LOGGING_PATH: str = os.getenv("LOGGING_PATH", "../logs")
+# наименование файла логов (общий для всех модулей)
+LOGGING_FILE_NAME: str = os.getenv("LOGGING_FILE_NAME", "app.log")
+# максимальный размер файла логов в байтах, после превышения файл переименовывается (`app.log.1` и т.д.)
+LOGGING_MAX_BYTES: int = int(os.getenv("LOGGING_MAX_BYTES", str(10 * 1024 * 1024)))
+# количество сохраняемых предыдущих файлов логов
+LOGGING_BACKUP_COUNT: int = int(os.getenv("LOGGING_BACKUP_COUNT", "5"))
 # формат для записей логов
 LOGGING_FORMAT: str = os.getenv(
     "LOGGING_FORMAT", "%(name)s %(asctime)s %(levelname)s %(message)s"
 )
 # уровень логирования
 LOGGING_LEVEL: str = os.getenv("LOGGING_LEVEL", "INFO")
+# запись логов в отдельном потоке через очередь (вызывающий код не ожидает записи в файл и консоль)
+LOGGING_ASYNC: bool = os.getenv("LOGGING_ASYNC", "false").lower() in ("1", "true", "yes")
+
+# способ чтения входных файлов Excel: `openpyxl` или `xlsx` (собственный потоковый разбор XML, быстрее)
+READER_BACKEND: str = os.getenv("READER_BACKEND", "openpyxl")
+
+# адрес и порт сервиса генерации списков источников
+SERVICE_HOST: str = os.getenv("SERVICE_HOST", "127.0.0.1")
+SERVICE_PORT: int = int(os.getenv("SERVICE_PORT", "8080"))
+# количество процессов для оформления и генерации выходных файлов (по умолчанию – по числу ядер)
+SERVICE_WORKERS: int = int(os.getenv("SERVICE_WORKERS", str(os.cpu_count() or 1)))
+# максимальное количество одновременно обрабатываемых запросов (остальные ожидают в очереди)
+SERVICE_CONCURRENCY: int = int(os.getenv("SERVICE_CONCURRENCY", str(os.cpu_count() or 1)))
+# максимальный размер тела запроса в байтах
+SERVICE_MAX_BODY_SIZE: int = int(os.getenv("SERVICE_MAX_BODY_SIZE", str(32 * 1024 * 1024)))
+# время ожидания заголовков и тела запроса в секундах
+SERVICE_READ_TIMEOUT: float = float(os.getenv("SERVICE_READ_TIMEOUT", "30"))
+
+# путь к директории для результатов замеров производительности
+BENCHMARK_RESULTS_PATH: str = os.getenv("BENCHMARK_RESULTS_PATH", "../media/benchmarks")
@@ -0,0 +1,48 @@
+"""
+Тестирование пакетного форматирования источников по столбцам полей.
+"""
+import pytest
+
+from benchmarks.generator import generate_models
+from formatters.base import BaseCitationFormatter
+from formatters.models import BookModel, model_name
+from formatters.styles.apa import APACitationFormatter
+from formatters.styles.gost import GOSTBook, GOSTCitationFormatter
+from readers.store import RecordStore
+
+
+class TestBatchFormatting:
+    """
+    Тестирование пакетного форматирования источников по столбцам полей.
+    """
+
+    @pytest.mark.parametrize("formatter", [GOSTCitationFormatter, APACitationFormatter])
+    def test_format_batches(self, formatter: type[BaseCitationFormatter]) -> None:
+        """
+        Тестирование совпадения пакетного форматирования с форматированием по одному объекту.
+
+        :param formatter: Класс итогового форматирования стиля цитирования
+        """
+
+        models = list(generate_models(500, seed=6))
+        batches = formatter.format_batches(RecordStore(models).iter_tables())
+
+        assert set(batches) == set(formatter.formatters_map)
+        for name, rows in batches.items():
+            style = formatter.formatters_map[name]
+            assert rows == [style(model).formatted for model in models if model_name(model) == name]
+
+    def test_converters(self, book_model_fixture: BookModel) -> None:
+        """
+        Тестирование преобразования полей при пакетном форматировании.
+
+        :param BookModel book_model_fixture: Фикстура модели книги
+        """
+
+        models = [book_model_fixture, book_model_fixture.copy(update={"edition": None})]
+        columns = {field: [getattr(model, field) for model in models] for field in BookModel.__fields__}
+
+        rows = GOSTBook.format_batch(columns)
+        assert rows == [GOSTBook(model).formatted for model in models]
+        assert "изд." in rows[0] and "изд." not in rows[1]
+        assert not GOSTBook.format_batch({field: [] for field in BookModel.__fields__})
@@ -0,0 +1,76 @@
+"""
+Тестирование кеша отформатированных строк.
+"""
+from pathlib import Path
+
+from formatters.cache import FormattedCache, make_key
+from formatters.models import BookModel
+from formatters.styles.apa import APABook
+from formatters.styles.gost import GOSTBook
+
+
+class TestFormattedCache:
+    """
+    Тестирование кеша отформатированных строк.
+    """
+
+    def test_make_key(self, book_model_fixture: BookModel) -> None:
+        """
+        Тестирование зависимости ключа от стиля цитирования и значений полей модели.
+
+        :param BookModel book_model_fixture: Фикстура модели книги
+        :return:
+        """
+
+        key = make_key(GOSTBook(book_model_fixture))
+
+        assert key == make_key(GOSTBook(book_model_fixture.copy()))
+        assert key != make_key(APABook(book_model_fixture))
+        assert key != make_key(GOSTBook(book_model_fixture.copy(update={"pages": 1000})))
+
+    def test_apply(self, book_model_fixture: BookModel, tmp_path: Path) -> None:
+        """
+        Тестирование подстановки строк из кеша при повторном запуске.
+
+        :param BookModel book_model_fixture: Фикстура модели книги
+        :param Path tmp_path: Фикстура пути для временного хранения файлов во время тестирования
+        :return:
+        """
+
+        models = [book_model_fixture.copy(update={"pages": pages}) for pages in range(1, 6)]
+
+        with FormattedCache(tmp_path / "cache.db") as cache:
+            cache.apply([GOSTBook(model) for model in models])
+            assert cache.stats()["misses"] == 5
+
+        with FormattedCache(tmp_path / "cache.db") as cache:
+            items = [GOSTBook(model) for model in models]
+            cache.apply(items)
+
+            assert cache.stats() == {"hits": 5, "misses": 0, "evictions": 0, "entries": 5, "hit_rate": 1.0}
+            assert [item.formatted for item in items] == [item.substitute() for item in items]
+
+    def test_evict(self, book_model_fixture: BookModel, tmp_path: Path) -> None:
+        """
+        Тестирование вытеснения давно не использованных записей.
+
+        :param BookModel book_model_fixture: Фикстура модели книги
+        :param Path tmp_path: Фикстура пути для временного хранения файлов во время тестирования
+        :return:
+        """
+
+        first, second, third = (GOSTBook(book_model_fixture.copy(update={"pages": pages})) for pages in range(1, 4))
+
+        with FormattedCache(tmp_path / "cache.db", max_entries=2) as cache:
+            cache.apply([first, second])
+            cache.apply([first])
+            cache.apply([third])
+
+            assert cache.stats()["evictions"] == 1
+            assert len(cache) == 2
+
+            # вытеснена запись, которая использовалась раньше остальных
+            items = [GOSTBook(first.data), GOSTBook(second.data)]
+            cache.apply(items)
+            assert "formatted" in vars(items[0])
+            assert cache.stats()["hits"] == 2
@@ -0,0 +1,98 @@
+"""
+Тестирование ключей сортировки списка источников.
+"""
+from pathlib import Path
+
+from formatters.collation import collate, load_keys, make_key, save_keys
+from formatters.models import BookModel, InternetResourceModel
+from formatters.styles.gost import GOSTCitationFormatter
+
+
+class TestCollation:
+    """
+    Тестирование ключей сортировки списка источников.
+    """
+
+    def test_collate(self) -> None:
+        """
+        Тестирование порядка строк по правилам сортировки.
+
+        :return:
+        """
+
+        words = ["Ёлкин", "zeta", "Ершов", "alpha", "Еременко", "яковлев", "Бахтин", "2020"]
+
+        expected = ["2020", "Бахтин", "Ёлкин", "Еременко", "Ершов", "яковлев", "alpha", "zeta"]
+        assert sorted(words, key=collate) == expected
+        assert collate("Ёлкин") == collate("елкин")
+
+    def test_diacritics(self) -> None:
+        """
+        Тестирование порядка строк с буквами с диакритическими знаками и буквами украинского алфавита.
+
+        :return:
+        """
+
+        words = ["Øster", "Émile", "Їжакевич", "Mayer", "Ґонта", "Müller", "Ostrom", "Іванов", "Євтушенко", "Бахтин"]
+
+        assert sorted(words, key=collate) == [
+            "Бахтин",
+            "Ґонта",
+            "Євтушенко",
+            "Іванов",
+            "Їжакевич",
+            "Émile",
+            "Mayer",
+            "Müller",
+            "Øster",
+            "Ostrom",
+        ]
+        assert collate("Émile") == collate("emile")
+        assert collate("Müller") == collate("Muller")
+        # разложенная форма (буква и отдельный диакритический знак) не отличается от составной
+        assert collate("Mu\u0308ller") == collate("Müller")
+        # символы остальных алфавитов располагаются после латиницы
+        assert collate("zeta") < collate("Ωmega")
+        assert collate("Ωmega") < collate("ωmegb")
+
+    def test_make_key(self) -> None:
+        """
+        Тестирование ключа сортировки по автору, затем по заглавию.
+
+        :return:
+        """
+
+        assert make_key("Иванов", "Физика") < make_key("Иванова", "Алгебра")
+        assert make_key("Иванов", "Алгебра") < make_key("Иванов", "Физика")
+        assert make_key("Иванов", None) < make_key("Иванов", "Алгебра")
+
+    def test_citation_formatter(self, book_model_fixture: BookModel, tmp_path: Path) -> None:
+        """
+        Тестирование сортировки источников на кириллице и латинице и сохранения ключей сортировки.
+
+        :param BookModel book_model_fixture: Фикстура модели книги
+        :param Path tmp_path: Фикстура пути для временного хранения файлов во время тестирования
+        :return:
+        """
+
+        models = [
+            book_model_fixture.copy(update={"authors": "Smith J."}),
+            book_model_fixture.copy(update={"authors": "Ёлкин А.А."}),
+            book_model_fixture.copy(update={"authors": "ершов Б.Б."}),
+            InternetResourceModel(
+                article="Assembling", website="Site", link="https://example.com", access_date="01.01.2021"
+            ),
+            book_model_fixture.copy(update={"authors": "Елисеев В.В."}),
+        ]
+
+        formatter = GOSTCitationFormatter(models)
+        result = [item.data for item in formatter.format()]
+        assert result == [models[4], models[1], models[2], models[3], models[0]]
+
+        path = tmp_path / "keys.json"
+        save_keys(path, formatter.sort_keys)
+        restored = GOSTCitationFormatter(models, load_keys(path))
+
+        # при загрузке ключей сортировка выполняется без их повторного вычисления и форматирования строк
+        assert [item.data for item in restored.format()] == result
+        assert all("formatted" not in vars(item) for item in restored.formatted_items)
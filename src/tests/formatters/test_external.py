@@ -0,0 +1,83 @@
+"""
+Тестирование внешней сортировки списка источников.
+"""
+import gc
+import os
+
+from formatters.external import ExternalSorter
+from formatters.models import BookModel
+from formatters.styles.gost import GOSTCitationFormatter
+
+
+class TestExternalSorter:
+    """
+    Тестирование внешней сортировки списка источников.
+    """
+
+    def test_sort(self, book_model_fixture: BookModel) -> None:
+        """
+        Тестирование совпадения результата внешней сортировки с сортировкой в памяти.
+
+        :param BookModel book_model_fixture: Фикстура модели книги
+        :return:
+        """
+
+        models = [
+            book_model_fixture.copy(update={"authors": authors, "title": title})
+            for authors in ("Смирнов А.А.", "Smith J.", "Ёлкин Б.Б.", "Абрамов В.В.", "Елисеев Г.Г.")
+            for title in ("Физика", "Алгебра", "Алгебра")
+        ]
+        formatter = GOSTCitationFormatter(models)
+
+        sorter = ExternalSorter(chunk_size=4)
+        sorter.extend(formatter.formatted_items)
+
+        # записи сохранены во временные файлы порциями
+        assert len(sorter) == len(models)
+        assert len(sorter.runs) == 3
+        runs = list(sorter.runs)
+
+        assert list(sorter) == [str(item) for item in formatter.format()]
+        # после слияния временные файлы удалены
+        assert not any(os.path.exists(path) for path in runs)
+
+    def test_sort_in_memory(self, book_model_fixture: BookModel) -> None:
+        """
+        Тестирование сортировки без сохранения во временные файлы.
+
+        :param BookModel book_model_fixture: Фикстура модели книги
+        :return:
+        """
+
+        models = [book_model_fixture.copy(update={"authors": authors}) for authors in ("Петров П.П.", "Иванов И.И.")]
+        formatter = GOSTCitationFormatter(models)
+
+        sorter = ExternalSorter(chunk_size=10)
+        sorter.extend(formatter.formatted_items)
+
+        assert not sorter.runs
+        assert list(sorter) == [str(item) for item in formatter.format()]
+
+    def test_cleanup(self, book_model_fixture: BookModel) -> None:
+        """
+        Тестирование удаления временных файлов без слияния.
+
+        :param BookModel book_model_fixture: Фикстура модели книги
+        :return:
+        """
+
+        models = [book_model_fixture.copy(update={"title": str(index)}) for index in range(10)]
+        formatter = GOSTCitationFormatter(models)
+
+        with ExternalSorter(chunk_size=4) as sorter:
+            sorter.extend(formatter.formatted_items)
+            runs = list(sorter.runs)
+        assert runs and not any(os.path.exists(path) for path in runs)
+
+        sorter = ExternalSorter(chunk_size=4)
+        sorter.extend(formatter.formatted_items)
+        runs = list(sorter.runs)
+        # слияние не выполнялось, объект удален без закрытия
+        del sorter
+        gc.collect()
+        assert not any(os.path.exists(path) for path in runs)
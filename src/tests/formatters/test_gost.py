@@ -6,7 +6,7 @@ from formatters.base import BaseCitationFormatter
 from formatters.models import BookModel, InternetResourceModel, ArticlesCollectionModel, DissertationModel,\
     ArticlesNewspaperModel
 from formatters.styles.gost import GOSTBook, GOSTInternetResource, GOSTCollectionArticle, GOSTNewspaperArticle,\
-    GOSTDissertation
+    GOSTDissertation, GOSTCitationFormatter
 
 
 class TestGOST:
@@ -123,3 +123,38 @@ class TestGOST:
         assert result[0] == models[2]
         assert result[1] == models[0]
         assert result[2] == models[1]
+
+        # количество источников по классам форматирования для итогового логирования
+        assert BaseCitationFormatter(models + [GOSTBook(book_model_fixture)]).summary() == {
+            "GOSTBook": 2,
+            "GOSTInternetResource": 1,
+            "GOSTCollectionArticle": 1,
+        }
+
+    def test_lazy_formatting(
+        self,
+        book_model_fixture: BookModel,
+        internet_resource_model_fixture: InternetResourceModel,
+        articles_collection_model_fixture: ArticlesCollectionModel,
+    ) -> None:
+        """
+        Тестирование отложенного форматирования и получения страницы списка источников.
+
+        :param BookModel book_model_fixture: Фикстура модели книги
+        :param InternetResourceModel internet_resource_model_fixture: Фикстура модели интернет-ресурса
+        :param ArticlesCollectionModel articles_collection_model_fixture: Фикстура модели сборника статей
+        :return:
+        """
+
+        formatter = GOSTCitationFormatter(
+            [book_model_fixture, internet_resource_model_fixture, articles_collection_model_fixture]
+        )
+
+        # при создании объектов строки не форматируются
+        assert len(formatter) == 3
+        assert all("formatted" not in vars(item) for item in formatter.formatted_items)
+
+        result = formatter.format()
+        assert formatter.page(0, 2) == result[:2]
+        assert formatter.page(1, 1) == result[1:2]
+        assert formatter.page(1) == result[1:]
@@ -0,0 +1,56 @@
+"""
+Тестирование параллельного форматирования списка источников порциями.
+"""
+from benchmarks.generator import generate_models
+from formatters.parallel import format_parallel, partition
+from formatters.styles.apa import APACitationFormatter
+from formatters.styles.gost import GOSTCitationFormatter
+from pipeline import CitationPipeline
+from readers.store import RecordStore
+
+
+class TestParallel:
+    """
+    Тестирование параллельного форматирования списка источников порциями.
+    """
+
+    def test_partition(self) -> None:
+        """
+        Тестирование разбиения списка источников на порции из значений полей.
+        """
+
+        models = list(generate_models(25, seed=6))
+        formatters_map = GOSTCitationFormatter.formatters_map
+        chunks = list(partition(models, formatters_map, 10))
+
+        assert [sum(len(positions) for positions, _ in chunk.values()) for chunk in chunks] == [10, 10, 5]
+        positions, rows = chunks[0][type(models[0]).__name__]
+        assert positions[0] == 0
+        fields = formatters_map[type(models[0]).__name__].batch_input_fields()
+        assert rows[0] == tuple(getattr(models[0], field) for field in fields)
+
+    def test_format(self) -> None:
+        """
+        Тестирование совпадения результата с форматированием в текущем процессе.
+        """
+
+        models = list(generate_models(600, seed=7))
+        store = RecordStore(models)
+
+        for formatter in (GOSTCitationFormatter, APACitationFormatter):
+            expected = [str(item) for item in formatter(models).format()]
+            assert format_parallel(formatter, models, max_workers=1, chunk_size=70) == expected
+            assert format_parallel(formatter, models, max_workers=2, chunk_size=70) == expected
+            assert format_parallel(formatter, store, max_workers=2) == expected
+
+    def test_pipeline(self) -> None:
+        """
+        Тестирование параллельного форматирования в конвейере.
+        """
+
+        models = list(generate_models(300, seed=8))
+        expected = CitationPipeline(models, ("GOST", "APA")).format()
+        pipeline = CitationPipeline(iter(models), ("GOST", "APA"), format_workers=2)
+
+        assert len(pipeline) == len(models)
+        assert pipeline.format() == expected
@@ -0,0 +1,91 @@
+"""
+Тестирование предварительно разобранных шаблонов строк.
+"""
+from string import Template
+
+import pytest
+
+from formatters.styles.base import CompiledTemplate
+
+
+class TestCompiledTemplate:
+    """
+    Тестирование предварительно разобранных шаблонов строк.
+    """
+
+    @pytest.mark.parametrize(
+        "template",
+        [
+            "$authors $title. – $edition$city: $publishing_house, $year. – $pages с.",
+            "${authors}abc $$ {литерал} $year",
+            "$year",
+            "",
+        ],
+    )
+    def test_substitute(self, template: str) -> None:
+        """
+        Тестирование совпадения результата заполнения с `string.Template`.
+
+        :param str template: Шаблон строки
+        :return:
+        """
+
+        values = {
+            "authors": "Иванов И.М.",
+            "title": "Наука как искусство",
+            "edition": "",
+            "city": "СПб.",
+            "publishing_house": "Просвещение",
+            "year": 2020,
+            "pages": 999,
+        }
+
+        assert CompiledTemplate(template).substitute(**values) == Template(template).substitute(**values)
+        assert CompiledTemplate(template).substitute(values) == Template(template).substitute(values)
+
+    def test_fields(self) -> None:
+        """
+        Тестирование разбора шаблона на литералы и поля.
+
+        :return:
+        """
+
+        template = CompiledTemplate("$authors ($year). $title.")
+
+        assert template.fields == ("authors", "year", "title")
+        assert template.segments == (
+            (True, "authors"),
+            (False, " ("),
+            (True, "year"),
+            (False, "). "),
+            (True, "title"),
+            (False, "."),
+        )
+
+    def test_positional(self) -> None:
+        """
+        Тестирование строки формата с позиционными аргументами.
+
+        :return:
+        """
+
+        template = CompiledTemplate("$year {$authors} $year")
+
+        assert template.batch_fields == ("year", "authors")
+        assert template.positional_string == "{0!s} {{{1!s}}} {0!s}"
+        assert template.positional_string.format(2020, "Иванов И.М.") == template.substitute(
+            year=2020, authors="Иванов И.М."
+        )
+
+    def test_errors(self) -> None:
+        """
+        Тестирование ошибок разбора и заполнения шаблона.
+
+        :return:
+        """
+
+        with pytest.raises(ValueError):
+            CompiledTemplate("$1")
+
+        with pytest.raises(KeyError):
+            CompiledTemplate("$authors $year").substitute(authors="Иванов И.М.")
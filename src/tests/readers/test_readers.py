@@ -1,12 +1,14 @@
 """
 Тестирование функций чтения данных из источника.
 """
-from typing import Any
+from typing import Any, Type
 
 import pytest
+from openpyxl import Workbook
 
 from formatters.models import BookModel, InternetResourceModel, ArticlesCollectionModel, \
     ArticlesNewspaperModel, DissertationModel
+from readers.base import BaseReader
 from readers.reader import (
     BookReader,
     SourcesReader,
@@ -124,3 +126,127 @@ class TestReaders:
             DissertationModel.__name__,
 
         }
+
+    def test_sources_reader_streaming(self) -> None:
+        """
+        Тестирование потокового чтения моделей из источника.
+        """
+
+        with SourcesReader(TEMPLATE_FILE_PATH) as reader:
+            models = reader.iter_models()
+            # модели считываются по одной, без предварительного чтения всего файла
+            assert isinstance(next(models), BookModel)
+            streamed = [BookModel.__name__, *(model.__class__.__name__ for model in models)]
+
+        with SourcesReader(TEMPLATE_FILE_PATH, read_only=False) as reader:
+            loaded = [model.__class__.__name__ for model in reader.read()]
+
+        # результат потокового чтения совпадает с результатом полной загрузки рабочей книги
+        assert streamed == loaded
+
+    def test_columns(self, workbook: Any) -> None:
+        """
+        Тестирование плана чтения столбцов.
+
+        :param workbook: Объект тестовой рабочей книги.
+        """
+
+        reader = BookReader(workbook)
+
+        # план объявлен в классе читателя и общий для всех его объектов
+        assert reader.columns is BookReader(workbook).columns
+        assert [(column.attr, column.position) for column in reader.columns] == [
+            ("authors", 0),
+            ("title", 1),
+            ("edition", 2),
+            ("city", 3),
+            ("publishing_house", 4),
+            ("year", 5),
+            ("pages", 6),
+        ]
+
+        model = reader.parse((" Иванов И.М. ", "Наука как искусство", None, "СПб.", "Просвещение", "2020", 999))
+        assert isinstance(model, BookModel)
+        assert model.authors == "Иванов И.М."
+        assert model.edition is None
+        assert model.year == 2020
+
+    def test_columns_attributes(self, workbook: Any) -> None:
+        """
+        Тестирование совместимости с читателями, описывающими столбцы словарем `attributes`.
+
+        :param workbook: Объект тестовой рабочей книги.
+        """
+
+        class LegacyBookReader(BaseReader):
+            """
+            Читатель книги с описанием столбцов в прежнем формате.
+            """
+
+            @property
+            def model(self) -> Type[BookModel]:
+                return BookModel
+
+            @property
+            def sheet(self) -> str:
+                return "Книга"
+
+            @property
+            def attributes(self) -> dict:
+                return {
+                    "authors": {0: str},
+                    "title": {1: str},
+                    "edition": {2: str},
+                    "city": {3: str},
+                    "publishing_house": {4: str},
+                    "year": {5: int},
+                    "pages": {6: int},
+                }
+
+        reader = LegacyBookReader(workbook)
+
+        # атрибуты компилируются в такой же план, как объявленный в `BookReader`, один раз для класса читателя
+        assert reader.columns == BookReader.columns
+        assert reader.columns is LegacyBookReader(workbook).columns
+        assert reader.read() == BookReader(workbook).read()
+
+    def test_sources_reader_parallel(self) -> None:
+        """
+        Тестирование параллельного чтения листов источника.
+        """
+
+        reader = SourcesReader(TEMPLATE_FILE_PATH)
+
+        # порядок моделей совпадает с последовательным чтением
+        assert reader.read(workers=2) == SourcesReader(TEMPLATE_FILE_PATH).read()
+
+    def test_trusted(self, workbook: Any) -> None:
+        """
+        Тестирование чтения без валидации моделей.
+
+        :param workbook: Объект тестовой рабочей книги.
+        """
+
+        models = BookReader(workbook, trusted=True).read()
+
+        # значения атрибутов совпадают с результатом чтения с валидацией
+        assert [model.dict() for model in models] == [model.dict() for model in BookReader(workbook).read()]
+
+    def test_validate(self) -> None:
+        """
+        Тестирование проверки строк листа с накоплением всех ошибок.
+        """
+
+        workbook = Workbook()
+        sheet = workbook.create_sheet("Книга")
+        sheet.append(("Авторы", "Название", "Издание", "Город", "Издательство", "Год", "Страницы"))
+        sheet.append(("Иванов И.М.", "Наука как искусство", None, "СПб.", "Просвещение", 2020, 999))
+        sheet.append(("Петров С.Н.", "Наука как искусство", None, "СПб.", "Просвещение", "год", 999))
+        sheet.append(("Сидоров А.А.", "Наука как искусство", None, None, "Просвещение", 2020, -1))
+
+        errors = BookReader(workbook).validate()
+
+        assert [(error.sheet, error.row) for error in errors] == [("Книга", 3), ("Книга", 4)]
+        assert [error["loc"] for error in errors[0].errors] == [("year",)]
+        assert {error["loc"] for error in errors[1].errors} == {("city",), ("pages",)}
+        assert not SourcesReader(TEMPLATE_FILE_PATH).validate()
@@ -0,0 +1,91 @@
+"""
+Тестирование двоичного снимка прочитанных источников.
+"""
+from pathlib import Path
+
+import pytest
+
+from benchmarks.generator import generate_models
+from formatters.models import BookModel
+from main import generate
+from readers.reader import SourcesReader
+from readers.snapshot import Snapshot, write_snapshot
+from settings import TEMPLATE_FILE_PATH
+
+
+class TestSnapshot:
+    """
+    Тестирование двоичного снимка прочитанных источников.
+    """
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        """
+        Тестирование сохранения и чтения снимка.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файлов во время тестирования
+        """
+
+        models = list(generate_models(300, seed=2))
+        models.append(
+            BookModel(
+                authors="Иванов И.М.",
+                title="Без издания",
+                edition=None,
+                city="М.",
+                publishing_house="АСТ",
+                year=2020,
+                pages=10,
+            )
+        )
+        path = tmp_path / "sources.snapshot"
+        assert write_snapshot(path, models) == len(models)
+
+        with Snapshot(path) as snapshot:
+            assert len(snapshot) == len(models)
+            assert snapshot.read() == models
+            first, second = snapshot[-1], snapshot[-1]
+            assert isinstance(first, BookModel) and isinstance(second, BookModel)
+            assert first.edition is None
+            assert snapshot[10:13] == models[10:13]
+            assert [type(model) for model in snapshot] == [type(model) for model in models]
+            # повторяющиеся строки декодируются один раз
+            assert first.city is second.city
+            with pytest.raises(IndexError):
+                snapshot[len(snapshot)]  # pylint: disable=expression-not-assigned
+
+    def test_template(self, tmp_path: Path) -> None:
+        """
+        Тестирование снимка шаблона входного файла и генерации выходного файла из снимка.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файлов во время тестирования
+        """
+
+        with SourcesReader(TEMPLATE_FILE_PATH) as reader:
+            models = reader.read()
+
+        path_snapshot = str(tmp_path / "template.snapshot")
+        paths = {"GOST": str(tmp_path / "input.txt")}
+        paths_snapshot = {"GOST": str(tmp_path / "snapshot.txt")}
+        assert generate(TEMPLATE_FILE_PATH, paths, output_format="txt", path_save_snapshot=path_snapshot) == len(models)
+        assert generate("", paths_snapshot, output_format="txt", path_snapshot=path_snapshot) == len(models)
+        expected = Path(paths["GOST"]).read_text(encoding="utf-8")
+        assert Path(paths_snapshot["GOST"]).read_text(encoding="utf-8") == expected
+
+        with Snapshot(path_snapshot) as snapshot:
+            assert list(snapshot) == models
+            assert not snapshot.validate()
+
+    def test_invalid(self, tmp_path: Path) -> None:
+        """
+        Тестирование открытия файла, не являющегося снимком.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файлов во время тестирования
+        """
+
+        path = tmp_path / "sources.snapshot"
+        path.write_bytes(b"not a snapshot")
+        with pytest.raises(ValueError, match="не является снимком"):
+            Snapshot(path)
+
+        with pytest.raises(ValueError, match="не поддерживается снимком"):
+            write_snapshot(path, [object()])  # type: ignore
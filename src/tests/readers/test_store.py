@@ -0,0 +1,68 @@
+"""
+Тестирование колоночного хранилища источников.
+"""
+from pathlib import Path
+
+from benchmarks.generator import generate_models
+from formatters.models import BookModel, model_name
+from formatters.styles.apa import APACitationFormatter
+from formatters.styles.gost import GOSTCitationFormatter
+from readers.snapshot import Snapshot, write_snapshot
+from readers.store import RecordStore, RecordView
+
+
+class TestRecordStore:
+    """
+    Тестирование колоночного хранилища источников.
+    """
+
+    def test_views(self, book_model_fixture: BookModel) -> None:
+        """
+        Тестирование представлений строк хранилища.
+
+        :param BookModel book_model_fixture: Фикстура модели книги
+        """
+
+        other = book_model_fixture.copy(update={"title": "Другая книга", "edition": None})
+        store = RecordStore([book_model_fixture, other])
+
+        assert len(store) == 2
+        view = store[1]
+        assert isinstance(view, RecordView)
+        assert model_name(view) == model_name(other) == "BookModel"
+        assert view.title == "Другая книга"
+        assert view.edition is None
+        assert view.dict() == other.dict()
+        assert view.to_model() == other
+        assert view == other
+        assert store[-1] == store[1]
+        assert store[:1] == [book_model_fixture]
+        # повторяющиеся значения хранятся в одном экземпляре
+        assert store[0].city is store[1].city
+        assert store.summary() == {"BookModel": 2, "values": 8}
+
+    def test_formatters(self) -> None:
+        """
+        Тестирование форматирования источников из хранилища вместо списка моделей.
+        """
+
+        models = list(generate_models(500, seed=4))
+        store = RecordStore(models)
+
+        for formatter in (GOSTCitationFormatter, APACitationFormatter):
+            expected = [item.formatted for item in formatter(models).format()]
+            assert [item.formatted for item in formatter(store).format()] == expected
+
+    def test_snapshot(self, tmp_path: Path) -> None:
+        """
+        Тестирование сохранения снимка из хранилища.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файлов во время тестирования
+        """
+
+        models = list(generate_models(100, seed=5))
+        path = tmp_path / "store.snapshot"
+        write_snapshot(path, RecordStore(models))
+
+        with Snapshot(path) as snapshot:
+            assert list(RecordStore(snapshot)) == models
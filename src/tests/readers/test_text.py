@@ -0,0 +1,147 @@
+"""
+Тестирование чтения источников из текстовых форматов.
+"""
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from formatters.models import BookModel, InternetResourceModel
+from readers.reader import SourcesReader, open_reader
+from readers.records import parse_record
+from readers.text import CSVReader, JSONLinesReader
+
+
+BOOK: dict[str, Any] = {
+    "type": "book",
+    "authors": "Иванов И.М., Петров С.Н.",
+    "title": "Наука как искусство",
+    "edition": "3-е",
+    "city": "СПб.",
+    "publishing_house": "Просвещение",
+    "year": 2020,
+    "pages": 999,
+}
+INTERNET_RESOURCE = {
+    "type": "internet_resource",
+    "article": "Наука как искусство",
+    "website": "Ведомости",
+    "link": "https://www.vedomosti.ru",
+    "access_date": "01.01.2021",
+}
+
+
+class TestTextReaders:
+    """
+    Тестирование чтения источников из текстовых форматов.
+    """
+
+    def test_parse_record(self) -> None:
+        """
+        Тестирование получения модели из записи.
+        """
+
+        model = parse_record(BOOK)
+        assert isinstance(model, BookModel)
+        assert model.pages == 999
+
+        with pytest.raises(ValueError, match="Неизвестный тип источника"):
+            parse_record({"type": "letter"})
+
+        # строковые значения очищаются от пробелов по краям, как при чтении Excel
+        model = parse_record({**BOOK, "type": " book ", "title": "  Наука как искусство "})
+        assert model == parse_record(BOOK)
+
+    def test_parse_record_type(self, tmp_path: Path) -> None:
+        """
+        Тестирование записей с типом источника, не являющимся строкой.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файлов во время тестирования
+        """
+
+        for kind in (["book"], {"name": "book"}, 1):
+            with pytest.raises(ValueError, match="не является строкой"):
+                parse_record({**BOOK, "type": kind})
+
+        path = tmp_path / "sources.jsonl"
+        path.write_text(f'{json.dumps(BOOK)}\n{json.dumps({**BOOK, "type": ["book"]})}\n', encoding="utf-8")
+
+        # проверка файла сообщает об ошибке строки, а не завершается исключением
+        errors = JSONLinesReader(str(path)).validate()
+        assert [error.row for error in errors] == [2]
+        assert errors[0].errors[0]["loc"] == ("type",)
+
+    def test_jsonl(self, tmp_path: Path) -> None:
+        """
+        Тестирование потокового чтения файла JSON Lines.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файлов во время тестирования
+        """
+
+        path = tmp_path / "sources.jsonl"
+        path.write_text(f"{json.dumps(BOOK)}\n\n{json.dumps(INTERNET_RESOURCE)}\n", encoding="utf-8")
+
+        reader = open_reader(str(path))
+        assert isinstance(reader, JSONLinesReader)
+
+        models = reader.iter_models()
+        assert isinstance(next(models), BookModel)
+        assert isinstance(next(models), InternetResourceModel)
+        assert next(models, None) is None
+        assert reader.validate() == []
+
+    def test_jsonl_invalid(self, tmp_path: Path) -> None:
+        """
+        Тестирование проверки файла JSON Lines со строками, не являющимися JSON-объектами.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файлов во время тестирования
+        """
+
+        path = tmp_path / "sources.jsonl"
+        path.write_text(f'{json.dumps(BOOK)}\n{{"type": "book",\n[1, 2]\n"x"\n', encoding="utf-8")
+
+        errors = JSONLinesReader(str(path)).validate()
+
+        assert [error.row for error in errors] == [2, 3, 4]
+        assert all(error.errors[0]["loc"] == ("__root__",) for error in errors)
+
+    def test_csv(self, tmp_path: Path) -> None:
+        """
+        Тестирование потокового чтения файла CSV.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файлов во время тестирования
+        """
+
+        path = tmp_path / "sources.csv"
+        path.write_text(
+            "type,authors,title,edition,city,publishing_house,year,pages\n"
+            'book,"Иванов И.М., Петров С.Н.",Наука как искусство,,СПб.,Просвещение,2020,999\n'
+            "book,Петров С.Н.,Наука,,СПб.,Просвещение,0,10\n",
+            encoding="utf-8",
+        )
+
+        with open_reader(str(path)) as reader:
+            assert isinstance(reader, CSVReader)
+            errors = reader.validate()
+
+        assert len(errors) == 1
+        assert errors[0].sheet == "book"
+        assert errors[0].row == 3
+        assert errors[0].errors[0]["loc"] == ("year",)
+
+        model = next(reader.iter_models())
+        assert model == BookModel(**{**BOOK, "edition": None})
+
+        # без валидации значения приводятся к типам полей модели так же, как при валидации
+        trusted = next(CSVReader(str(path), trusted=True).iter_models())
+        assert trusted == model
+        assert isinstance(trusted, BookModel) and isinstance(trusted.year, int)
+
+    def test_open_reader(self) -> None:
+        """
+        Тестирование выбора читателя по расширению файла.
+        """
+
+        assert isinstance(open_reader("input.xlsx"), SourcesReader)
+        assert isinstance(open_reader("input.NDJSON", trusted=True), JSONLinesReader)
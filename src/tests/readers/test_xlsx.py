@@ -0,0 +1,130 @@
+"""
+Тестирование потокового чтения файлов Excel без openpyxl (соответствие результатам openpyxl).
+"""
+from datetime import datetime, time, timedelta
+from pathlib import Path
+from typing import Any, Callable
+
+import openpyxl
+import pytest
+
+from benchmarks.generator import generate_models, write_workbook
+from readers.reader import SourcesReader
+from readers.xlsx import XLSXWorkbook, from_excel, is_date_format, split_reference
+from settings import TEMPLATE_FILE_PATH
+
+
+def read_rows(path: Path | str, open_workbook: Callable[[Any], Any], **kwargs: int) -> dict[str, list[tuple]]:
+    """
+    Чтение значений всех листов рабочей книги.
+
+    :param path: Путь к файлу Excel.
+    :param open_workbook: Функция открытия рабочей книги (`openpyxl.load_workbook` или `XLSXWorkbook`).
+    :param kwargs: Параметры чтения строк.
+    :return: Значения строк по наименованиям листов.
+    """
+
+    workbook = open_workbook(path)
+    try:
+        return {name: list(workbook[name].iter_rows(values_only=True, **kwargs)) for name in workbook.sheetnames}
+    finally:
+        workbook.close()
+
+
+def load_openpyxl(path: Path | str) -> Any:
+    """
+    Открытие рабочей книги openpyxl в потоковом режиме.
+
+    :param path: Путь к файлу Excel.
+    :return:
+    """
+
+    return openpyxl.load_workbook(path, read_only=True)
+
+
+class TestXLSX:
+    """
+    Тестирование потокового чтения файлов Excel.
+    """
+
+    def test_helpers(self) -> None:
+        """
+        Тестирование разбора адресов ячеек, форматов и дат.
+        """
+
+        assert split_reference("B12") == (12, 2)
+        assert split_reference("AA1") == (1, 27)
+        assert is_date_format("dd.mm.yyyy")
+        assert is_date_format("[$-F800]dddd\\,\\ mmmm\\ dd\\,\\ yyyy")
+        assert not is_date_format("0.00")
+        assert not is_date_format('"мм"0')
+        assert from_excel(44197) == datetime(2021, 1, 1)
+        assert from_excel(0.5) == time(12)
+        assert from_excel(1.25) == datetime(1900, 1, 1, 6)
+
+    def test_template(self) -> None:
+        """
+        Тестирование соответствия значений шаблона входного файла.
+        """
+
+        for kwargs in ({}, {"min_row": 2}, {"min_row": 2, "max_row": 3}):
+            assert read_rows(TEMPLATE_FILE_PATH, XLSXWorkbook, **kwargs) == read_rows(
+                TEMPLATE_FILE_PATH, load_openpyxl, **kwargs
+            )
+
+    def test_values(self, tmp_path: Path) -> None:
+        """
+        Тестирование соответствия значений разных типов, пропущенных ячеек и строк.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файлов во время тестирования
+        """
+
+        workbook = openpyxl.Workbook()
+        sheet = workbook.active
+        sheet.title = "Данные"
+        sheet["A1"] = "Текст"
+        sheet["C1"] = 12
+        sheet["D1"] = 1.25
+        sheet["E1"] = True
+        sheet["A2"] = datetime(2021, 1, 1, 10, 30)
+        sheet["B2"] = time(8, 15)
+        sheet["C2"] = "=C1*2"
+        sheet["A5"] = "после пропущенных строк"
+        sheet["F5"] = -1e-7
+        sheet["B6"] = timedelta(hours=30)
+        workbook.create_sheet("Пустой")
+        path = tmp_path / "values.xlsx"
+        workbook.save(path)
+
+        rows = read_rows(path, XLSXWorkbook)
+        assert rows == read_rows(path, load_openpyxl)
+        assert rows["Данные"][0] == ("Текст", None, 12, 1.25, True, None)
+        assert rows["Данные"][2] == (None,) * 6
+
+    def test_generated(self, tmp_path: Path) -> None:
+        """
+        Тестирование соответствия моделей, прочитанных обоими способами из сгенерированного файла.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файлов во время тестирования
+        """
+
+        path = str(tmp_path / "generated.xlsx")
+        write_workbook(path, generate_models(500, seed=1))
+
+        with SourcesReader(path) as reader:
+            expected = reader.read()
+        with SourcesReader(path, backend="xlsx") as reader:
+            assert isinstance(reader.workbook, XLSXWorkbook)
+            assert reader.read() == expected
+        with SourcesReader(path, backend="xlsx") as reader:
+            assert reader.read(workers=2) == expected
+        assert len(expected) == 500
+
+    def test_unknown_sheet(self) -> None:
+        """
+        Тестирование обращения к отсутствующему листу.
+        """
+
+        with XLSXWorkbook(TEMPLATE_FILE_PATH) as workbook:
+            with pytest.raises(KeyError):
+                workbook["Отсутствующий лист"]  # pylint: disable=pointless-statement
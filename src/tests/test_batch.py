@@ -0,0 +1,75 @@
+"""
+Тестирование пакетной обработки входных файлов.
+"""
+import shutil
+from pathlib import Path
+
+import pytest
+
+from batch import collect_inputs, output_paths, process_files, summarize
+from settings import TEMPLATE_FILE_PATH
+
+
+class TestBatch:
+    """
+    Тестирование пакетной обработки входных файлов.
+    """
+
+    def test_process_files(self, tmp_path: Path) -> None:
+        """
+        Тестирование обработки файлов с отчетом по каждому файлу.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файлов во время тестирования
+        """
+
+        path_input_dir = tmp_path / "input"
+        path_input_dir.mkdir()
+        shutil.copy(TEMPLATE_FILE_PATH, path_input_dir / "first.xlsx")
+        shutil.copy(TEMPLATE_FILE_PATH, path_input_dir / "second.xlsx")
+        (path_input_dir / "broken.xlsx").write_text("не Excel-файл")
+
+        paths = collect_inputs(str(path_input_dir))
+        assert [Path(path).name for path in paths] == ["broken.xlsx", "first.xlsx", "second.xlsx"]
+
+        path_list = tmp_path / "list.txt"
+        path_list.write_text("# список файлов\ninput/first.xlsx\n\n")
+        assert collect_inputs(path_list=str(path_list)) == [str(tmp_path / "input/first.xlsx")]
+
+        reports = process_files(paths, str(tmp_path / "output"), concurrency=2)
+
+        assert [report.success for report in reports] == [False, True, True]
+        assert reports[0].error
+        assert [report.sources for report in reports[1:]] == [10, 10]
+        assert sorted(path.name for path in (tmp_path / "output").iterdir()) == [
+            "first.docx",
+            "first_apa.docx",
+            "second.docx",
+            "second_apa.docx",
+        ]
+
+        summary = summarize(reports, 2.0)
+        assert summary["files"] == 3
+        assert summary["failed"] == 1
+        assert summary["sources"] == 20
+        assert summary["sources_per_second"] == 10.0
+
+    def test_output_paths(self, tmp_path: Path) -> None:
+        """
+        Тестирование получения различающихся путей к выходным файлам.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файлов во время тестирования
+        """
+
+        paths = [str(tmp_path / "a/x.xlsx"), str(tmp_path / "b/x.xlsx"), str(tmp_path / "b/x.csv")]
+        outputs = output_paths(paths, "output", "txt")
+
+        assert outputs == [
+            {"GOST": str(Path("output/a/x.txt")), "APA": str(Path("output/a/x_apa.txt"))},
+            {"GOST": str(Path("output/b/x_xlsx.txt")), "APA": str(Path("output/b/x_xlsx_apa.txt"))},
+            {"GOST": str(Path("output/b/x_csv.txt")), "APA": str(Path("output/b/x_csv_apa.txt"))},
+        ]
+
+        # выходной файл APA для `x.xlsx` совпадает с выходным файлом ГОСТ для `x_apa.xlsx`
+        with pytest.raises(ValueError, match="совпадает"):
+            process_files([str(tmp_path / "x.xlsx"), str(tmp_path / "x_apa.xlsx")], str(tmp_path / "output"))
+        assert not (tmp_path / "output").exists()
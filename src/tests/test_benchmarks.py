@@ -0,0 +1,58 @@
+"""
+Тестирование генерации синтетических списков источников для замеров.
+"""
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+from benchmarks.generator import generate_models, parse_mix, write_workbook
+from benchmarks.suite import summarize
+from formatters.models import BookModel, DissertationModel
+from profiling import StageReport
+from readers.reader import SourcesReader
+
+
+class TestGenerator:
+    """
+    Тестирование генерации синтетических списков источников.
+    """
+
+    def test_generate(self, tmp_path: Path) -> None:
+        """
+        Тестирование генерации моделей и входного файла заданного состава.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файлов во время тестирования
+        """
+
+        models = list(generate_models(100, parse_mix("book=3,dissertation=1"), seed=1))
+        counts = Counter(type(model) for model in models)
+
+        assert set(counts) == {BookModel, DissertationModel}
+        assert counts[BookModel] > counts[DissertationModel]
+        assert len({model.title for model in models if isinstance(model, BookModel)}) == counts[BookModel]
+        assert models == list(generate_models(100, parse_mix("book=3,dissertation=1"), seed=1))
+
+        path = tmp_path / "input.xlsx"
+        write_workbook(path, iter(models))
+        with SourcesReader(str(path)) as reader:
+            assert reader.read() == sorted(models, key=lambda model: isinstance(model, DissertationModel))
+
+        with pytest.raises(ValueError):
+            parse_mix("letter=1")
+
+    def test_summarize(self) -> None:
+        """
+        Тестирование суммирования замеров этапов по листам.
+        """
+
+        results = summarize(
+            [
+                StageReport(name="read:Книга", depth=0, wall=1.0, cpu=1.0, peak_memory=None, rows=10),
+                StageReport(name="read:Диссертация", depth=0, wall=1.0, cpu=0.5, peak_memory=None, rows=10),
+                StageReport(name="sort:GOST", depth=0, wall=0.5, cpu=0.5, peak_memory=100, rows=20),
+            ]
+        )
+
+        assert results["read"] == {"wall": 2.0, "cpu": 1.5, "peak_memory": None, "rows": 20, "rows_per_second": 10.0}
+        assert results["sort:GOST"]["rows_per_second"] == 40.0
@@ -0,0 +1,50 @@
+"""
+Тестирование инкрементальной пересборки выходных файлов.
+"""
+from pathlib import Path
+
+import openpyxl
+
+from incremental import IncrementalBuild
+from pipeline import CitationPipeline
+from readers.reader import SourcesReader
+from settings import TEMPLATE_FILE_PATH
+
+
+class TestIncrementalBuild:
+    """
+    Тестирование инкрементальной пересборки выходных файлов.
+    """
+
+    def test_update(self, tmp_path: Path) -> None:
+        """
+        Тестирование совпадения результата с полной пересборкой после изменения входного файла.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файлов во время тестирования
+        """
+
+        path_input = tmp_path / "input.xlsx"
+        path_manifest = tmp_path / "manifest.json"
+
+        workbook = openpyxl.load_workbook(TEMPLATE_FILE_PATH)
+        workbook.save(path_input)
+
+        build = IncrementalBuild(path_manifest, ("GOST", "APA"))
+        with SourcesReader(str(path_input)) as reader:
+            assert build.update(reader) == {"added": 10, "removed": 0, "unchanged": 0}
+        build.save()
+
+        # изменение строки, удаление строки и добавление новой строки
+        sheet = workbook["Книга"]
+        sheet["B2"] = "Искусство как наука"
+        sheet.delete_rows(3)
+        sheet.append(("Яковлев Я.Я.", "Новая книга", None, "М.", "АСТ", 2022, 100))
+        workbook.save(path_input)
+
+        build = IncrementalBuild(path_manifest, ("GOST", "APA"))
+        with SourcesReader(str(path_input)) as reader:
+            assert build.update(reader) == {"added": 2, "removed": 2, "unchanged": 8}
+
+        expected = CitationPipeline(SourcesReader(str(path_input)).read(), ("GOST", "APA")).format()
+        assert tuple(build.rows("GOST")) == expected["GOST"]
+        assert tuple(build.rows("APA")) == expected["APA"]
@@ -0,0 +1,89 @@
+"""
+Тестирование функций для логирования.
+"""
+import logging
+import os
+from pathlib import Path
+
+from logger import SharedFileHandler, create_file_handler, get_handlers, get_logger
+
+
+class TestLogger:
+    """
+    Тестирование функций для логирования.
+    """
+
+    def test_get_logger(self) -> None:
+        """
+        Тестирование повторной настройки логгеров без добавления обработчиков.
+        """
+
+        first = get_logger("tests.logger.first")
+        handlers = list(first.handlers)
+        assert get_logger("tests.logger.first") is first
+        assert first.handlers == handlers
+
+        # обработчики создаются один раз для процесса и используются всеми логгерами
+        second = get_logger("tests.logger.second")
+        assert second.handlers == handlers
+        assert tuple(handlers) == get_handlers()
+
+    def test_rotation(self, tmp_path: Path) -> None:
+        """
+        Тестирование ограничения размера файла логов.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файлов во время тестирования
+        """
+
+        path = tmp_path / "app.log"
+        handler = create_file_handler(str(path), max_bytes=1024, backup_count=2)
+        logger = logging.getLogger("tests.logger.rotation")
+        logger.propagate = False
+        logger.addHandler(handler)
+        # логирование отключено на время тестов
+        logging.disable(logging.NOTSET)
+        try:
+            for index in range(100):
+                logger.warning("Запись %s: %s", index, "x" * 50)
+        finally:
+            logging.disable()
+            logger.removeHandler(handler)
+            handler.close()
+
+        assert sorted(file.name for file in tmp_path.iterdir()) == ["app.log", "app.log.1", "app.log.2"]
+        assert all(file.stat().st_size <= 1024 for file in tmp_path.iterdir())
+
+    def test_shared_file_handler(self, tmp_path: Path) -> None:
+        """
+        Тестирование записи логов дочернего процесса в файл основным процессом.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файлов во время тестирования
+        """
+
+        path = tmp_path / "app.log"
+        handler = SharedFileHandler(str(path), max_bytes=1024, backup_count=10)
+        handler.setFormatter(logging.Formatter("%(process)d %(message)s"))
+        logger = logging.getLogger("tests.logger.shared")
+        logger.propagate = False
+        logger.addHandler(handler)
+        logging.disable(logging.NOTSET)
+        try:
+            pid = os.fork()
+            if not pid:
+                for index in range(50):
+                    logger.warning("Запись %s: %s", index, "x" * 50)
+                # записи, оставшиеся в очереди, передаются до завершения процесса
+                assert handler.sender is not None
+                handler.sender.queue.close()  # type: ignore
+                handler.sender.queue.join_thread()  # type: ignore
+                os._exit(0)  # pylint: disable=protected-access
+            os.waitpid(pid, 0)
+        finally:
+            logging.disable()
+            logger.removeHandler(handler)
+            handler.close()
+
+        # файл переименовывается только основным процессом, поэтому записи не теряются
+        lines = sorted(line for file in tmp_path.iterdir() for line in file.read_text(encoding="utf-8").splitlines())
+        assert lines == sorted(f"{pid} Запись {index}: {'x' * 50}" for index in range(50))
+        assert len(list(tmp_path.iterdir())) > 1
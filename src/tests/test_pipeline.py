@@ -0,0 +1,76 @@
+"""
+Тестирование конвейера оформления списка источников в нескольких стилях цитирования.
+"""
+from pathlib import Path
+
+import pytest
+from docx import Document
+
+from formatters.styles.apa import APACitationFormatter
+from formatters.styles.gost import GOSTCitationFormatter
+from pipeline import CitationPipeline
+from readers.reader import SourcesReader
+from settings import TEMPLATE_FILE_PATH
+
+
+class TestCitationPipeline:
+    """
+    Тестирование конвейера оформления списка источников в нескольких стилях цитирования.
+    """
+
+    @pytest.fixture
+    def models(self) -> list:
+        """
+        Получение моделей из тестовой рабочей книги.
+
+        :return:
+        """
+
+        return SourcesReader(TEMPLATE_FILE_PATH).read()
+
+    def test_format(self, models: list) -> None:
+        """
+        Тестирование совпадения результата с форматированием каждым стилем по отдельности.
+
+        :param list models: Модели источников
+        """
+
+        pipeline = CitationPipeline(iter(models), ("gost", "apa"))
+        result = pipeline.format()
+
+        assert len(pipeline) == len(models)
+        assert result["GOST"] == tuple(str(item) for item in GOSTCitationFormatter(models).format())
+        assert result["APA"] == tuple(str(item) for item in APACitationFormatter(models).format())
+
+    def test_render(self, tmp_path: Path, models: list) -> None:
+        """
+        Тестирование параллельной генерации выходных файлов.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файлов во время тестирования
+        :param list models: Модели источников
+        """
+
+        pipeline = CitationPipeline(models, ("GOST", "APA"))
+        pipeline.render({"GOST": tmp_path / "gost.docx", "APA": tmp_path / "apa.docx"})
+
+        result = pipeline.format()
+        for style, name in (("GOST", "gost.docx"), ("APA", "apa.docx")):
+            paragraphs = [paragraph.text for paragraph in Document(str(tmp_path / name)).paragraphs]
+            assert tuple(paragraphs[1:]) == result[style]
+
+    def test_external_sort(self, tmp_path: Path, models: list) -> None:
+        """
+        Тестирование генерации выходных файлов с внешней сортировкой.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файлов во время тестирования
+        :param list models: Модели источников
+        """
+
+        expected = CitationPipeline(models, ("GOST", "APA")).format()
+
+        pipeline = CitationPipeline(iter(models), ("GOST", "APA"), chunk_size=3)
+        pipeline.render({"GOST": tmp_path / "gost.docx", "APA": tmp_path / "apa.docx"})
+
+        for style, name in (("GOST", "gost.docx"), ("APA", "apa.docx")):
+            paragraphs = [paragraph.text for paragraph in Document(str(tmp_path / name)).paragraphs]
+            assert tuple(paragraphs[1:]) == expected[style]
@@ -0,0 +1,77 @@
+"""
+Тестирование замеров по этапам обработки.
+"""
+import json
+from pathlib import Path
+
+from profiling import Profiler, profiler, stage
+from readers.reader import SourcesReader
+from settings import TEMPLATE_FILE_PATH
+
+
+class TestProfiling:
+    """
+    Тестирование замеров по этапам обработки.
+    """
+
+    def test_stages(self, tmp_path: Path) -> None:
+        """
+        Тестирование вложенных этапов и отчета о замерах.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файлов во время тестирования
+        """
+
+        instance = Profiler()
+        with instance.stage("disabled"):
+            pass
+        assert not instance.stages
+
+        instance.start()
+        try:
+            with instance.stage("outer") as timing:
+                with instance.stage("inner", rows=3):
+                    data = [bytes(1024 * 1024)]
+                del data
+                with instance.stage("second"):
+                    pass
+                timing.rows = 3
+        finally:
+            instance.stop()
+
+        assert [(report.name, report.depth, report.rows) for report in instance.stages] == [
+            ("outer", 0, 3),
+            ("inner", 1, 3),
+            ("second", 1, None),
+        ]
+        outer, inner, second = (report.peak_memory for report in instance.stages)
+        assert outer is not None and inner is not None and second is not None
+        assert inner >= 1024 * 1024
+        assert outer >= inner > second
+        assert instance.stages[0].wall >= instance.stages[1].wall
+
+        path = tmp_path / "profile.json"
+        instance.save(path)
+        assert json.loads(path.read_text(encoding="utf-8"))["stages"][0]["name"] == "outer"
+
+    def test_reader_stages(self) -> None:
+        """
+        Тестирование замеров этапов чтения исходного файла.
+        """
+
+        profiler.start(memory=False)
+        try:
+            with stage("total"), SourcesReader(TEMPLATE_FILE_PATH) as reader:
+                models = reader.read()
+        finally:
+            profiler.stop()
+
+        reports = {report.name: report for report in profiler.stages}
+        assert "load_workbook" in reports
+        assert reports["read:Книга"].rows == reports["validate:Книга"].rows == 4
+        assert sum(report.rows or 0 for name, report in reports.items() if name.startswith("read:")) == len(models)
+        assert sum(report.rows or 0 for name, report in reports.items() if name.startswith("validate:")) == len(models)
+
+        # валидация замеряется внутри однократного прохода по строкам листа (вложенный этап)
+        assert reports["validate:Книга"].depth == reports["read:Книга"].depth + 1
+        assert reports["validate:Книга"].wall <= reports["read:Книга"].wall
+        assert reports["total"].peak_memory is None
@@ -1,11 +1,21 @@
 """
 Тестирование функций генерации выходного файла.
 """
+import zipfile
+from io import BytesIO
 from pathlib import Path
 
 import pytest
 
-from renderer import Renderer
+from renderer import (
+    RENDERERS,
+    BibTeXRenderer,
+    FastRenderer,
+    HTMLRenderer,
+    MarkdownRenderer,
+    PlainTextRenderer,
+    Renderer,
+)
 
 
 class TestRenderer:
@@ -41,3 +51,77 @@ class TestRenderer:
         assert len(list(tmp_path.iterdir())) == 1
         # проверка размера файла в байтах на диске
         assert path.stat().st_size == 36773
+
+    def test_fast_render(self, tmp_path: Path) -> None:
+        """
+        Тестирование совпадения содержимого файла, созданного без объектной модели python-docx.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        """
+
+        rows = ("Строка №1 & <тег>", " Строка с пробелом ", "Строка\tс табуляцией\nи переводом строки", "")
+
+        path_expected, path_output = tmp_path / "expected.docx", tmp_path / "output.docx"
+        Renderer(rows).render(path_expected)
+        FastRenderer(iter(rows)).render(path_output)
+
+        with zipfile.ZipFile(path_expected) as expected, zipfile.ZipFile(path_output) as output:
+            assert [info.filename for info in output.infolist()] == [info.filename for info in expected.infolist()]
+            for info in expected.infolist():
+                assert output.read(info.filename) == expected.read(info)
+
+    def test_fast_render_invalid(self, tmp_path: Path) -> None:
+        """
+        Тестирование ошибки при недопустимых в XML символах.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        """
+
+        with pytest.raises(ValueError):
+            FastRenderer(("Строка\x00",)).render(tmp_path / "output.docx")
+
+        assert not list(tmp_path.iterdir())
+
+    def test_text_renderers(self, tmp_path: Path) -> None:
+        """
+        Тестирование генерации текстовых выходных файлов.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        """
+
+        rows = ["Иванов И.М. Наука & <искусство> // Ведомости_50%", "Петров С.Н. *Наука*"]
+
+        path = tmp_path / "output.txt"
+        PlainTextRenderer(iter(rows)).render(path)
+        assert path.read_text(encoding="utf-8").endswith(f"1. {rows[0]}\n2. {rows[1]}\n")
+
+        stream = BytesIO()
+        HTMLRenderer(rows).render(stream)
+        assert "<li>Иванов И.М. Наука &amp; &lt;искусство&gt; // Ведомости_50%</li>" in stream.getvalue().decode()
+        assert not stream.closed
+
+        stream = BytesIO()
+        MarkdownRenderer(rows).render(stream)
+        assert "2. Петров С.Н. \\*Наука\\*\n" in stream.getvalue().decode()
+
+        stream = BytesIO()
+        BibTeXRenderer(rows).render(stream)
+        assert (
+            stream.getvalue()
+            .decode()
+            .startswith("@misc{ref1,\n  note = {Иванов И.М. Наука \\& <искусство> // Ведомости\\_50\\%}\n}\n")
+        )
+
+        assert RENDERERS["docx"] is FastRenderer
+        assert {renderer.suffix for renderer in RENDERERS.values()} == {".docx", ".txt", ".html", ".md", ".bib"}
+
+    def test_render_stdout(self, capsys: pytest.CaptureFixture) -> None:
+        """
+        Тестирование вывода в стандартный поток вывода.
+
+        :param capsys: Фикстура перехвата стандартного потока вывода
+        """
+
+        MarkdownRenderer(["Строка №1"]).render("-")
+
+        assert capsys.readouterr().out.endswith("1. Строка №1\n")
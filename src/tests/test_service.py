@@ -0,0 +1,168 @@
+"""
+Тестирование сервиса генерации списков источников.
+"""
+import asyncio
+import json
+import zipfile
+from io import BytesIO
+
+from service import BibliographyService, Metrics
+from settings import TEMPLATE_FILE_PATH
+
+
+async def send(port: int, data: bytes, close: bool = False) -> tuple[int, bytes]:
+    """
+    Отправка данных сервису и чтение ответа.
+
+    :param port: Порт сервиса.
+    :param data: Запрос.
+    :param close: Завершение передачи после отправки запроса.
+    :return: Код и тело ответа.
+    """
+
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(data)
+    await writer.drain()
+    if close:
+        writer.write_eof()
+
+    response = await reader.read()
+    writer.close()
+    response_head, _, content = response.partition(b"\r\n\r\n")
+
+    return int(response_head.split(b" ", 2)[1]), content
+
+
+async def request(port: int, method: str, target: str, body: bytes = b"", content_type: str = "") -> tuple[int, bytes]:
+    """
+    Отправка HTTP-запроса сервису.
+
+    :param port: Порт сервиса.
+    :param method: Метод запроса.
+    :param target: Путь запроса.
+    :param body: Тело запроса.
+    :param content_type: Тип содержимого тела запроса.
+    :return: Код и тело ответа.
+    """
+
+    head = f"{method} {target} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(body)}\r\n"
+    if content_type:
+        head += f"Content-Type: {content_type}\r\n"
+
+    return await send(port, (head + "\r\n").encode("latin-1") + body)
+
+
+class TestService:
+    """
+    Тестирование сервиса генерации списков источников.
+    """
+
+    def test_service(self) -> None:
+        """
+        Тестирование генерации выходных файлов из файла Excel и записей JSON, ошибок и метрик.
+        """
+
+        records = [
+            {
+                "type": "book",
+                "authors": "Иванов И.М.",
+                "title": "Наука как искусство",
+                "edition": "3-е",
+                "city": "СПб.",
+                "publishing_house": "Просвещение",
+                "year": 2020,
+                "pages": 999,
+            },
+            {
+                "type": "internet_resource",
+                "article": "Наука как искусство",
+                "website": "Ведомости",
+                "link": "https://www.vedomosti.ru",
+                "access_date": "01.01.2021",
+            },
+        ]
+        with open(TEMPLATE_FILE_PATH, "rb") as file:
+            workbook = file.read()
+
+        async def scenario() -> list[tuple[int, bytes]]:
+            service = BibliographyService(max_workers=1, concurrency=2)
+            server = await service.start("127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            try:
+                responses = list(
+                    await asyncio.gather(
+                        request(port, "POST", "/bibliography?style=apa", workbook),
+                        request(port, "POST", "/bibliography", json.dumps(records).encode(), "application/json"),
+                        request(port, "POST", "/bibliography?style=mla", workbook),
+                        request(port, "POST", "/bibliography", b"[{}]", "application/json"),
+                        request(port, "GET", "/unknown"),
+                    )
+                )
+                responses.append(await request(port, "GET", "/metrics"))
+            finally:
+                await service.close()
+
+            return responses
+
+        xlsx, records_json, style, invalid, unknown, metrics = asyncio.run(scenario())
+
+        assert xlsx[0] == 200
+        with zipfile.ZipFile(BytesIO(xlsx[1])) as document:
+            assert document.read("word/document.xml").count(b"<w:p>") >= 10
+
+        assert records_json[0] == 200
+        with zipfile.ZipFile(BytesIO(records_json[1])) as document:
+            assert "Иванов И.М. Наука как искусство" in document.read("word/document.xml").decode("utf-8")
+
+        assert style[0] == 400
+        assert invalid[0] == 400
+        assert "Неизвестный тип источника" in json.loads(invalid[1])["error"]
+        assert unknown[0] == 404
+
+        assert metrics[0] == 200
+        stats = json.loads(metrics[1])
+        assert stats["requests"] == 5
+        assert stats["statuses"] == {"200": 2, "400": 2, "404": 1}
+        assert stats["latency_ms"]["max"] >= stats["latency_ms"]["p50"] > 0
+
+    def test_invalid_requests(self) -> None:
+        """
+        Тестирование ответов на запросы с некорректным размером, неполным телом и без тела в течение времени ожидания.
+        """
+
+        async def scenario() -> list[tuple[int, bytes]]:
+            service = BibliographyService(max_workers=1, concurrency=1, read_timeout=0.5)
+            server = await service.start("127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            head = "POST /bibliography HTTP/1.1\r\nContent-Type: application/json\r\nContent-Length: {}\r\n\r\n"
+            try:
+                return [
+                    await send(port, head.format(-1).encode("latin-1")),
+                    await send(port, head.format(100).encode("latin-1") + b"[{}]", close=True),
+                    await send(port, head.format(100).encode("latin-1") + b"[{}]"),
+                    await send(port, b"GET /health HTTP/1.1\r\n"),
+                ]
+            finally:
+                await service.close()
+
+        negative, truncated, timeout, head_timeout = asyncio.run(scenario())
+
+        assert negative[0] == 400
+        assert truncated[0] == 400
+        assert "не полностью" in json.loads(truncated[1])["error"]
+        assert timeout[0] == head_timeout[0] == 408
+
+    def test_metrics(self) -> None:
+        """
+        Тестирование статистики времени ответа.
+        """
+
+        metrics = Metrics(window=100)
+        for index in range(200):
+            metrics.observe(200, index / 1000)
+
+        stats = metrics.stats()
+
+        assert stats["requests"] == 200
+        assert stats["latency_ms"]["p50"] == 150
+        assert stats["latency_ms"]["max"] == 199